@@ -1,6 +1,41 @@
+import argparse
+import base64
+import bisect
+import collections
+import csv
+import functools
+import gc
+import gzip
+import heapq
+import io
+import itertools
+import json
+import math
+import operator
+import os
+import re
+import sys
+import threading
+import time
+from array import array
 from flask import Flask, jsonify, make_response, request
 from flask_cors import CORS
-from datetime import datetime
+from datetime import datetime, timezone
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from gunicorn.app.base import BaseApplication
+except ImportError:
+    BaseApplication = None
 
 app = Flask(__name__)
 CORS(app, resources={r"/mock_testrail/*": {"origins": "*"}})
@@ -8,1779 +43,4861 @@ CORS(app, resources={r"/mock_testrail/*": {"origins": "*"}})
 def add_cors_headers(response):
     response.headers['Access-Control-Allow-Origin'] = '*'
     response.headers['Access-Control-Allow-Methods'] = 'GET, POST, OPTIONS'
-    response.headers['Access-Control-Allow-Headers'] = 'Content-Type'
+    response.headers['Access-Control-Allow-Headers'] = 'Content-Type, If-None-Match, If-Modified-Since'
+    response.headers['Access-Control-Expose-Headers'] = 'ETag'
     return response
 
-@app.route('/mock_testrail/testcases', methods=['GET', 'OPTIONS'])
+# ETags carry the boot time to keep a restarted server from matching tags
+# issued by the previous one.
+BOOT_ID = format(int(time.time()), 'x')
+
+# One clock for every collection, so a single version number tells a client
+# which collections changed after it last synced. It starts from the boot
+# time in microseconds: a version handed out before a restart is always
+# below BOOT_VERSION, and one above the last version issued was never
+# issued by this process, so either kind of stale ``since`` can be detected.
+BOOT_VERSION = time.time_ns() // 1000
+
+class VersionClock:
+    """Increasing version numbers, remembering the last one handed out."""
+
+    def __init__(self, start):
+        self.issued = start - 1
+        self.lock = threading.Lock()
+
+    def next(self):
+        with self.lock:
+            self.issued += 1
+            return self.issued
+
+VERSION_CLOCK = VersionClock(BOOT_VERSION)
+
+MAX_PAGE_SIZE = 1000
+MAX_CACHED_BUNDLES = 64
+MAX_CACHED_DETAILS = 4096
+MAX_PREFIX_TERMS = 64
+MAX_FEED_EVENTS = 1024
+MAX_CHANGELOG = 100000
+# Turned off by ``serve`` when it forks several workers; see there.
+UPLOADS_ENABLED = True
+FEED_HEARTBEAT = 15
+# Open change feed streams allowed at once; ``serve`` sets it below the
+# worker's thread count. None (the threaded dev server) means no limit.
+MAX_SUBSCRIBERS = None
+STREAM_CHUNK = 500
+STREAM_FORMATS = {'ndjson': 'application/x-ndjson', 'stream': 'application/json'}
+# Rows parsed and indexed per step of a streamed upload. With every index
+# maintained per row, ingest runs at roughly 25k rows/s on one core; larger
+# batches (up to the whole file) gain only about 20%.
+UPLOAD_BATCH = 5000
+UPLOAD_READ_CHUNK = 64 * 1024
+MAX_REPORTED_ERRORS = 100
+NESTED_TYPES = (list, dict)
+UPLOAD_FORMATS = {
+    'text/csv': 'csv',
+    'application/csv': 'csv',
+    'application/json': 'json',
+    'application/x-ndjson': 'ndjson',
+    'application/jsonl': 'ndjson',
+}
+
+def utcnow():
+    return datetime.now(timezone.utc).replace(microsecond=0)
+
+class SortedIndex:
+    """``(sort_key, primary_key)`` pairs kept in order for keyset paging.
+
+    The primary key breaks ties, so the order is total and a cursor is just
+    the last pair a client saw. Writes land in a pending list, and batch
+    removals in a set, that are merged in with one filter and one sort the
+    next time the index is read, so a bulk upload of many batches pays for
+    a single pass instead of one per batch (or one per replaced row).
+    """
+
+    def __init__(self, sort_key):
+        self.sort_key = sort_key
+        self._entries = []
+        self._pending = []
+        self._doomed = set()
+        self._lock = threading.Lock()
+
+    @property
+    def entries(self):
+        if self._pending or self._doomed:
+            with self._lock:
+                if self._pending or self._doomed:
+                    # Build a copy and swap it in; sorting in place would
+                    # briefly leave other readers looking at an empty list.
+                    entries, pending = self._entries, self._pending
+                    if self._doomed:
+                        doomed = self._doomed
+                        entries = [entry for entry in entries if entry not in doomed]
+                        pending = [entry for entry in pending if entry not in doomed]
+                    self._entries = self._merge(entries, pending) if pending else entries
+                    self._pending = []
+                    self._doomed = set()
+        return self._entries
+
+    # Sort key for entries that are not already ordered tuples.
+    _order = None
+
+    def _merge(self, entries, pending):
+        merged = entries + pending
+        merged.sort()
+        return merged
+
+    def _add(self, entries):
+        with self._lock:
+            if self._doomed:
+                # Re-adding an entry that is waiting to be removed (a row
+                # replaced without changing its sort key) just cancels it.
+                doomed = self._doomed
+                kept = [entry for entry in entries if entry not in doomed]
+                if len(kept) < len(entries):
+                    doomed.difference_update(entries)
+                entries = kept
+            self._pending.extend(entries)
+
+    def add_many(self, items):
+        sort_key = self.sort_key
+        self._add([(sort_key(key), key) for key, _ in items])
+
+    def _entry(self, key, record):
+        return (self.sort_key(key), key)
+
+    def remove(self, key, record):
+        entry = self._entry(key, record)
+        entries = self.entries
+        position = bisect.bisect_left(entries, entry)
+        if position < len(entries) and entries[position] == entry:
+            del entries[position]
+
+    def remove_many(self, items):
+        # Each single remove shifts the whole list; a batch of replaced rows
+        # is filtered out in one pass on the next read instead.
+        entries = [self._entry(key, record) for key, record in items]
+        with self._lock:
+            self._doomed.update(entries)
+
+    def between(self, start=None, end=None):
+        low = 0 if start is None else bisect.bisect_left(self.entries, (start,))
+        high = len(self.entries) if end is None else bisect.bisect_left(self.entries, (end + 1,))
+        return self.entries[low:high]
+
+class PrefixIndex(SortedIndex):
+    """``(normalised value, primary key)`` pairs in order, for exact and prefix lookups.
+
+    Same pending-merge behaviour as ``SortedIndex``; the sort key just
+    comes from the record instead of the primary key.
+    """
+
+    def __init__(self, value_of):
+        super().__init__(None)
+        self.value_of = value_of
+
+    def add_many(self, items):
+        value_of = self.value_of
+        self._add([(normalize_term(value_of(record)), key) for key, record in items])
+
+    def _entry(self, key, record):
+        return (normalize_term(self.value_of(record)), key)
+
+    def span(self, term, prefix=True):
+        """``(low, high)`` positions of entries equal to, or starting with, ``term``."""
+        entries = self.entries
+        term = normalize_term(term)
+        low = bisect.bisect_left(entries, (term,), key=self._order)
+        if prefix:
+            high = bisect.bisect_left(entries, (term[:-1] + chr(ord(term[-1]) + 1),), key=self._order) \
+                if term else len(entries)
+        else:
+            high = bisect.bisect_left(entries, (term + '\0',), key=self._order)
+        return entries, low, high
+
+    def search(self, term, prefix, limit):
+        """``(total, first keys)`` of records whose value equals, or starts with, ``term``."""
+        entries, low, high = self.span(term, prefix)
+        return high - low, [entry[1] for entry in entries[low:min(high, low + limit)]]
+
+class KeyIndex(PrefixIndex):
+    """Primary keys in normalised order, for exact and prefix lookups by ID.
+
+    Holds the key strings the rows already hold rather than a tuple per
+    row, and a replaced row keeps its key, so uploads that overwrite
+    existing IDs leave the order untouched.
+    """
+
+    def __init__(self):
+        super().__init__(None)
+
+    @staticmethod
+    def _order(key):
+        return (normalize_term(key), key)
+
+    def _merge(self, entries, pending):
+        # The order key is a Python call per entry, so a small batch is
+        # spliced in by bisection rather than re-keying every stored key.
+        order = self._order
+        if len(pending) * 32 >= len(entries):
+            # Two stable sorts give the (normalised, key) order without
+            # building a tuple per key.
+            merged = entries + pending
+            merged.sort()
+            merged.sort(key=normalize_term)
+            return merged
+        pending.sort(key=order)
+        merged, start = [], 0
+        for key in pending:
+            position = bisect.bisect_right(entries, order(key), lo=start, key=order)
+            merged.extend(entries[start:position])
+            merged.append(key)
+            start = position
+        merged.extend(entries[start:])
+        return merged
+
+    def add_many(self, items):
+        self._add([key for key, _ in items])
+
+    def _entry(self, key, record):
+        return key
+
+    def remove(self, key, record):
+        entries = self.entries
+        position = bisect.bisect_left(entries, self._order(key), key=self._order)
+        if position < len(entries) and entries[position] == key:
+            del entries[position]
+
+    def search(self, term, prefix, limit):
+        entries, low, high = self.span(term, prefix)
+        return high - low, entries[low:min(high, low + limit)]
+
+class HashIndex:
+    """Normalised field value -> set of primary keys, for equality filters."""
+
+    def __init__(self, value_of):
+        self.value_of = value_of
+        self.buckets = {}
+
+    def _grouped(self, items):
+        # A batch holds few distinct values, so normalise each once and
+        # move its keys with one set operation.
+        grouped = collections.defaultdict(list)
+        value_of = self.value_of
+        for key, record in items:
+            grouped[value_of(record)].append(key)
+        return grouped
+
+    def add_many(self, items):
+        buckets = self.buckets
+        for value, keys in self._grouped(items).items():
+            value = normalize_term(value)
+            bucket = buckets.get(value)
+            if bucket is None:
+                bucket = buckets[value] = set()
+            bucket.update(keys)
+
+    def remove(self, key, record):
+        self.remove_many([(key, record)])
+
+    def remove_many(self, items):
+        buckets = self.buckets
+        for value, keys in self._grouped(items).items():
+            value = normalize_term(value)
+            bucket = buckets.get(value)
+            if bucket is not None:
+                bucket.difference_update(keys)
+                if not bucket:
+                    del buckets[value]
+
+    def lookup(self, value):
+        return self.buckets.get(normalize_term(value), frozenset())
+
+    def search(self, term, prefix, limit):
+        """``(total, first keys)`` of records whose value equals, or starts with, ``term``.
+
+        Walks the distinct values rather than the records, so it needs no
+        sorted copy of the rows. Call with the collection's lock held.
+        """
+        term = normalize_term(term)
+        if prefix:
+            values = sorted(value for value in self.buckets if value.startswith(term))
+        else:
+            values = [term] if term in self.buckets else []
+        total, keys = 0, []
+        for value in values:
+            bucket = self.buckets[value]
+            total += len(bucket)
+            if len(keys) < limit:
+                keys.extend(heapq.nsmallest(limit - len(keys), bucket))
+        return total, keys
+
+class CountIndex:
+    """Running count of records per field value, kept exact on every write."""
+
+    def __init__(self, value_of):
+        self.value_of = value_of
+        self.counts = collections.Counter()
+
+    def add_many(self, items):
+        self.counts.update(self.value_of(record) for _, record in items)
+
+    def remove(self, key, record):
+        self.remove_many([(key, record)])
+
+    def remove_many(self, items):
+        counts = self.counts
+        for value, count in collections.Counter(self.value_of(record) for _, record in items).items():
+            counts[value] -= count
+            if counts[value] <= 0:
+                del counts[value]
+
+# Marks a field the record did not have at all, as opposed to an explicit
+# null, and an integer slot with no value.
+ABSENT = object()
+MISSING_INT = -2 ** 63
+
+class DictionaryColumn:
+    """Categorical column: each distinct value is stored once, rows hold codes."""
+
+    def __init__(self):
+        self.values = []
+        self.codes = {}
+        self.data = array('I')
+        self.derived = {}
+
+    def encode(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def derive(self, name, convert):
+        """A column of ``convert(value)`` with one entry per code of this one.
+
+        Codes are never reused, so the derived column only converts values
+        that appeared since it was last asked for; translating rows is then
+        an array lookup. Call it under the owner's write lock.
+        """
+        column = self.derived.get(name)
+        if column is None:
+            column = self.derived[name] = DictionaryColumn()
+        for value in self.values[len(column.data):]:
+            column.data.append(column.encode(convert(value)))
+        return column
+
+class TimestampColumn:
+    """Mapping view of one epoch column of a ColumnarRows, by primary key."""
+
+    def __init__(self, rows, data):
+        self.rows = rows
+        self.data = data
+
+    def __getitem__(self, key):
+        value = self.data[self.rows.positions[key]]
+        if value == MISSING_INT:
+            raise KeyError(key)
+        return value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key, value):
+        self.data[self.rows.positions[key]] = value
+
+    def pop(self, key, default=None):
+        position = self.rows.positions.get(key)
+        if position is None or self.data[position] == MISSING_INT:
+            return default
+        value = self.data[position]
+        self.data[position] = MISSING_INT
+        return value
+
+    def __len__(self):
+        return sum(1 for key in self.rows if self.data[self.rows.positions[key]] != MISSING_INT)
+
+class ColumnarRows:
+    """Array-backed stand-in for the ``rows`` dict of a large collection.
+
+    Repetitive text fields are dictionary-encoded into ``array('I')`` codes
+    and whole-number fields live in ``array('q')``, so a row costs a few
+    machine words instead of a dict of Python objects. Anything outside the
+    declared columns (or a non-integer in an integer column) is kept per row
+    in ``extras`` so nothing is lost. Rows are only rebuilt as dicts when
+    something reads them. Deleted rows leave a tombstone (``alive`` is 0)
+    rather than shifting every column.
+    """
+
+    def __init__(self, key_field, categorical=(), integers=(), timestamps=()):
+        self.key_field = key_field
+        self.keys = []
+        self.positions = {}
+        self.alive = bytearray()
+        self.categorical = {name: DictionaryColumn() for name in categorical}
+        self.integers = {name: array('q') for name in integers}
+        self.epochs = {name: array('q') for name in timestamps}
+        self.extras = {}
+        self._known = {key_field, *self.categorical, *self.integers}
+
+    def timestamp_column(self, name):
+        return TimestampColumn(self, self.epochs[name])
+
+    def __setitem__(self, key, record):
+        position = self.positions.get(key)
+        if position is None:
+            self._append([(key, record)])
+            return
+        extra = self._extra(record)
+        for name, column in self.categorical.items():
+            column.data[position] = column.encode(record.get(name, ABSENT))
+        for name, column in self.integers.items():
+            column[position] = self._integer(name, record, extra)
+        if extra:
+            self.extras[position] = extra
+        else:
+            self.extras.pop(position, None)
+
+    def _append(self, items):
+        # Column-at-a-time so each array grows with one extend per batch.
+        start = len(self.keys)
+        extras = [self._extra(record) for _, record in items]
+        for name, column in self.categorical.items():
+            codes = column.codes
+            data = []
+            for _, record in items:
+                value = record.get(name, ABSENT)
+                code = codes.get(value)
+                data.append(column.encode(value) if code is None else code)
+            column.data.extend(data)
+        for name, column in self.integers.items():
+            column.extend([self._integer(name, record, extra) for (_, record), extra in zip(items, extras)])
+        for column in self.epochs.values():
+            column.extend([MISSING_INT] * len(items))
+        self.alive.extend(b'\x01' * len(items))
+        for offset, ((key, _), extra) in enumerate(zip(items, extras)):
+            if extra:
+                self.extras[start + offset] = extra
+            self.positions[key] = start + offset
+        self.keys.extend(key for key, _ in items)
+
+    def _extra(self, record):
+        names = record.keys() - self._known
+        return {name: record[name] for name in names} if names else {}
+
+    @staticmethod
+    def _integer(name, record, extra):
+        value = record.get(name, ABSENT)
+        if value.__class__ is int and -2 ** 63 < value < 2 ** 63:
+            return value
+        if value is not ABSENT:
+            extra[name] = value
+        return MISSING_INT
+
+    def _row(self, position, key):
+        record = {self.key_field: key}
+        for name, column in self.categorical.items():
+            value = column.values[column.data[position]]
+            if value is not ABSENT:
+                record[name] = value
+        for name, column in self.integers.items():
+            value = column[position]
+            if value != MISSING_INT:
+                record[name] = value
+        extra = self.extras.get(position)
+        if extra:
+            record.update(extra)
+        return record
+
+    def __getitem__(self, key):
+        return self._row(self.positions[key], key)
+
+    def get(self, key, default=None):
+        position = self.positions.get(key)
+        return default if position is None else self._row(position, key)
+
+    def __delitem__(self, key):
+        position = self.positions.pop(key)
+        self.keys[position] = None
+        self.alive[position] = 0
+        self.extras.pop(position, None)
+
+    def pop(self, key, default=None):
+        record = self.get(key)
+        if record is None:
+            return default
+        del self[key]
+        return record
+
+    def update(self, records):
+        new = []
+        for key, record in records.items():
+            if key in self.positions:
+                self[key] = record
+            else:
+                new.append((key, record))
+        if new:
+            self._append(new)
+
+    def values(self):
+        for position, key in enumerate(self.keys):
+            if key is not None:
+                yield self._row(position, key)
+
+    def items(self):
+        for position, key in enumerate(self.keys):
+            if key is not None:
+                yield key, self._row(position, key)
+
+    def __iter__(self):
+        return (key for key in self.keys if key is not None)
+
+    def __len__(self):
+        return len(self.positions)
+
+    def __contains__(self, key):
+        return key in self.positions
+
+class RunHistoryIndex:
+    """Chronological Pass/Fail history per test case, with flip counts.
+
+    Each history is a sorted list of ``(timestamp, run key, passed)`` and
+    ``flips`` counts adjacent Pass<->Fail changes in it. Runs that arrive in
+    time order only extend the tail; anything else is placed by bisection
+    and only the flips around it are re-counted, so nothing is ever replayed
+    from the start.
+    """
+
+    def __init__(self, group_of, sort_key, outcome_of):
+        self.group_of = group_of
+        self.sort_key = sort_key
+        self.outcome_of = outcome_of
+        self.histories = {}
+        self.flips = collections.Counter()
+        # Normalised test case ID -> the groups spelled that way, for latest().
+        self.aliases = {}
+
+    def _entry(self, key, record):
+        passed = self.outcome_of(record)
+        return None if passed is None else (self.sort_key(key), key, passed)
+
+    @staticmethod
+    def _flips_added(before, middle, after):
+        # Flips gained by placing ``middle`` between two neighbours (None at
+        # either end of the history).
+        lost = before is not None and after is not None and before != after
+        gained = (before is not None and before != middle) + (after is not None and after != middle)
+        return gained - lost
+
+    def add_many(self, items):
+        grouped = collections.defaultdict(list)
+        for key, record in items:
+            entry = self._entry(key, record)
+            if entry is not None:
+                grouped[self.group_of(record)].append(entry)
+        for group, entries in grouped.items():
+            entries.sort()
+            history = self.histories.get(group)
+            if history is None:
+                history = self.histories[group] = []
+                self.aliases.setdefault(normalize_term(group), set()).add(group)
+            if not history or entries[0] > history[-1]:
+                previous = history[-1][2] if history else None
+                flips = 0
+                for entry in entries:
+                    flips += previous is not None and entry[2] != previous
+                    previous = entry[2]
+                history.extend(entries)
+                self.flips[group] += flips
+                continue
+            if len(entries) * 16 >= len(history):
+                # Too many to place one by one (each insert shifts the
+                # list): merge with one sort and recount.
+                self._replace(group, sorted(history + entries))
+                continue
+            for entry in entries:
+                position = bisect.bisect_left(history, entry)
+                before = history[position - 1][2] if position else None
+                after = history[position][2] if position < len(history) else None
+                self.flips[group] += self._flips_added(before, entry[2], after)
+                history.insert(position, entry)
+
+    def _replace(self, group, history):
+        passed = operator.itemgetter(2)
+        self.histories[group] = history
+        self.flips[group] = sum(map(operator.ne, map(passed, history), map(passed, history[1:])))
+
+    def remove(self, key, record):
+        entry = self._entry(key, record)
+        if entry is not None:
+            self._remove(self.group_of(record), entry)
+
+    def remove_many(self, items):
+        grouped = collections.defaultdict(set)
+        for key, record in items:
+            entry = self._entry(key, record)
+            if entry is not None:
+                grouped[self.group_of(record)].add(entry)
+        for group, entries in grouped.items():
+            history = self.histories.get(group)
+            if history and len(entries) * 16 >= len(history):
+                kept = [entry for entry in history if entry not in entries]
+                if kept:
+                    self._replace(group, kept)
+                else:
+                    self._drop(group)
+                continue
+            for entry in entries:
+                self._remove(group, entry)
+
+    def _remove(self, group, entry):
+        history = self.histories.get(group)
+        if not history:
+            return
+        position = bisect.bisect_left(history, entry)
+        if position == len(history) or history[position] != entry:
+            return
+        before = history[position - 1][2] if position else None
+        after = history[position + 1][2] if position + 1 < len(history) else None
+        self.flips[group] -= self._flips_added(before, entry[2], after)
+        del history[position]
+        if not history:
+            self._drop(group)
+
+    def _drop(self, group):
+        del self.histories[group]
+        del self.flips[group]
+        alias = normalize_term(group)
+        self.aliases[alias].discard(group)
+        if not self.aliases[alias]:
+            del self.aliases[alias]
+
+    def latest(self, test_case_id):
+        """The newest ``(timestamp, run key, passed)`` of a test case, or None.
+
+        ``test_case_id`` is matched normalised, like the filters. Reads only
+        the tail of each history, and copies before looking, since callers
+        outside the test run collection's lock may race its writes.
+        """
+        groups = self.aliases.get(normalize_term(test_case_id))
+        if not groups:
+            return None
+        tails = [history[-1:] for history in map(self.histories.get, list(groups)) if history is not None]
+        return max((tail[0] for tail in tails if tail), default=None)
+
+class FixTimeIndex:
+    """Defect time-to-fix and open-defect age aggregates.
+
+    Fixed defects contribute ``fixed_at - created_at`` to a running count
+    and sum per (dimension, value), which is what MTTR reads, plus a
+    Counter of durations for percentiles. Open defects are counted per
+    severity by ``created_at``. Every write is a few O(1) counter updates;
+    percentiles and aging buckets are worked out at read time from the
+    distinct values, which are far fewer than the defects.
+    """
+
+    def __init__(self, created_of, fixed_of, is_fixed, dimensions):
+        self.created_of = created_of
+        self.fixed_of = fixed_of
+        self.is_fixed = is_fixed
+        self.dimensions = dimensions
+        self.totals = collections.defaultdict(lambda: [0, 0])
+        self.durations = collections.defaultdict(collections.Counter)
+        self.open_since = collections.defaultdict(collections.Counter)
+
+    def _groups(self, record):
+        yield 'overall', 'ALL'
+        for dimension, value_of in self.dimensions.items():
+            yield dimension, value_of(record) or 'Unknown'
+
+    def _classify(self, key, record):
+        created = self.created_of(key)
+        if created is None:
+            return None, None
+        if self.is_fixed(record):
+            fixed = self.fixed_of(key)
+            return ('fixed', fixed - created) if fixed is not None and fixed >= created else (None, None)
+        return 'open', created
+
+    def _apply(self, key, record, sign):
+        state, value = self._classify(key, record)
+        if state == 'fixed':
+            for group in self._groups(record):
+                totals = self.totals[group]
+                totals[0] += sign
+                totals[1] += sign * value
+                counter_add(self.durations, group, value, sign)
+                if not totals[0]:
+                    del self.totals[group]
+        elif state == 'open':
+            for severity in ('ALL', record.get('Severity') or 'Unknown'):
+                counter_add(self.open_since, severity, value, sign)
+
+    def add_many(self, items):
+        for key, record in items:
+            self._apply(key, record, 1)
+
+    def remove(self, key, record):
+        self._apply(key, record, -1)
+
+class CoverageMatrix:
+    """Requirement coverage counts per (component, priority) cell.
+
+    A requirement is covered when at least one of its test cases passed its
+    latest Pass/Fail run (runs without a verdict are skipped). The matrix is fed by three collections through
+    ``feed()`` and keeps, per requirement, how many of its test cases pass;
+    a write only revisits the requirements it touches and moves a cell
+    count when one crosses zero, so reading the matrix never walks the
+    requirements.
+    """
+
+    def __init__(self, cell_of, requirement_of, latest_of, passed):
+        self.cell_of = cell_of
+        self.requirement_of = requirement_of
+        self.latest_of = latest_of
+        self.passed = passed
+        self.cells = collections.defaultdict(lambda: [0, 0])
+        self.requirement_cells = {}
+        self.passing = collections.Counter()
+        self.case_requirements = {}
+        self.passing_cases = set()
+        self.lock = threading.Lock()
+
+    def feed(self, kind):
+        return CoverageFeed(self, kind)
+
+    def _covered(self, requirement):
+        return self.passing[requirement] > 0
+
+    def _move(self, requirement, change):
+        before = self._covered(requirement)
+        self.passing[requirement] += change
+        if not self.passing[requirement]:
+            del self.passing[requirement]
+        cell = self.requirement_cells.get(requirement)
+        if cell is not None:
+            self.cells[cell][1] += self._covered(requirement) - before
+
+    def set_requirement(self, requirement, cell):
+        old = self.requirement_cells.pop(requirement, None)
+        if old is not None:
+            counts = self.cells[old]
+            counts[0] -= 1
+            counts[1] -= self._covered(requirement)
+            if not counts[0]:
+                del self.cells[old]
+        if cell is not None:
+            self.requirement_cells[requirement] = cell
+            counts = self.cells[cell]
+            counts[0] += 1
+            counts[1] += self._covered(requirement)
+
+    def set_case(self, case, requirement, passing):
+        old = self.case_requirements.pop(case, None)
+        if old is not None and case in self.passing_cases:
+            self._move(old, -1)
+        self.passing_cases.discard(case)
+        if requirement is not None:
+            self.case_requirements[case] = requirement
+            if passing:
+                self.passing_cases.add(case)
+                self._move(requirement, 1)
+
+    def refresh_case(self, case):
+        # A run changed: only this test case's latest result, and so at
+        # most one requirement's cell, can move.
+        if case in self.case_requirements:
+            latest = self.latest_of(case)
+            self.set_case(case, self.case_requirements[case], latest is not None and self.passed(latest))
+
+class CoverageFeed:
+    """Index adapter that forwards one collection's writes to a CoverageMatrix."""
+
+    def __init__(self, matrix, kind):
+        self.matrix = matrix
+        self.kind = kind
+
+    def _apply(self, key, record, present):
+        matrix = self.matrix
+        if self.kind == 'requirements':
+            matrix.set_requirement(normalize_term(key), matrix.cell_of(record) if present else None)
+        elif self.kind == 'testcases':
+            case = normalize_term(key)
+            requirement = matrix.requirement_of(record)
+            if not present or requirement in (None, ''):
+                matrix.set_case(case, None, False)
+            else:
+                latest = matrix.latest_of(case)
+                matrix.set_case(case, normalize_term(requirement), latest is not None and matrix.passed(latest))
+        else:
+            matrix.refresh_case(normalize_term(record.get('test_case_id')))
+
+    def add_many(self, items):
+        with self.matrix.lock:
+            if self.kind == 'testruns':
+                # One refresh per test case, however many of its runs arrive.
+                for case in {normalize_term(record.get('test_case_id')) for _, record in items}:
+                    self.matrix.refresh_case(case)
+                return
+            for key, record in items:
+                self._apply(key, record, True)
+
+    def remove(self, key, record):
+        with self.matrix.lock:
+            self._apply(key, record, False)
+
+    def remove_many(self, items):
+        if self.kind != 'testruns':
+            for key, record in items:
+                self.remove(key, record)
+            return
+        with self.matrix.lock:
+            for case in {normalize_term(record.get('test_case_id')) for _, record in items}:
+                self.matrix.refresh_case(case)
+
+class ThresholdIndex:
+    """Parsed Actual/Expected measurements of testtypesummary, column-wise.
+
+    Each row is parsed once on write (see ``parse_measure``) into float
+    arrays for the normalised actual and expected values plus a comparator
+    code, so evaluating every threshold is a handful of NumPy comparisons.
+    Comparator ``-1`` marks rows that cannot be judged: a value that does
+    not parse, or units that do not normalise to the same base unit.
+    Removed rows are tombstoned in ``alive`` like ``ColumnarRows``.
+    """
+
+    def __init__(self, sort_key):
+        self.sort_key = sort_key
+        self.keys = []
+        self.positions = {}
+        self.alive = bytearray()
+        self.actual = array('d')
+        self.expected = array('d')
+        self.comparators = array('b')
+        self.reported = array('b')
+        self.dates = array('q')
+        self.units = DictionaryColumn()
+        self.test_types = DictionaryColumn()
+
+    def add_many(self, items):
+        for key, record in items:
+            actual_comparator, actual, actual_unit = parse_measure(record.get('Actual'))
+            comparator, expected, unit = parse_measure(record.get('Expected'))
+            if actual_comparator is not None or actual is None or expected is None or actual_unit != unit:
+                comparator = None
+            self.positions[key] = len(self.keys)
+            self.keys.append(key)
+            self.alive.append(1)
+            self.actual.append(actual if actual is not None else math.nan)
+            self.expected.append(expected if expected is not None else math.nan)
+            self.comparators.append(COMPARATORS.index(comparator) if comparator is not None else -1)
+            self.reported.append({'pass': 1, 'fail': 0}.get(str(record.get('Status', '')).strip().lower(), -1))
+            self.dates.append(self.sort_key(key))
+            self.units.data.append(self.units.encode(unit))
+            self.test_types.data.append(self.test_types.encode(record.get('Test_Type')))
+
+    def remove(self, key, record):
+        position = self.positions.pop(key, None)
+        if position is not None:
+            self.keys[position] = None
+            self.alive[position] = 0
+
+class FleetIndex:
+    """Per (robot, day) run aggregates: count, busy time, failures, fail remarks.
+
+    Each run adds to or subtracts from its own cell, so the fleet view is
+    rolled up from cells (robots x days) rather than from the runs.
+    """
+
+    def __init__(self, robot_of, epoch_of, busy_of, outcome_of, remark_of):
+        self.robot_of = robot_of
+        self.epoch_of = epoch_of
+        self.busy_of = busy_of
+        self.outcome_of = outcome_of
+        self.remark_of = remark_of
+        self.cells = {}
+
+    def _apply(self, items, sign):
+        # Tally the batch per (cell, outcome, remark) first, so each cell
+        # and remark counter is touched once per batch rather than per run.
+        tallies = {}
+        for key, record in items:
+            epoch = self.epoch_of(key)
+            if epoch is None:
+                continue
+            passed = self.outcome_of(record)
+            group = (self.robot_of(record), epoch - epoch % 86400, passed,
+                     self.remark_of(record) if passed is False else None)
+            busy = self.busy_of(record)
+            tally = tallies.get(group)
+            if tally is None:
+                tally = tallies[group] = [0, 0]
+            tally[0] += 1
+            tally[1] += busy if isinstance(busy, int) else 0
+        for (robot, day, passed, remark), (count, busy) in tallies.items():
+            cell_key = (robot, day)
+            cell = self.cells.get(cell_key)
+            if cell is None:
+                cell = self.cells[cell_key] = [0, 0, 0, 0, collections.Counter()]
+            cell[0] += sign * count
+            cell[1] += sign * busy
+            cell[2] += sign * count * (passed is not None)
+            if passed is False:
+                cell[3] += sign * count
+                cell[4][remark] += sign * count
+                if cell[4][remark] <= 0:
+                    del cell[4][remark]
+            if not cell[0]:
+                del self.cells[cell_key]
+
+    def add_many(self, items):
+        self._apply(items, 1)
+
+    def remove(self, key, record):
+        self._apply([(key, record)], -1)
+
+    def remove_many(self, items):
+        self._apply(items, -1)
+
+class BodyCache:
+    """Bounded LRU of serialised per-record bodies.
+
+    Attached to a collection as an index so a write or delete evicts just
+    the records it touched; everything else stays cached. Bodies are built
+    outside the lock, so every eviction bumps ``generation`` and a body is
+    only kept if no eviction happened since its record was read.
+    """
+
+    def __init__(self, build, maxsize):
+        self.build = build
+        self.maxsize = maxsize
+        self.bodies = collections.OrderedDict()
+        self.generation = 0
+        self.lock = threading.Lock()
+
+    def get(self, key, record_of):
+        """The body for ``key``, building it from ``record_of(key)`` on a miss.
+
+        Returns None if there is no such record.
+        """
+        with self.lock:
+            body = self.bodies.get(key)
+            if body is not None:
+                self.bodies.move_to_end(key)
+                return body
+            generation = self.generation
+        record = record_of(key)
+        if record is None:
+            return None
+        body = self.build(record)
+        with self.lock:
+            # A write may have replaced or deleted the record after it was
+            # read; serve what was read, but don't cache it.
+            if self.generation == generation and record_of(key) is not None:
+                self.bodies[key] = body
+                if len(self.bodies) > self.maxsize:
+                    self.bodies.popitem(last=False)
+        return body
+
+    def add_many(self, items):
+        with self.lock:
+            self.generation += 1
+            for key, _ in items:
+                self.bodies.pop(key, None)
+
+    def remove(self, key, record):
+        with self.lock:
+            self.generation += 1
+            self.bodies.pop(key, None)
+
+class TextIndex:
+    """Inverted index over free-text fields: term -> {primary key: weight}.
+
+    ``fields`` maps each indexed field to its weight, so a hit in a title
+    counts for more than one in a description. The vocabulary is kept
+    sorted for prefix expansion; new terms wait in a pending set and are
+    merged in on the next search, the same way ``SortedIndex`` batches
+    writes.
+    """
+
+    def __init__(self, fields):
+        self.fields = fields
+        self.postings = {}
+        self._vocabulary = []
+        self._pending = set()
+
+    def _grouped(self, items):
+        # Keys by the tuple of their indexed values: a batch repeats the
+        # same few texts, so each is weighed once per batch, not per row.
+        grouped = collections.defaultdict(list)
+        names = tuple(self.fields)
+        if len(names) == 1:
+            name, = names
+            for key, record in items:
+                grouped[(record.get(name),)].append(key)
+        else:
+            for key, record in items:
+                grouped[tuple(map(record.get, names))].append(key)
+        fields = tuple(self.fields.items())
+        return [(term_weights(fields, values), keys) for values, keys in grouped.items()]
+
+    def add_many(self, items):
+        for weights, keys in self._grouped(items):
+            for term, weight in weights.items():
+                posting = self.postings.get(term)
+                if posting is None:
+                    posting = self.postings[term] = {}
+                    self._pending.add(term)
+                posting.update(dict.fromkeys(keys, weight))
+
+    def remove(self, key, record):
+        self.remove_many([(key, record)])
+
+    def remove_many(self, items):
+        for weights, keys in self._grouped(items):
+            for term in weights:
+                posting = self.postings.get(term)
+                if posting is not None:
+                    for key in keys:
+                        posting.pop(key, None)
+                    if not posting:
+                        # Left in the vocabulary; dropped at the next merge.
+                        del self.postings[term]
+
+    @property
+    def vocabulary(self):
+        if self._pending:
+            self._vocabulary = sorted(term for term in set(self._vocabulary) | self._pending
+                                      if term in self.postings)
+            self._pending = set()
+        return self._vocabulary
+
+    def expand(self, token):
+        """``(terms, truncated)``: terms starting with ``token``, the exact term first.
+
+        Past ``MAX_PREFIX_TERMS`` completions only those in the most records
+        are kept, so a short prefix drops its rarest matches rather than
+        whichever sort last, and ``truncated`` says that some were dropped.
+        """
+        vocabulary = self.vocabulary
+        postings = self.postings
+        low = bisect.bisect_left(vocabulary, token)
+        high = bisect.bisect_left(vocabulary, token[:-1] + chr(ord(token[-1]) + 1))
+        terms = [term for term in vocabulary[low:high] if term in postings]
+        if len(terms) <= MAX_PREFIX_TERMS:
+            return terms, False
+        exact = [token] if token in postings else []
+        completions = heapq.nlargest(MAX_PREFIX_TERMS - len(exact), (term for term in terms if term != token),
+                                     key=lambda term: (len(postings[term]), term))
+        return exact + completions, True
+
+    def search(self, tokens, documents):
+        """``({key: score}, truncated tokens)`` for records matching every token (as a prefix).
+
+        Each term scores ``weight * idf``; a term that only extends the
+        query token scores half, so exact words rank above completions.
+        Tokens with too many completions to search them all are listed in
+        the second item; the scores then cover the commonest completions.
+        """
+        scores = None
+        truncated = []
+        for token in tokens:
+            matched = collections.defaultdict(float)
+            terms, capped = self.expand(token)
+            if capped:
+                truncated.append(token)
+            for term in terms:
+                posting = self.postings[term]
+                idf = math.log(1 + documents / len(posting)) * (1.0 if term == token else 0.5)
+                for key, weight in posting.items():
+                    if scores is None or key in scores:
+                        matched[key] += weight * idf
+            if scores is None:
+                scores = matched
+            else:
+                scores = {key: scores[key] + score for key, score in matched.items()}
+            if not scores:
+                return {}, truncated
+        return scores, truncated
+
+@functools.lru_cache(maxsize=65536)
+def term_weights(fields, values):
+    # Cached like tokenize: runs repeat the same few Remarks endlessly.
+    weights = collections.Counter()
+    for (_, weight), value in zip(fields, values):
+        if value:
+            for term in tokenize(str(value)):
+                weights[term] += weight
+    return weights
+
+@functools.lru_cache(maxsize=65536)
+def tokenize(value):
+    return tuple(TOKEN.findall(value.lower()))
+
+def counter_add(counters, group, value, sign):
+    counts = counters[group]
+    counts[value] += sign
+    if counts[value] <= 0:
+        del counts[value]
+        if not counts:
+            del counters[group]
+
+def counted_percentiles(counts, quantiles):
+    """Linear-interpolated percentiles of the multiset ``{value: count}``."""
+    ordered = sorted(counts.items())
+    size = sum(counts.values())
+    positions = [q * (size - 1) for q in quantiles]
+    wanted = sorted({index for position in positions for index in (int(position), min(int(position) + 1, size - 1))})
+    found = {}
+    seen = 0
+    pending = iter(wanted)
+    index = next(pending, None)
+    for value, count in ordered:
+        seen += count
+        while index is not None and index < seen:
+            found[index] = value
+            index = next(pending, None)
+    results = []
+    for position in positions:
+        low = int(position)
+        high = min(low + 1, size - 1)
+        results.append(found[low] + (found[high] - found[low]) * (position - low))
+    return results
+
+@functools.lru_cache(maxsize=65536)
+def normalize_term(value):
+    return '-'.join(str(value if value is not None else '').lower().split())
+
+def page_entries(entries, after, limit, descending=False):
+    if descending:
+        end = len(entries) if after is None else bisect.bisect_left(entries, after)
+        return entries[max(end - limit, 0):end][::-1]
+    start = 0 if after is None else bisect.bisect_right(entries, after)
+    return entries[start:start + limit]
+
+class Collection:
+    """One entity type held in memory, indexed by its primary key.
+
+    Keys are normalised to strings so lookups coming from URLs and query
+    strings hit the same index entries as the loaded records. ``version``
+    is taken from the store-wide clock on every write; encoded response
+    bodies are cached against it so unchanged collections are never
+    serialised twice. Fields listed in ``dates`` are parsed once on write
+    into integer epoch columns (``timestamps``) that the ordering and date
+    range filters work from.
+    """
+
+    def __init__(self, name, key, ordering=None, filters=None, counters=None, schema=None, dates=None,
+                 rows=None):
+        self.name = name
+        self.key = key
+        self.rows = rows if rows is not None else {}
+        self.dates = dates or {}
+        if isinstance(self.rows, ColumnarRows):
+            self.timestamps = {name: self.rows.timestamp_column(name) for name in self.dates}
+        else:
+            self.timestamps = {name: {} for name in self.dates}
+        self.schema = schema or {}
+        self._fields = [(name, convert, not getattr(convert, 'optional', False))
+                        for name, convert in self.schema.items()]
+        self.lock = threading.Lock()
+        self.version = 0
+        self.modified_at = utcnow()
+        self._bodies = {}
+        self.indexes = []
+        self.ordering = None
+        if ordering is not None:
+            self.ordering = SortedIndex(self.timestamps[ordering].__getitem__)
+            self.indexes.append(self.ordering)
+        self.filters = {param: HashIndex(value_of) for param, value_of in (filters or {}).items()}
+        self.indexes.extend(self.filters.values())
+        self.counters = {name: CountIndex(value_of) for name, value_of in (counters or {}).items()}
+        self.indexes.extend(self.counters.values())
+        self.derived = {}
+        self.listeners = []
+        # (version, key, deleted) in write order; versions older than
+        # changelog_floor may have been trimmed away, or belong to an
+        # earlier boot.
+        self.changelog = []
+        self.changelog_floor = BOOT_VERSION
+
+    def add_index(self, name, index):
+        """Attach an index built from the loaded rows, backfilled in one batch."""
+        with self.lock:
+            index.add_many(list(self.rows.items()))
+            self.derived[name] = index
+            self.indexes.append(index)
+        return index
+
+    def key_of(self, record):
+        if isinstance(self.key, tuple):
+            return '|'.join(str(record[field]) for field in self.key)
+        return str(record[self.key])
+
+    def insert_many(self, records):
+        with self.lock:
+            batch = {}
+            replaced = []
+            for record in records:
+                key = self.key_of(record)
+                if key not in batch and key in self.rows:
+                    replaced.append((key, self.rows[key]))
+                batch[key] = record
+            for index in self.indexes:
+                remove_many = getattr(index, 'remove_many', None)
+                if remove_many is not None:
+                    remove_many(replaced)
+                else:
+                    for key, record in replaced:
+                        index.remove(key, record)
+            self.rows.update(batch)
+            self._stamp(batch.items())
+            for index in self.indexes:
+                index.add_many(batch.items())
+            self.touch()
+            self._log((key, False) for key in batch)
+            if self.listeners:
+                replaced = {key for key, _ in replaced}
+                inserted = [record for key, record in batch.items() if key not in replaced]
+                updated = [record for key, record in batch.items() if key in replaced]
+                for listener in self.listeners:
+                    listener(self, 'insert', inserted)
+                    listener(self, 'update', updated)
+        return len(batch)
+
+    def get(self, key):
+        return self.rows.get(str(key))
+
+    def delete(self, key):
+        key = str(key)
+        with self.lock:
+            record = self.rows.get(key)
+            if record is not None:
+                for index in self.indexes:
+                    index.remove(key, record)
+                for column in self.timestamps.values():
+                    column.pop(key, None)
+                del self.rows[key]
+                self.touch()
+                self._log([(key, True)])
+                for listener in self.listeners:
+                    listener(self, 'delete', [key])
+        return record
+
+    def _log(self, changes):
+        version = self.version
+        self.changelog.extend((version, key, deleted) for key, deleted in changes)
+        if len(self.changelog) > 2 * MAX_CHANGELOG:
+            # Trim in bulk so appends stay amortised O(1).
+            drop = len(self.changelog) - MAX_CHANGELOG
+            self.changelog_floor = self.changelog[drop - 1][0]
+            del self.changelog[:drop]
+
+    def changes_since(self, version):
+        """``(upserted keys, deleted keys)`` since ``version``, or None.
+
+        None means the log cannot answer: the version was trimmed away,
+        predates this boot, or is newer than anything this process issued.
+        A version another collection issued after this one's last write is
+        fine and has no changes. Only the last change to each key counts,
+        so a record written and then deleted shows up once, as deleted.
+        """
+        with self.lock:
+            if not BOOT_VERSION <= version <= VERSION_CLOCK.issued:
+                return None
+            if version >= self.version:
+                return [], []
+            if version < self.changelog_floor:
+                return None
+            start = bisect.bisect_left(self.changelog, (version + 1,))
+            latest = {key: deleted for _, key, deleted in self.changelog[start:]}
+        upserted = [key for key, deleted in latest.items() if not deleted]
+        deleted = [key for key, deleted in latest.items() if deleted]
+        return upserted, deleted
+
+    def _stamp(self, items):
+        # Dates arrive in a different format per entity; parse them once
+        # here so every sort and range filter compares plain integers. The
+        # record keeps its original string for output.
+        for name, fmt in self.dates.items():
+            column = self.timestamps[name]
+            for key, record in items:
+                value = record.get(name)
+                if value:
+                    column[key] = parse_timestamp(value, fmt)
+                else:
+                    column.pop(key, None)
+
+    def timestamp(self, name, key):
+        return self.timestamps[name].get(key)
+
+    def validate(self, row):
+        """Return ``row`` with its schema fields checked and converted.
+
+        Raises ``ValueError`` naming the first field that is missing or
+        does not parse. Fields outside the schema are kept as they are, but
+        must still be single values: counters, filters and dictionary
+        columns hash whatever a record holds, and a list or object would
+        fail there halfway through a batch.
+        """
+        if not isinstance(row, dict):
+            raise ValueError('expected an object, got %s' % type(row).__name__)
+        for name, value in row.items():
+            if value.__class__ in NESTED_TYPES:
+                kind = 'a list' if value.__class__ is list else 'an object'
+                raise ValueError('%s must be a single value, not %s' % (name, kind))
+        record = dict(row)
+        get = row.get
+        for name, convert, required in self._fields:
+            value = get(name)
+            if value is None or value == '':
+                if required:
+                    raise ValueError('%s is required' % name)
+                continue
+            try:
+                record[name] = convert(value)
+            except (TypeError, ValueError):
+                raise ValueError('%s has an invalid value %r' % (name, value))
+        return record
+
+    def select(self, criteria, start=None, end=None):
+        """Return ``(sort_key, key)`` pairs matching every filter, in index order.
+
+        Equality filters are answered from the hash indexes, smallest bucket
+        first, and the date range from the sorted index; only the matching
+        rows are ever looked at.
+        """
+        ranged = start is not None or end is not None
+        matches = [set().union(*(self.filters[param].lookup(value) for value in values))
+                   for param, values in criteria.items()]
+        if not matches:
+            return self.ordering.between(start, end)
+        matches.sort(key=len)
+        keys = matches[0].intersection(*matches[1:])
+        if ranged:
+            window = self.ordering.between(start, end)
+            if len(window) <= len(keys):
+                return [entry for entry in window if entry[1] in keys]
+        if self.ordering is None:
+            return sorted((key, key) for key in keys)
+        entries = sorted((self.ordering.sort_key(key), key) for key in keys)
+        if ranged:
+            entries = [entry for entry in entries
+                       if (start is None or entry[0] >= start) and (end is None or entry[0] <= end)]
+        return entries
+
+    def page(self, criteria, start=None, end=None, after=None, limit=100, descending=False):
+        """Up to ``limit`` entries matching every filter after the cursor ``after``.
+
+        When the matches are a fair share of the rows, walking the ordering
+        from the cursor and testing each key against the filter buckets
+        finds a page in about ``limit * rows / matches`` steps, so a common
+        filter pages as cheaply as no filter. Only a selective filter, whose
+        few matches are cheaper to sort than to look for, goes through
+        ``select``.
+        """
+        buckets = [[self.filters[param].lookup(value) for value in values] for param, values in criteria.items()]
+        entries = self.ordering.entries
+        matches = min((sum(map(len, lookups)) for lookups in buckets), default=len(entries))
+        if limit * len(entries) > matches * matches:
+            return page_entries(self.select(criteria, start, end), after, limit, descending)
+        low = 0 if start is None else bisect.bisect_left(entries, (start,))
+        high = len(entries) if end is None else bisect.bisect_left(entries, (end + 1,))
+        if descending:
+            if after is not None:
+                high = min(high, bisect.bisect_left(entries, after))
+            positions = range(high - 1, low - 1, -1)
+        else:
+            if after is not None:
+                low = max(low, bisect.bisect_right(entries, after))
+            positions = range(low, high)
+        page = []
+        for position in positions:
+            entry = entries[position]
+            key = entry[1]
+            if all(any(key in bucket for bucket in lookups) for lookups in buckets):
+                page.append(entry)
+                if len(page) == limit:
+                    break
+        return page
+
+    def touch(self):
+        self.version = VERSION_CLOCK.next()
+        self.modified_at = utcnow()
+
+    def etag(self, encoding='identity'):
+        tag = '%s-%s-%d' % (self.name, BOOT_ID, self.version)
+        return tag if encoding == 'identity' else '%s-%s' % (tag, encoding)
+
+    def body(self, encoding='identity'):
+        version = self.version
+        cached = self._bodies.get(encoding)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        if encoding == 'identity':
+            body = (app.json.dumps(list(self.records()), separators=(',', ':')) + '\n').encode('utf-8')
+        else:
+            body = COMPRESSORS[encoding](self.body('identity'))
+        self._bodies[encoding] = (version, body)
+        return body
+
+    def records(self):
+        return iter(self.rows.values())
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __contains__(self, key):
+        return str(key) in self.rows
+
+COMPRESSORS = {'gzip': lambda body: gzip.compress(body, compresslevel=6)}
+if brotli is not None:
+    COMPRESSORS['br'] = lambda body: brotli.compress(body, quality=5)
+
+def negotiate_encoding():
+    offered = [encoding for encoding in ('br', 'gzip') if encoding in COMPRESSORS]
+    return request.accept_encodings.best_match(offered + ['identity'], default='identity')
+
+class RecordStore:
+    """Every mock TestRail collection, loaded once at startup."""
+
+    def __init__(self):
+        self.collections = {}
+        self._bundles = {}
+        self.feed = ChangeFeed(MAX_FEED_EVENTS)
+
+    def add_collection(self, name, key, records=(), ordering=None, filters=None, counters=None, schema=None,
+                       dates=None, rows=None):
+        collection = Collection(name, key, ordering, filters, counters, schema, dates, rows)
+        collection.insert_many(records)
+        collection.listeners.append(self.feed.publish)
+        self.collections[name] = collection
+        return collection
+
+    def __getitem__(self, name):
+        return self.collections[name]
+
+    def __contains__(self, name):
+        return name in self.collections
+
+    def bundle(self, names, encoding='identity'):
+        """Splice the cached bodies of ``names`` into one dashboard payload."""
+        # The body's "version" is store-wide, so it is part of the key too.
+        versions = tuple(self.collections[name].version for name in names)
+        cache_key = (tuple(names), versions, self.version, encoding)
+        body = self._bundles.get(cache_key)
+        if body is not None:
+            return body
+        if encoding == 'identity':
+            parts = []
+            for name in names:
+                collection = self.collections[name]
+                header = app.json.dumps({'etag': collection.etag(), 'version': collection.version},
+                                        separators=(',', ':'))
+                parts.append(b'%s:%s,"data":%s}' % (json.dumps(name).encode('utf-8'),
+                                                    header[:-1].encode('utf-8'),
+                                                    collection.body().rstrip(b'\n')))
+            body = b'{"collections":{%s},"version":%d}\n' % (b','.join(parts), self.version)
+        else:
+            body = COMPRESSORS[encoding](self.bundle(names))
+        if len(self._bundles) >= MAX_CACHED_BUNDLES:
+            self._bundles.clear()
+        self._bundles[cache_key] = body
+        return body
+
+    @property
+    def version(self):
+        return max(collection.version for collection in self.collections.values())
+
+class ChangeFeed:
+    """Bounded, sequence-numbered log of collection changes for SSE clients.
+
+    Writers append events under their collection's lock; each event is
+    encoded to its SSE frame once, by whichever subscriber reads it first,
+    and every other subscriber sends the same bytes. Sequence numbers are
+    contiguous, so resuming from ``Last-Event-ID`` is an offset into the
+    deque rather than a search. Event IDs are ``<BOOT_ID>-<sequence>``, so
+    an ID handed out by an earlier process is recognised and answered with
+    a reset instead of being mistaken for a position in this one.
+
+    Events name the changed keys and the collection version, not the
+    records: a retained upload would otherwise pin a second copy of every
+    row it wrote. Clients fetch the rows they care about, for instance with
+    ``?since=`` on the collection.
+    """
+
+    def __init__(self, maxlen):
+        self.events = collections.deque(maxlen=maxlen)
+        self.sequence = 0
+        self.subscribers = 0
+        self.condition = threading.Condition()
+
+    def subscribe(self):
+        """Claim a subscriber slot; False if MAX_SUBSCRIBERS are already streaming."""
+        with self.condition:
+            if MAX_SUBSCRIBERS is not None and self.subscribers >= MAX_SUBSCRIBERS:
+                return False
+            self.subscribers += 1
+            return True
+
+    def unsubscribe(self):
+        with self.condition:
+            self.subscribers -= 1
+
+    def publish(self, collection, op, changes):
+        keys = changes if op == 'delete' else [collection.key_of(record) for record in changes]
+        for start in range(0, len(keys), STREAM_CHUNK):
+            payload = {'collection': collection.name, 'op': op, 'version': collection.version,
+                       'keys': keys[start:start + STREAM_CHUNK]}
+            with self.condition:
+                self.sequence += 1
+                self.events.append([self.sequence, collection.name, payload, None])
+                self.condition.notify_all()
+
+    @staticmethod
+    def encode(event):
+        if event[3] is None:
+            payload = dict(event[2], sequence=event[0])
+            event[3] = b'id: %s-%d\nevent: change\ndata: %s\n\n' % (
+                BOOT_ID.encode('ascii'), event[0], app.json.dumps(payload, separators=(',', ':')).encode('utf-8'))
+        return event[3]
+
+    def since(self, sequence):
+        """Events after ``sequence``, or None if some were already dropped."""
+        with self.condition:
+            oldest = self.events[0][0] if self.events else self.sequence + 1
+            if sequence < 0 or sequence > self.sequence or sequence < oldest - 1:
+                return None
+            return list(itertools.islice(self.events, sequence - oldest + 1, None))
+
+    def stream(self, sequence, names=None):
+        """SSE frames after ``sequence``; pass -1 to start with a reset."""
+        yield b'retry: 3000\n\n'
+        while True:
+            events = self.since(sequence)
+            if events is None:
+                # The client fell behind the retained log, or its ID is
+                # from another boot; tell it to refetch and carry on from
+                # the current position.
+                with self.condition:
+                    sequence = self.sequence
+                yield b'id: %s-%d\nevent: reset\ndata: {"sequence":%d}\n\n' % (
+                    BOOT_ID.encode('ascii'), sequence, sequence)
+                continue
+            if not events:
+                with self.condition:
+                    if self.sequence == sequence:
+                        self.condition.wait(FEED_HEARTBEAT)
+                    if self.sequence == sequence:
+                        yield b': heartbeat\n\n'
+                continue
+            for event in events:
+                if names is None or event[1] in names:
+                    yield self.encode(event)
+            sequence = events[-1][0]
+
+def error_response(message, status=400):
+    return add_cors_headers(make_response(jsonify({'error': message}), status))
+
+def encode_cursor(entry):
+    raw = json.dumps([entry[0], entry[1]], separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii')
+
+def decode_cursor(token):
+    sort_key, key = json.loads(base64.urlsafe_b64decode(token.encode('ascii')))
+    # Sort keys are epoch integers and primary keys strings; anything else
+    # would fail inside bisect instead of being rejected here.
+    if type(sort_key) is not int or not isinstance(key, str):
+        raise ValueError('malformed cursor')
+    return (sort_key, key)
+
+def is_not_modified(etag, last_modified):
+    if request.if_none_match:
+        return request.if_none_match.contains(etag)
+    if request.if_modified_since and last_modified is not None:
+        return last_modified <= request.if_modified_since
+    return False
+
+def conditional_response(etag, last_modified, build_body, encoding='identity', mimetype='application/json'):
+    response = app.response_class(mimetype=mimetype)
+    response.set_etag(etag)
+    response.last_modified = last_modified
+    response.vary.add('Accept-Encoding')
+    if is_not_modified(etag, last_modified):
+        response.status_code = 304
+    else:
+        body = build_body()
+        if isinstance(body, (str, bytes)):
+            response.set_data(body)
+        else:
+            response.response = body
+        if encoding != 'identity':
+            response.headers['Content-Encoding'] = encoding
+    return add_cors_headers(response)
+
+def parse_date_bound(value, end_of_day=False):
+    for fmt in (DEFECT_DATE, '%Y-%m-%d %H:%M', ISO_DATE):
+        try:
+            timestamp = parse_timestamp(value, fmt)
+        except ValueError:
+            continue
+        return timestamp + 86399 if end_of_day and fmt == ISO_DATE else timestamp
+    raise ValueError('dates must look like YYYY-MM-DD or YYYY-MM-DD HH:MM[:SS], got %r' % value)
+
+def walk_keys(collection):
+    """Yield every key in index order without copying the index.
+
+    The walk resumes from the last entry it handed out, so it survives
+    writes made while the response is still streaming.
+    """
+    if collection.ordering is None:
+        yield from list(collection.rows)
+        return
+    after = None
+    while True:
+        chunk = page_entries(collection.ordering.entries, after, STREAM_CHUNK)
+        if not chunk:
+            return
+        for _, key in chunk:
+            yield key
+        after = chunk[-1]
+
+def stream_records(collection, keys, fmt):
+    keys = iter(keys)
+    started = False
+    if fmt == 'stream':
+        yield '['
+    while True:
+        batch = [collection.rows.get(key) for key in itertools.islice(keys, STREAM_CHUNK)]
+        if not batch:
+            break
+        lines = [app.json.dumps(record, separators=(',', ':')) for record in batch if record is not None]
+        if not lines:
+            continue
+        if fmt == 'ndjson':
+            yield '\n'.join(lines) + '\n'
+        else:
+            yield (',' if started else '') + ','.join(lines)
+            started = True
+    if fmt == 'stream':
+        yield ']\n'
+
+class RawStream(io.RawIOBase):
+    """Adapt a bare ``read(n)`` object, such as gunicorn's request body, to io."""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self.stream.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+def open_text(stream):
+    if not isinstance(stream, io.IOBase):
+        stream = RawStream(stream)
+    if isinstance(stream, io.RawIOBase):
+        stream = io.BufferedReader(stream)
+    return io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+
+def iter_json_array(text):
+    """Yield the items of a top-level JSON array, reading ``text`` in chunks.
+
+    Only the current chunk plus any record that straddles a chunk boundary
+    is held in memory. A lone object is accepted as a one-record upload.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    position = 0
+    expect = 'start'
+    while True:
+        while position < len(buffer) and buffer[position].isspace():
+            position += 1
+        if position == len(buffer):
+            chunk = text.read(UPLOAD_READ_CHUNK)
+            if not chunk:
+                if expect == 'start':
+                    raise ValueError('request body is empty')
+                if expect == 'done':
+                    return
+                raise ValueError('JSON array is not terminated')
+            buffer, position = chunk, 0
+            continue
+        if expect == 'done':
+            raise ValueError('unexpected data after the JSON document')
+        char = buffer[position]
+        if expect == 'start' and char == '[':
+            position += 1
+            expect = 'item_or_end'
+            continue
+        if expect in ('item_or_end', 'separator') and char == ']':
+            position += 1
+            expect = 'done'
+            continue
+        if expect == 'separator':
+            if char != ',':
+                raise ValueError('expected "," or "]" between records')
+            position += 1
+            expect = 'item'
+            continue
+        try:
+            item, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            chunk = text.read(UPLOAD_READ_CHUNK)
+            if not chunk:
+                raise
+            buffer, position = buffer[position:] + chunk, 0
+            continue
+        yield item
+        position = end
+        expect = 'done' if expect == 'start' else 'separator'
+
+def iter_ndjson(text):
+    for line in text:
+        if line.strip():
+            yield json.loads(line)
+
+def iter_csv(text):
+    reader = csv.reader(text)
+    header = [name.strip() for name in next(reader, [])]
+    for row in reader:
+        if row:
+            yield dict(zip(header, row))
+
+def iter_upload_rows(stream, fmt):
+    text = open_text(stream)
+    if fmt == 'csv':
+        return iter_csv(text)
+    if fmt == 'ndjson':
+        return iter_ndjson(text)
+    return iter_json_array(text)
+
+def upload_source():
+    """Pick the body stream and its format for a POST upload.
+
+    Raw bodies are typed by ``?format=`` or Content-Type; multipart uploads
+    use the ``file`` part and fall back to its extension.
+    """
+    fmt = request.args.get('format')
+    if request.mimetype == 'multipart/form-data':
+        upload = request.files.get('file')
+        if upload is None:
+            raise ValueError('multipart uploads must carry the data in a "file" field')
+        extension = upload.filename.rsplit('.', 1)[-1].lower() if upload.filename else ''
+        fmt = fmt or UPLOAD_FORMATS.get(upload.mimetype) or {'jsonl': 'ndjson'}.get(extension, extension)
+        stream = upload.stream
+    else:
+        fmt = fmt or UPLOAD_FORMATS.get(request.mimetype)
+        stream = request.stream
+    if fmt not in ('csv', 'json', 'ndjson'):
+        raise ValueError('send CSV, JSON or NDJSON (set Content-Type or ?format=csv|json|ndjson)')
+    return stream, fmt
+
+def upload_response(name):
+    if not UPLOADS_ENABLED:
+        return error_response('uploads are disabled while serving with more than one worker; '
+                              'restart with --workers 1 to accept them', 403)
+    collection = store[name]
+    try:
+        stream, fmt = upload_source()
+    except ValueError as exc:
+        return error_response(str(exc), 415)
+    upserted = 0
+    rejected = 0
+    errors = []
+    failure = None
+    batch = []
+    try:
+        for number, row in enumerate(iter_upload_rows(stream, fmt), 1):
+            try:
+                batch.append(collection.validate(row))
+            except ValueError as exc:
+                rejected += 1
+                if len(errors) < MAX_REPORTED_ERRORS:
+                    errors.append({'row': number, 'error': str(exc)})
+                continue
+            if len(batch) >= UPLOAD_BATCH:
+                upserted += collection.insert_many(batch)
+                batch = []
+    except (ValueError, csv.Error, UnicodeDecodeError) as exc:
+        failure = 'upload stopped early: %s' % exc
+    if batch:
+        upserted += collection.insert_many(batch)
+    result = {
+        'collection': name,
+        'upserted': upserted,
+        'rejected': rejected,
+        'errors': errors,
+        'version': collection.version,
+    }
+    if failure is not None:
+        result['error'] = failure
+        status = 207 if upserted else 400
+    elif rejected and not upserted:
+        status = 400
+    else:
+        status = 201 if upserted else 200
+    return add_cors_headers(make_response(jsonify(result), status))
+
+def query_response(collection, criteria, paged):
+    try:
+        start = parse_date_bound(request.args['date_from']) if request.args.get('date_from') else None
+        end = parse_date_bound(request.args['date_to'], True) if request.args.get('date_to') else None
+    except ValueError as exc:
+        return error_response(str(exc))
+    if (start is not None or end is not None) and collection.ordering is None:
+        return error_response('%s cannot be filtered by date' % collection.name)
+    if paged:
+        try:
+            limit = int(request.args.get('limit', 100))
+            after = decode_cursor(request.args['cursor']) if request.args.get('cursor') else None
+        except (ValueError, TypeError):
+            return error_response('limit must be an integer and cursor a token from next_cursor')
+        if not 0 < limit <= MAX_PAGE_SIZE:
+            return error_response('limit must be between 1 and %d' % MAX_PAGE_SIZE)
+        order = request.args.get('order', 'asc')
+        if order not in ('asc', 'desc'):
+            return error_response('order must be asc or desc')
+        descending = order == 'desc'
+    fmt = request.args.get('format', 'json')
+    if fmt != 'json' and fmt not in STREAM_FORMATS:
+        return error_response('format must be json, %s' % ' or '.join(STREAM_FORMATS))
+    if fmt != 'json' and paged:
+        return error_response('format=%s streams the whole result and cannot be paged' % fmt)
+    filtered = bool(criteria) or start is not None or end is not None
+
+    def build_body():
+        if fmt != 'json':
+            keys = (key for _, key in collection.select(criteria, start, end)) if filtered else walk_keys(collection)
+            return stream_records(collection, keys, fmt)
+        if not paged:
+            entries = collection.select(criteria, start, end) if filtered else collection.ordering.entries
+            return app.json.dumps([collection.rows[key] for _, key in entries], separators=(',', ':'))
+        if filtered:
+            page = collection.page(criteria, start, end, after, limit + 1, descending)
+        else:
+            page = page_entries(collection.ordering.entries, after, limit + 1, descending)
+        next_cursor = encode_cursor(page[limit - 1]) if len(page) > limit else None
+        data = [collection.rows[key] for _, key in page[:limit]]
+        return app.json.dumps({'data': data, 'next_cursor': next_cursor}, separators=(',', ':'))
+
+    return conditional_response(collection.etag(), collection.modified_at, build_body,
+                                mimetype=STREAM_FORMATS.get(fmt, 'application/json'))
+
+def delta_response(collection):
+    try:
+        since = int(request.args['since'])
+    except ValueError:
+        return error_response('since must be a version number')
+    etag = '%s-since-%d' % (collection.etag(), since)
+
+    def build_body():
+        changes = collection.changes_since(since)
+        if changes is None:
+            # Not answerable from the log: the client gets everything.
+            return b'{"deleted":[],"since":%d,"snapshot":true,"upserted":%s,"version":%d}\n' % (
+                since, collection.body().rstrip(b'\n'), collection.version)
+        upserted, deleted = changes
+        result = {
+            'since': since,
+            'version': collection.version,
+            'snapshot': False,
+            'upserted': [record for record in map(collection.get, upserted) if record is not None],
+            'deleted': deleted,
+        }
+        return app.json.dumps(result, separators=(',', ':'))
+
+    return conditional_response(etag, collection.modified_at, build_body)
+
+# Query parameters every collection route understands; anything else must
+# be one of the collection's filters.
+QUERY_PARAMS = {'limit', 'cursor', 'order', 'format', 'date_from', 'date_to', 'since'}
+
+def collection_response(name):
+    collection = store[name]
+    # Underscore parameters are left alone for cache busters like ?_=123.
+    unsupported = sorted(param for param in request.args
+                         if param not in QUERY_PARAMS and param not in collection.filters
+                         and not param.startswith('_'))
+    if unsupported:
+        return error_response('%s cannot be filtered by %s; filters are %s' % (
+            name, ', '.join(unsupported), ', '.join(collection.filters) or 'none'))
+    if 'since' in request.args:
+        # A delta is every change to the collection; narrowing, paging or
+        # reformatting it would drop changes the client never hears about.
+        combined = sorted(param for param in request.args
+                          if param != 'since' and not param.startswith('_'))
+        if combined:
+            return error_response('since cannot be combined with %s' % ', '.join(combined))
+        return delta_response(collection)
+    criteria = {param: request.args.getlist(param) for param in collection.filters if param in request.args}
+    paged = collection.ordering is not None and ('limit' in request.args or 'cursor' in request.args)
+    if (criteria or paged or request.args.get('format', 'json') != 'json'
+            or 'date_from' in request.args or 'date_to' in request.args):
+        return query_response(collection, criteria, paged)
+    encoding = negotiate_encoding()
+    return conditional_response(collection.etag(encoding), collection.modified_at,
+                                lambda: collection.body(encoding), encoding)
+
+@app.route('/mock_testrail/testcases', methods=['GET', 'POST', 'OPTIONS'])
 def get_test_cases():
     if request.method == 'OPTIONS':
         return add_cors_headers(make_response())
-    response = make_response(jsonify([
-        {
-            "id": 101,
-            "title": "Login with valid credentials",
-            "type": "Feature",
-            "component": "Authentication",
-            "requirement_id": 1,
-            "status": "Active",
-            "created_by": "qa_user"
-        },
-        {
-            "id": 102,
-            "title": "Login fails with wrong password",
-            "type": "Regression",
-            "component": "Authentication",
-            "requirement_id": 1,
-            "status": "Active",
-            "created_by": "qa_user"
-        }
-    ]))
-    return add_cors_headers(response)
+    if request.method == 'POST':
+        return upload_response('testcases')
+    return collection_response('testcases')
 
-@app.route('/mock_testrail/testruns', methods=['GET', 'OPTIONS'])
+@app.route('/mock_testrail/testruns', methods=['GET', 'POST', 'OPTIONS'])
 def get_testruns():
     if request.method == 'OPTIONS':
         return add_cors_headers(make_response())
-    response = make_response(jsonify([
-        {
-            "Executed_By": "Robot_Unit_04",
-            "Execution_Date": "18-05-2025 20:55",
-            "Observed_Time": 3975,
-            "Remarks": "Screen not responsive",
-            "Result": "Fail",
-            "run_id": "rid-104",
-            "test_case_id": "TC-F-FVM-215-86"
-        },
-        {
-            "Executed_By": "Robot_Unit_08",
-            "Execution_Date": "18-05-2025 20:55",
-            "Observed_Time": 525,
-            "Remarks": "Minor Delay Observed",
-            "Result": "Pass",
-            "run_id": "rid-107",
-            "test_case_id": "TC-F-FVM-215-86"
-        },
-        {
-            "Executed_By": "Robot_Unit_08",
-            "Execution_Date": "22-05-2025 15:12",
-            "Observed_Time": 8371,
-            "Remarks": "Screen not responsive",
-            "Result": "Fail",
-            "run_id": "rid-108",
-            "test_case_id": "TC-F-ALL-908-92"
-        },
-        {
-            "Executed_By": "Robot_Unit_05",
-            "Execution_Date": "21-05-2025 13:59",
-            "Observed_Time": 1182,
-            "Remarks": "Card Not Detected",
-            "Result": "Pass",
-            "run_id": "rid-109",
-            "test_case_id": "TC-F-FVM-278-73"
-        },
-        {
-            "Executed_By": "Robot_Unit_05",
-            "Execution_Date": "16-05-2025 15:58",
-            "Observed_Time": 6212,
-            "Remarks": "Card Not Detected",
-            "Result": "Fail",
-            "run_id": "rid-110",
-            "test_case_id": "TC-F-ALL-022-56"
-        },
-        {
-            "Executed_By": "Robot_Unit_04",
-            "Execution_Date": "16-05-2025 15:58",
-            "Observed_Time": 9353,
-            "Remarks": "Mechanical Arm Misaligned",
-            "Result": "Fail",
-            "run_id": "rid-120",
-            "test_case_id": "TC-F-FVM-658-00"
-        },
-        {
-            "Executed_By": "Robot_Unit_04",
-            "Execution_Date": "21-05-2025 13:59",
-            "Observed_Time": 8464,
-            "Remarks": "Minor Delay Observed",
-            "Result": "Fail",
-            "run_id": "rid-126",
-            "test_case_id": "TC-F-GATE-READER-797-68"
-        },
-        {
-            "Executed_By": "Robot_Unit_04",
-            "Execution_Date": "18-05-2025 20:55",
-            "Observed_Time": 7307,
-            "Remarks": "Test Passed Smoothly",
-            "Result": "Pass",
-            "run_id": "rid-138",
-            "test_case_id": "TC-F-FVM-361-74"
-        },
-        {
-            "Executed_By": "Robot_Unit_03",
-            "Execution_Date": "22-05-2025 15:12",
-            "Observed_Time": 8088,
-            "Remarks": "Incorrect result shown",
-            "Result": "Fail",
-            "run_id": "rid-143",
-            "test_case_id": "TC-NF-GATE-278-16"
-        },
-        {
-            "Executed_By": "Robot_Unit_00",
-            "Execution_Date": "16-05-2025 15:58",
-            "Observed_Time": 5463,
-            "Remarks": "Mechanical Arm Misaligned",
-            "Result": "Fail",
-            "run_id": "rid-146",
-            "test_case_id": "TC-F-BUS-READER-291-00"
-        },
-        {
-            "Executed_By": "Robot_Unit_07",
-            "Execution_Date": "16-05-2025 15:58",
-            "Observed_Time": 6438,
-            "Remarks": "Card Not Detected",
-            "Result": "Fail",
-            "run_id": "rid-151",
-            "test_case_id": "TC-F-ALL-022-56"
-        },
-        {
-            "Executed_By": "Robot_Unit_07",
-            "Execution_Date": "21-05-2025 13:59",
-            "Observed_Time": 255,
-            "Remarks": "Card Not Detected",
-            "Result": "Fail",
-            "run_id": "rid-157",
-            "test_case_id": "TC-F-FVM-502-23"
-        },
-        {
-            "Executed_By": "Robot_Unit_07",
-            "Execution_Date": "22-05-2025 15:12",
-            "Observed_Time": 182,
-            "Remarks": "Screen not responsive",
-            "Result": "Fail",
-            "run_id": "rid-172",
-            "test_case_id": "TC-F-GATE-READER-638-28"
-        },
-        {
-            "Executed_By": "Robot_Unit_00",
-            "Execution_Date": "18-05-2025 20:55",
-            "Observed_Time": 951,
-            "Remarks": "Mechanical Arm Misaligned",
-            "Result": "Fail",
-            "run_id": "rid-179",
-            "test_case_id": "TC-F-GATE-READER-498-53"
-        },
-        {
-            "Executed_By": "Robot_Unit_01",
-            "Execution_Date": "16-05-2025 15:58",
-            "Observed_Time": 7332,
-            "Remarks": "Minor Delay Observed",
-            "Result": "Pass",
-            "run_id": "rid-191",
-            "test_case_id": "TC-NF-GATE-633-97"
-        },
-        {
-            "Executed_By": "Robot_Unit_07",
-            "Execution_Date": "22-05-2025 15:12",
-            "Observed_Time": 6087,
-            "Remarks": "Mechanical Arm Misaligned",
-            "Result": "Fail",
-            "run_id": "rid-198",
-            "test_case_id": "TC-F-ALL-908-92"
-        },
-        {
-            "Executed_By": "Robot_Unit_04",
-            "Execution_Date": "16-05-2025 15:58",
-            "Observed_Time": 1440,
-            "Remarks": "Mechanical Arm Misaligned",
-            "Result": "Pass",
-            "run_id": "rid-203",
-            "test_case_id": "TC-F-FVM-815-57"
-        },
-        {
-            "Executed_By": "Robot_Unit_04",
-            "Execution_Date": "16-05-2025 15:58",
-            "Observed_Time": 1801,
-            "Remarks": "Screen not responsive",
-            "Result": "Pass",
-            "run_id": "rid-210",
-            "test_case_id": "TC-F-FVM-658-00"
-        },
-        {
-            "Executed_By": "Robot_Unit_08",
-            "Execution_Date": "16-05-2025 15:52",
-            "Observed_Time": 9322,
-            "Remarks": "All Steps Passed",
-            "Result": "Fail",
-            "run_id": "rid-217",
-            "test_case_id": "TC-NF-GATE-306-41"
-        },
-        {
-            "Executed_By": "Robot_Unit_02",
-            "Execution_Date": "16-05-2025 15:58",
-            "Observed_Time": 3557,
-            "Remarks": "Card Not Detected",
-            "Result": "Pass",
-            "run_id": "rid-219",
-            "test_case_id": "TC-F-BUS-READER-162-77"
-        },
-        {
-            "Executed_By": "Robot_Unit_00",
-            "Execution_Date": "22-05-2025 13:55",
-            "Observed_Time": 1120,
-            "Remarks": "Screen not responsive",
-            "Result": "Fail",
-            "run_id": "rid-228",
-            "test_case_id": "TC-F-FVM-984-31"
-        },
-        {
-            "Executed_By": "Robot_Unit_06",
-            "Execution_Date": "16-05-2025 15:58",
-            "Observed_Time": 5667,
-            "Remarks": "Minor Delay Observed",
-            "Result": "Fail",
-            "run_id": "rid-231",
-            "test_case_id": "TC-F-FVM-403-54"
-        },
-        {
-            "Executed_By": "Robot_Unit_03",
-            "Execution_Date": "16-05-2025 15:58",
-            "Observed_Time": 8583,
-            "Remarks": "Card Not Detected",
-            "Result": "Pass",
-            "run_id": "rid-245",
-            "test_case_id": "TC-F-BUS-READER-984-06"
-        },
-        {
-            "Executed_By": "Robot_Unit_03",
-            "Execution_Date": "18-05-2025 20:55",
-            "Observed_Time": 4047,
-            "Remarks": "Screen not responsive",
-            "Result": "Pass",
-            "run_id": "rid-250",
-            "test_case_id": "TC-F-GATE-READER-983-34"
-        },
-        {
-            "Executed_By": "Robot_Unit_03",
-            "Execution_Date": "22-05-2025 13:55",
-            "Observed_Time": 7059,
-            "Remarks": "Incorrect result shown",
-            "Result": "Pass",
-            "run_id": "rid-252",
-            "test_case_id": "TC-F-FVM-984-31"
-        },
-        {
-            "Executed_By": "Robot_Unit_09",
-            "Execution_Date": "18-05-2025 20:55",
-            "Observed_Time": 1371,
-            "Remarks": "Test Passed Smoothly",
-            "Result": "Pass",
-            "run_id": "rid-255",
-            "test_case_id": "TC-F-ALL-484-26"
-        },
-        {
-            "Executed_By": "Robot_Unit_01",
-            "Execution_Date": "22-05-2025 15:12",
-            "Observed_Time": 3863,
-            "Remarks": "Test Passed Smoothly",
-            "Result": "Fail",
-            "run_id": "rid-260",
-            "test_case_id": "TC-F-ALL-908-92"
-        },
-        {
-            "Executed_By": "Robot_Unit_05",
-            "Execution_Date": "22-05-2025 13:55",
-            "Observed_Time": 2673,
-            "Remarks": "Card Not Detected",
-            "Result": "Pass",
-            "run_id": "rid-285",
-            "test_case_id": "TC-F-ALL-359-32"
-        },
-        {
-            "Executed_By": "Robot_Unit_05",
-            "Execution_Date": "22-05-2025 13:55",
-            "Observed_Time": 5640,
-            "Remarks": "Card Not Detected",
-            "Result": "Fail",
-            "run_id": "rid-298",
-            "test_case_id": "TC-F-FVM-041-26"
-        },
-        {
-            "Executed_By": "Robot_Unit_09",
-            "Execution_Date": "21-05-2025 13:59",
-            "Observed_Time": 3226,
-            "Remarks": "All Steps Passed",
-            "Result": "Pass",
-            "run_id": "rid-305",
-            "test_case_id": "TC-F-GATE-READER-503-05"
-        },
-        {
-            "Executed_By": "Robot_Unit_01",
-            "Execution_Date": "21-05-2025 13:59",
-            "Observed_Time": 7558,
-            "Remarks": "Minor Delay Observed",
-            "Result": "Pass",
-            "run_id": "rid-310",
-            "test_case_id": "TC-F-FVM-143-72"
-        },
-        {
-            "Executed_By": "Robot_Unit_04",
-            "Execution_Date": "16-05-2025 15:52",
-            "Observed_Time": 2524,
-            "Remarks": "Card Not Detected",
-            "Result": "Pass",
-            "run_id": "rid-311",
-            "test_case_id": "TC-F-GATE-READER-945-70"
-        },
-        {
-            "Executed_By": "Robot_Unit_01",
-            "Execution_Date": "16-05-2025 15:52",
-            "Observed_Time": 6964,
-            "Remarks": "Mechanical Arm Misaligned",
-            "Result": "Pass",
-            "run_id": "rid-312",
-            "test_case_id": "TC-F-GATE-READER-945-70"
-        },
-        {
-            "Executed_By": "Robot_Unit_08",
-            "Execution_Date": "18-05-2025 20:55",
-            "Observed_Time": 9677,
-            "Remarks": "Mechanical Arm Misaligned",
-            "Result": "Pass",
-            "run_id": "rid-320",
-            "test_case_id": "TC-F-BUS-READER-429-13"
-        },
-        {
-            "Executed_By": "Robot_Unit_05",
-            "Execution_Date": "22-05-2025 15:12",
-            "Observed_Time": 1423,
-            "Remarks": "Incorrect result shown",
-            "Result": "Pass",
-            "run_id": "rid-323",
-            "test_case_id": "TC-F-GATE-READER-943-41"
-        },
-        {
-            "Executed_By": "Robot_Unit_02",
-            "Execution_Date": "18-05-2025 20:55",
-            "Observed_Time": 8198,
-            "Remarks": "Mechanical Arm Misaligned",
-            "Result": "Fail",
-            "run_id": "rid-324",
-            "test_case_id": "TC-F-GATE-READER-042-19"
-        },
-        {
-            "Executed_By": "Robot_Unit_01",
-            "Execution_Date": "16-05-2025 15:52",
-            "Observed_Time": 6141,
-            "Remarks": "Mechanical Arm Misaligned",
-            "Result": "Fail",
-            "run_id": "rid-327",
-            "test_case_id": "TC-F-BUS-READER-474-04"
-        },
-        {
-            "Executed_By": "Robot_Unit_05",
-            "Execution_Date": "22-05-2025 13:55",
-            "Observed_Time": 9928,
-            "Remarks": "All Steps Passed",
-            "Result": "Fail",
-            "run_id": "rid-331",
-            "test_case_id": "TC-NF-GATE-415-95"
-        },
-        {
-            "Executed_By": "Robot_Unit_06",
-            "Execution_Date": "18-05-2025 20:55",
-            "Observed_Time": 8000,
-            "Remarks": "Incorrect result shown",
-            "Result": "Fail",
-            "run_id": "rid-344",
-            "test_case_id": "TC-F-FVM-276-27"
-        },
-        {
-            "Executed_By": "Robot_Unit_09",
-            "Execution_Date": "21-05-2025 13:59",
-            "Observed_Time": 3780,
-            "Remarks": "Screen not responsive",
-            "Result": "Pass",
-            "run_id": "rid-354",
-            "test_case_id": "TC-F-BUS-READER-828-21"
-        },
-        {
-            "Executed_By": "Robot_Unit_09",
-            "Execution_Date": "22-05-2025 13:55",
-            "Observed_Time": 2802,
-            "Remarks": "Card Not Detected",
-            "Result": "Fail",
-            "run_id": "rid-361",
-            "test_case_id": "TC-F-BUS-READER-405-48"
-        },
-        {
-            "Executed_By": "Robot_Unit_04",
-            "Execution_Date": "21-05-2025 13:59",
-            "Observed_Time": 8622,
-            "Remarks": "Mechanical Arm Misaligned",
-            "Result": "Pass",
-            "run_id": "rid-370",
-            "test_case_id": "TC-F-GATE-READER-949-33"
-        },
-        {
-            "Executed_By": "Robot_Unit_09",
-            "Execution_Date": "22-05-2025 13:55",
-            "Observed_Time": 9779,
-            "Remarks": "Mechanical Arm Misaligned",
-            "Result": "Fail",
-            "run_id": "rid-371",
-            "test_case_id": "TC-F-BUS-READER-546-93"
-        },
-        {
-            "Executed_By": "Robot_Unit_02",
-            "Execution_Date": "22-05-2025 15:12",
-            "Observed_Time": 3897,
-            "Remarks": "Incorrect result shown",
-            "Result": "Fail",
-            "run_id": "rid-373",
-            "test_case_id": "TC-F-ALL-045-41"
-        },
-        {
-            "Executed_By": "Robot_Unit_01",
-            "Execution_Date": "22-05-2025 15:12",
-            "Observed_Time": 799,
-            "Remarks": "Minor Delay Observed",
-            "Result": "Fail",
-            "run_id": "rid-384",
-            "test_case_id": "TC-F-BUS-READER-510-77"
-        },
-        {
-            "Executed_By": "Robot_Unit_04",
-            "Execution_Date": "16-05-2025 15:52",
-            "Observed_Time": 2980,
-            "Remarks": "Card Not Detected",
-            "Result": "Pass",
-            "run_id": "rid-407",
-            "test_case_id": "TC-F-ALL-249-22"
-        },
-        {
-            "Executed_By": "Robot_Unit_08",
-            "Execution_Date": "22-05-2025 13:55",
-            "Observed_Time": 1571,
-            "Remarks": "All Steps Passed",
-            "Result": "Fail",
-            "run_id": "rid-438",
-            "test_case_id": "TC-F-FVM-521-52"
-        },
-        {
-            "Executed_By": "Robot_Unit_05",
-            "Execution_Date": "22-05-2025 13:55",
-            "Observed_Time": 9792,
-            "Remarks": "Screen not responsive",
-            "Result": "Pass",
-            "run_id": "rid-468",
-            "test_case_id": "TC-F-FVM-740-91"
-        },
-        {
-            "Executed_By": "Robot_Unit_01",
-            "Execution_Date": "16-05-2025 15:58",
-            "Observed_Time": 2040,
-            "Remarks": "Incorrect result shown",
-            "Result": "Fail",
-            "run_id": "rid-476",
-            "test_case_id": "TC-F-FVM-192-31"
-        },
-        {
-            "Executed_By": "Robot_Unit_00",
-            "Execution_Date": "16-05-2025 15:58",
-            "Observed_Time": 8789,
-            "Remarks": "Test Passed Smoothly",
-            "Result": "Fail",
-            "run_id": "rid-494",
-            "test_case_id": "TC-F-FVM-658-00"
-        },
-        {
-            "Executed_By": "Robot_Unit_08",
-            "Execution_Date": "21-05-2025 13:59",
-            "Observed_Time": 1470,
-            "Remarks": "Mechanical Arm Misaligned",
-            "Result": "Pass",
-            "run_id": "rid-497",
-            "test_case_id": "TC-F-FVM-278-73"
-        },
-        {
-            "Executed_By": "Robot_Unit_08",
-            "Execution_Date": "21-05-2025 13:59",
-            "Observed_Time": 5656,
-            "Remarks": "Incorrect result shown",
-            "Result": "Pass",
-            "run_id": "rid-525",
-            "test_case_id": "TC-F-GATE-READER-949-33"
-        },
-        {
-            "Executed_By": "Robot_Unit_03",
-            "Execution_Date": "18-05-2025 20:55",
-            "Observed_Time": 8413,
-            "Remarks": "Screen not responsive",
-            "Result": "Fail",
-            "run_id": "rid-527",
-            "test_case_id": "TC-F-GATE-READER-042-19"
-        },
-        {
-            "Executed_By": "Robot_Unit_06",
-            "Execution_Date": "16-05-2025 15:52",
-            "Observed_Time": 7326,
-            "Remarks": "Card Not Detected",
-            "Result": "Fail",
-            "run_id": "rid-529",
-            "test_case_id": "TC-NF-GATE-490-62"
-        },
-        {
-            "Executed_By": "Robot_Unit_01",
-            "Execution_Date": "18-05-2025 20:55",
-            "Observed_Time": 722,
-            "Remarks": "Minor Delay Observed",
-            "Result": "Fail",
-            "run_id": "rid-542",
-            "test_case_id": "TC-F-GATE-READER-814-42"
-        },
-        {
-            "Executed_By": "Robot_Unit_00",
-            "Execution_Date": "22-05-2025 15:12",
-            "Observed_Time": 8997,
-            "Remarks": "All Steps Passed",
-            "Result": "Pass",
-            "run_id": "rid-544",
-            "test_case_id": "TC-F-BUS-READER-510-77"
-        },
-        {
-            "Executed_By": "Robot_Unit_03",
-            "Execution_Date": "22-05-2025 15:12",
-            "Observed_Time": 5621,
-            "Remarks": "Minor Delay Observed",
-            "Result": "Pass",
-            "run_id": "rid-547",
-            "test_case_id": "TC-NF-GATE-278-16"
-        },
-        {
-            "Executed_By": "Robot_Unit_06",
-            "Execution_Date": "21-05-2025 13:59",
-            "Observed_Time": 9725,
-            "Remarks": "Screen not responsive",
-            "Result": "Pass",
-            "run_id": "rid-561",
-            "test_case_id": "TC-F-ALL-018-34"
-        },
-        {
-            "Executed_By": "Robot_Unit_05",
-            "Execution_Date": "22-05-2025 15:12",
-            "Observed_Time": 948,
-            "Remarks": "All Steps Passed",
-            "Result": "Pass",
-            "run_id": "rid-570",
-            "test_case_id": "TC-F-FVM-154-39"
-        },
-        {
-            "Executed_By": "Robot_Unit_01",
-            "Execution_Date": "16-05-2025 15:52",
-            "Observed_Time": 3709,
-            "Remarks": "Test Passed Smoothly",
-            "Result": "Fail",
-            "run_id": "rid-575",
-            "test_case_id": "TC-F-GATE-READER-094-26"
-        },
-        {
-            "Executed_By": "Robot_Unit_03",
-            "Execution_Date": "18-05-2025 20:55",
-            "Observed_Time": 935,
-            "Remarks": "All Steps Passed",
-            "Result": "Pass",
-            "run_id": "rid-580",
-            "test_case_id": "TC-F-FVM-361-74"
-        },
-        {
-            "Executed_By": "Robot_Unit_00",
-            "Execution_Date": "16-05-2025 15:52",
-            "Observed_Time": 9469,
-            "Remarks": "Test Passed Smoothly",
-            "Result": "Pass",
-            "run_id": "rid-584",
-            "test_case_id": "TC-NF-GATE-490-62"
-        },
-        {
-            "Executed_By": "Robot_Unit_00",
-            "Execution_Date": "18-05-2025 20:55",
-            "Observed_Time": 8004,
-            "Remarks": "Incorrect result shown",
-            "Result": "Fail",
-            "run_id": "rid-586",
-            "test_case_id": "TC-F-GATE-READER-498-53"
-        },
-        {
-            "Executed_By": "Robot_Unit_09",
-            "Execution_Date": "16-05-2025 15:58",
-            "Observed_Time": 914,
-            "Remarks": "Card Not Detected",
-            "Result": "Pass",
-            "run_id": "rid-590",
-            "test_case_id": "TC-F-FVM-192-31"
-        },
-        {
-            "Executed_By": "Robot_Unit_06",
-            "Execution_Date": "22-05-2025 13:55",
-            "Observed_Time": 4959,
-            "Remarks": "Screen not responsive",
-            "Result": "Fail",
-            "run_id": "rid-591",
-            "test_case_id": "TC-F-GATE-READER-144-94"
-        },
-        {
-            "Executed_By": "Robot_Unit_08",
-            "Execution_Date": "22-05-2025 13:55",
-            "Observed_Time": 4122,
-            "Remarks": "Incorrect result shown",
-            "Result": "Pass",
-            "run_id": "rid-595",
-            "test_case_id": "TC-F-GATE-READER-411-72"
-        },
-        {
-            "Executed_By": "Robot_Unit_00",
-            "Execution_Date": "22-05-2025 13:55",
-            "Observed_Time": 4244,
-            "Remarks": "Mechanical Arm Misaligned",
-            "Result": "Fail",
-            "run_id": "rid-605",
-            "test_case_id": "TC-F-GATE-READER-576-55"
-        },
-        {
-            "Executed_By": "Robot_Unit_00",
-            "Execution_Date": "21-05-2025 13:59",
-            "Observed_Time": 4638,
-            "Remarks": "Screen not responsive",
-            "Result": "Fail",
-            "run_id": "rid-606",
-            "test_case_id": "TC-F-GATE-READER-949-33"
-        },
-        {
-            "Executed_By": "Robot_Unit_05",
-            "Execution_Date": "21-05-2025 13:59",
-            "Observed_Time": 5042,
-            "Remarks": "Incorrect result shown",
-            "Result": "Fail",
-            "run_id": "rid-609",
-            "test_case_id": "TC-F-GATE-READER-949-33"
-        },
-        {
-            "Executed_By": "Robot_Unit_03",
-            "Execution_Date": "21-05-2025 13:59",
-            "Observed_Time": 3852,
-            "Remarks": "Minor Delay Observed",
-            "Result": "Fail",
-            "run_id": "rid-614",
-            "test_case_id": "TC-F-FVM-502-23"
-        },
-        {
-            "Executed_By": "Robot_Unit_00",
-            "Execution_Date": "22-05-2025 15:12",
-            "Observed_Time": 9335,
-            "Remarks": "Mechanical Arm Misaligned",
-            "Result": "Fail",
-            "run_id": "rid-617",
-            "test_case_id": "TC-F-FVM-699-62"
-        },
-        {
-            "Executed_By": "Robot_Unit_01",
-            "Execution_Date": "16-05-2025 15:52",
-            "Observed_Time": 4625,
-            "Remarks": "Card Not Detected",
-            "Result": "Pass",
-            "run_id": "rid-619",
-            "test_case_id": "TC-F-GATE-READER-972-23"
-        },
-        {
-            "Executed_By": "Robot_Unit_06",
-            "Execution_Date": "22-05-2025 15:12",
-            "Observed_Time": 4876,
-            "Remarks": "Card Not Detected",
-            "Result": "Fail",
-            "run_id": "rid-620",
-            "test_case_id": "TC-F-GATE-READER-430-77"
-        },
-        {
-            "Executed_By": "Robot_Unit_05",
-            "Execution_Date": "16-05-2025 15:52",
-            "Observed_Time": 6760,
-            "Remarks": "Screen not responsive",
-            "Result": "Fail",
-            "run_id": "rid-621",
-            "test_case_id": "TC-F-BUS-READER-530-28"
-        },
-        {
-            "Executed_By": "Robot_Unit_04",
-            "Execution_Date": "22-05-2025 15:12",
-            "Observed_Time": 6114,
-            "Remarks": "Card Not Detected",
-            "Result": "Pass",
-            "run_id": "rid-622",
-            "test_case_id": "TC-F-GATE-READER-942-22"
-        },
-        {
-            "Executed_By": "Robot_Unit_06",
-            "Execution_Date": "21-05-2025 13:59",
-            "Observed_Time": 3442,
-            "Remarks": "All Steps Passed",
-            "Result": "Fail",
-            "run_id": "rid-631",
-            "test_case_id": "TC-NF-GATE-465-11"
-        },
-        {
-            "Executed_By": "Robot_Unit_06",
-            "Execution_Date": "16-05-2025 15:52",
-            "Observed_Time": 1224,
-            "Remarks": "Minor Delay Observed",
-            "Result": "Fail",
-            "run_id": "rid-634",
-            "test_case_id": "TC-F-BUS-READER-474-04"
-        },
-        {
-            "Executed_By": "Robot_Unit_05",
-            "Execution_Date": "22-05-2025 13:55",
-            "Observed_Time": 1305,
-            "Remarks": "All Steps Passed",
-            "Result": "Fail",
-            "run_id": "rid-639",
-            "test_case_id": "TC-F-ALL-359-32"
-        },
-        {
-            "Executed_By": "Robot_Unit_01",
-            "Execution_Date": "18-05-2025 20:55",
-            "Observed_Time": 9506,
-            "Remarks": "Test Passed Smoothly",
-            "Result": "Fail",
-            "run_id": "rid-663",
-            "test_case_id": "TC-F-FVM-215-86"
-        },
-        {
-            "Executed_By": "Robot_Unit_00",
-            "Execution_Date": "16-05-2025 15:58",
-            "Observed_Time": 6481,
-            "Remarks": "All Steps Passed",
-            "Result": "Pass",
-            "run_id": "rid-670",
-            "test_case_id": "TC-F-GATE-READER-930-50"
-        },
-        {
-            "Executed_By": "Robot_Unit_01",
-            "Execution_Date": "21-05-2025 13:59",
-            "Observed_Time": 9763,
-            "Remarks": "Screen not responsive",
-            "Result": "Pass",
-            "run_id": "rid-673",
-            "test_case_id": "TC-F-GATE-READER-797-68"
-        },
-        {
-            "Executed_By": "Robot_Unit_08",
-            "Execution_Date": "21-05-2025 13:59",
-            "Observed_Time": 2592,
-            "Remarks": "Card Not Detected",
-            "Result": "Fail",
-            "run_id": "rid-677",
-            "test_case_id": "TC-F-ALL-018-34"
-        },
-        {
-            "Executed_By": "Robot_Unit_07",
-            "Execution_Date": "22-05-2025 13:55",
-            "Observed_Time": 8428,
-            "Remarks": "Test Passed Smoothly",
-            "Result": "Fail",
-            "run_id": "rid-680",
-            "test_case_id": "TC-F-BUS-READER-546-93"
-        },
-        {
-            "Executed_By": "Robot_Unit_07",
-            "Execution_Date": "22-05-2025 13:55",
-            "Observed_Time": 5082,
-            "Remarks": "Test Passed Smoothly",
-            "Result": "Pass",
-            "run_id": "rid-689",
-            "test_case_id": "TC-F-GATE-READER-133-22"
-        },
-        {
-            "Executed_By": "Robot_Unit_03",
-            "Execution_Date": "21-05-2025 13:59",
-            "Observed_Time": 226,
-            "Remarks": "All Steps Passed",
-            "Result": "Pass",
-            "run_id": "rid-690",
-            "test_case_id": "TC-F-ALL-018-34"
-        },
-        {
-            "Executed_By": "Robot_Unit_07",
-            "Execution_Date": "18-05-2025 20:55",
-            "Observed_Time": 1794,
-            "Remarks": "Incorrect result shown",
-            "Result": "Pass",
-            "run_id": "rid-691",
-            "test_case_id": "TC-F-BUS-READER-915-08"
-        },
-        {
-            "Executed_By": "Robot_Unit_09",
-            "Execution_Date": "22-05-2025 15:12",
-            "Observed_Time": 4612,
-            "Remarks": "Test Passed Smoothly",
-            "Result": "Fail",
-            "run_id": "rid-695",
-            "test_case_id": "TC-F-FVM-863-55"
-        },
-        {
-            "Executed_By": "Robot_Unit_04",
-            "Execution_Date": "16-05-2025 15:52",
-            "Observed_Time": 7305,
-            "Remarks": "Screen not responsive",
-            "Result": "Fail",
-            "run_id": "rid-706",
-            "test_case_id": "TC-F-FVM-453-97"
-        },
-        {
-            "Executed_By": "Robot_Unit_05",
-            "Execution_Date": "22-05-2025 15:12",
-            "Observed_Time": 9153,
-            "Remarks": "Mechanical Arm Misaligned",
-            "Result": "Pass",
-            "run_id": "rid-709",
-            "test_case_id": "TC-F-ALL-045-41"
-        },
-        {
-            "Executed_By": "Robot_Unit_00",
-            "Execution_Date": "16-05-2025 15:52",
-            "Observed_Time": 5265,
-            "Remarks": "Test Passed Smoothly",
-            "Result": "Pass",
-            "run_id": "rid-720",
-            "test_case_id": "TC-F-GATE-READER-972-23"
-        },
-        {
-            "Executed_By": "Robot_Unit_05",
-            "Execution_Date": "16-05-2025 15:58",
-            "Observed_Time": 2680,
-            "Remarks": "Test Passed Smoothly",
-            "Result": "Fail",
-            "run_id": "rid-725",
-            "test_case_id": "TC-F-GATE-READER-930-50"
-        },
-        {
-            "Executed_By": "Robot_Unit_04",
-            "Execution_Date": "16-05-2025 15:58",
-            "Observed_Time": 2218,
-            "Remarks": "Incorrect result shown",
-            "Result": "Pass",
-            "run_id": "rid-755",
-            "test_case_id": "TC-NF-GATE-863-86"
-        },
-        {
-            "Executed_By": "Robot_Unit_03",
-            "Execution_Date": "22-05-2025 15:12",
-            "Observed_Time": 4792,
-            "Remarks": "All Steps Passed",
-            "Result": "Fail",
-            "run_id": "rid-764",
-            "test_case_id": "TC-F-BUS-READER-510-77"
-        },
-        {
-            "Executed_By": "Robot_Unit_09",
-            "Execution_Date": "22-05-2025 15:12",
-            "Observed_Time": 8706,
-            "Remarks": "Minor Delay Observed",
-            "Result": "Pass",
-            "run_id": "rid-778",
-            "test_case_id": "TC-F-BUS-READER-257-07"
-        },
-        {
-            "Executed_By": "Robot_Unit_03",
-            "Execution_Date": "16-05-2025 15:52",
-            "Observed_Time": 3936,
-            "Remarks": "All Steps Passed",
-            "Result": "Pass",
-            "run_id": "rid-786",
-            "test_case_id": "TC-F-BUS-READER-530-28"
-        },
-        {
-            "Executed_By": "Robot_Unit_01",
-            "Execution_Date": "18-05-2025 20:55",
-            "Observed_Time": 2557,
-            "Remarks": "Incorrect result shown",
-            "Result": "Fail",
-            "run_id": "rid-793",
-            "test_case_id": "TC-F-BUS-READER-915-08"
-        },
-        {
-            "Executed_By": "Robot_Unit_04",
-            "Execution_Date": "16-05-2025 15:58",
-            "Observed_Time": 6235,
-            "Remarks": "Test Passed Smoothly",
-            "Result": "Pass",
-            "run_id": "rid-798",
-            "test_case_id": "TC-F-GATE-READER-305-46"
-        },
-        {
-            "Executed_By": "Robot_Unit_09",
-            "Execution_Date": "22-05-2025 13:55",
-            "Observed_Time": 8787,
-            "Remarks": "All Steps Passed",
-            "Result": "Pass",
-            "run_id": "rid-813",
-            "test_case_id": "TC-F-GATE-READER-133-22"
-        },
-        {
-            "Executed_By": "Robot_Unit_08",
-            "Execution_Date": "21-05-2025 13:59",
-            "Observed_Time": 4881,
-            "Remarks": "Incorrect result shown",
-            "Result": "Pass",
-            "run_id": "rid-820",
-            "test_case_id": "TC-NF-GATE-175-15"
-        },
-        {
-            "Executed_By": "Robot_Unit_04",
-            "Execution_Date": "22-05-2025 15:12",
-            "Observed_Time": 5944,
-            "Remarks": "All Steps Passed",
-            "Result": "Fail",
-            "run_id": "rid-821",
-            "test_case_id": "TC-F-FVM-176-78"
-        },
-        {
-            "Executed_By": "Robot_Unit_04",
-            "Execution_Date": "22-05-2025 13:55",
-            "Observed_Time": 5005,
-            "Remarks": "Mechanical Arm Misaligned",
-            "Result": "Fail",
-            "run_id": "rid-828",
-            "test_case_id": "TC-F-GATE-READER-059-92"
-        },
-        {
-            "Executed_By": "Robot_Unit_06",
-            "Execution_Date": "16-05-2025 15:58",
-            "Observed_Time": 9055,
-            "Remarks": "Incorrect result shown",
-            "Result": "Fail",
-            "run_id": "rid-832",
-            "test_case_id": "TC-F-FVM-815-57"
-        },
-        {
-            "Executed_By": "Robot_Unit_07",
-            "Execution_Date": "18-05-2025 20:55",
-            "Observed_Time": 3360,
-            "Remarks": "Minor Delay Observed",
-            "Result": "Pass",
-            "run_id": "rid-834",
-            "test_case_id": "TC-F-GATE-READER-254-27"
-        },
-        {
-            "Executed_By": "Robot_Unit_06",
-            "Execution_Date": "16-05-2025 15:52",
-            "Observed_Time": 9961,
-            "Remarks": "Incorrect result shown",
-            "Result": "Pass",
-            "run_id": "rid-838",
-            "test_case_id": "TC-F-FVM-453-97"
-        },
-        {
-            "Executed_By": "Robot_Unit_09",
-            "Execution_Date": "16-05-2025 15:52",
-            "Observed_Time": 2174,
-            "Remarks": "All Steps Passed",
-            "Result": "Fail",
-            "run_id": "rid-839",
-            "test_case_id": "TC-F-GATE-READER-754-53"
-        },
-        {
-            "Executed_By": "Robot_Unit_01",
-            "Execution_Date": "22-05-2025 13:55",
-            "Observed_Time": 3674,
-            "Remarks": "All Steps Passed",
-            "Result": "Pass",
-            "run_id": "rid-844",
-            "test_case_id": "TC-F-FVM-372-76"
-        },
-        {
-            "Executed_By": "Robot_Unit_01",
-            "Execution_Date": "22-05-2025 13:55",
-            "Observed_Time": 8299,
-            "Remarks": "All Steps Passed",
-            "Result": "Pass",
-            "run_id": "rid-849",
-            "test_case_id": "TC-F-FVM-041-26"
-        },
-        {
-            "Executed_By": "Robot_Unit_05",
-            "Execution_Date": "16-05-2025 15:52",
-            "Observed_Time": 1179,
-            "Remarks": "Card Not Detected",
-            "Result": "Fail",
-            "run_id": "rid-872",
-            "test_case_id": "TC-F-BUS-READER-530-28"
-        },
-        {
-            "Executed_By": "Robot_Unit_01",
-            "Execution_Date": "18-05-2025 20:55",
-            "Observed_Time": 1534,
-            "Remarks": "Mechanical Arm Misaligned",
-            "Result": "Fail",
-            "run_id": "rid-888",
-            "test_case_id": "TC-F-BUS-READER-207-51"
-        },
-        {
-            "Executed_By": "Robot_Unit_09",
-            "Execution_Date": "22-05-2025 15:12",
-            "Observed_Time": 7227,
-            "Remarks": "Test Passed Smoothly",
-            "Result": "Fail",
-            "run_id": "rid-894",
-            "test_case_id": "TC-F-BUS-READER-053-68"
-        },
-        {
-            "Executed_By": "Robot_Unit_06",
-            "Execution_Date": "16-05-2025 15:52",
-            "Observed_Time": 7443,
-            "Remarks": "Test Passed Smoothly",
-            "Result": "Pass",
-            "run_id": "rid-899",
-            "test_case_id": "TC-F-GATE-READER-334-81"
-        },
-        {
-            "Executed_By": "Robot_Unit_03",
-            "Execution_Date": "16-05-2025 15:58",
-            "Observed_Time": 2185,
-            "Remarks": "Card Not Detected",
-            "Result": "Fail",
-            "run_id": "rid-925",
-            "test_case_id": "TC-F-FVM-815-57"
-        },
-        {
-            "Executed_By": "Robot_Unit_02",
-            "Execution_Date": "22-05-2025 13:55",
-            "Observed_Time": 3683,
-            "Remarks": "Screen not responsive",
-            "Result": "Fail",
-            "run_id": "rid-931",
-            "test_case_id": "TC-F-FVM-521-52"
-        },
-        {
-            "Executed_By": "Robot_Unit_07",
-            "Execution_Date": "18-05-2025 20:55",
-            "Observed_Time": 9842,
-            "Remarks": "Mechanical Arm Misaligned",
-            "Result": "Pass",
-            "run_id": "rid-938",
-            "test_case_id": "TC-F-BUS-READER-915-08"
-        },
-        {
-            "Executed_By": "Robot_Unit_08",
-            "Execution_Date": "21-05-2025 13:59",
-            "Observed_Time": 9762,
-            "Remarks": "Card Not Detected",
-            "Result": "Pass",
-            "run_id": "rid-959",
-            "test_case_id": "TC-F-GATE-READER-949-33"
-        },
-        {
-            "Executed_By": "Robot_Unit_08",
-            "Execution_Date": "18-05-2025 20:55",
-            "Observed_Time": 661,
-            "Remarks": "All Steps Passed",
-            "Result": "Fail",
-            "run_id": "rid-970",
-            "test_case_id": "TC-F-BUS-READER-915-08"
-        }
-    ]))
-    return add_cors_headers(response)
+    if request.method == 'POST':
+        return upload_response('testruns')
+    return collection_response('testruns')
 
-@app.route('/mock_testrail/defects', methods=['GET', 'OPTIONS'])
+@app.route('/mock_testrail/defects', methods=['GET', 'POST', 'OPTIONS'])
 def get_defects():
     if request.method == 'OPTIONS':
         return add_cors_headers(make_response())
-    response = make_response(jsonify([
-        {
-            "DefectID": "RT-10001",
-            "Severity": "Medium",
-            "Status": "In-Progress",
-            "Test_Case_ID": "TC-NF-GATE-728-87",
-            "Title": "Screen Freeze During Payment",
-            "created_at": "2025-05-22 15:12:13",
-            "fixed_at": "2025-06-20 07:56:13",
-            "reported_by": "qa_user_02"
-        },
-        {
-            "DefectID": "RT-10002",
-            "Severity": "Medium",
-            "Status": "In-Progress",
-            "Test_Case_ID": "TC-F-FVM-154-39",
-            "Title": "NFC Module Not Initializing",
-            "created_at": "2025-05-22 15:12:13",
-            "fixed_at": "2025-06-03 10:47:13",
-            "reported_by": "qa_user_02"
-        },
-        {
-            "DefectID": "RT-10003",
-            "Severity": "Low",
-            "Status": "Resolved",
-            "Test_Case_ID": "TC-F-FVM-699-62",
-            "Title": "Wrong Fare Deducted",
-            "created_at": "2025-05-22 15:12:13",
-            "fixed_at": "2025-05-31 16:36:13",
-            "reported_by": "Robot_Unit_04"
-        },
-        {
-            "DefectID": "RT-10004",
-            "Severity": "High",
-            "Status": "Closed",
-            "Test_Case_ID": "TC-F-ALL-908-92",
-            "Title": "Gate shows GO on insufficient balance",
-            "created_at": "2025-05-22 15:12:13",
-            "fixed_at": "2025-06-17 18:36:13",
-            "reported_by": "qa_user_08"
-        },
-        {
-            "DefectID": "RT-10005",
-            "Severity": "High",
-            "Status": "In-Progress",
-            "Test_Case_ID": "TC-F-BUS-READER-053-68",
-            "Title": "Crash on selecting monthly pass",
-            "created_at": "2025-05-22 15:12:13",
-            "fixed_at": "2025-06-13 09:05:13",
-            "reported_by": "qa_user_02"
-        },
-        {
-            "DefectID": "RT-10006",
-            "Severity": "Medium",
-            "Status": "Open",
-            "Test_Case_ID": "TC-F-FVM-176-78",
-            "Title": "Screen Freeze During Payment",
-            "created_at": "2025-05-22 15:12:13",
-            "fixed_at": "2025-06-21 09:30:13",
-            "reported_by": "qa_user_02"
-        },
-        {
-            "DefectID": "RT-10007",
-            "Severity": "High",
-            "Status": "Closed",
-            "Test_Case_ID": "TC-F-GATE-READER-430-77",
-            "Title": "Gate shows GO on insufficient balance",
-            "created_at": "2025-05-22 15:12:13",
-            "fixed_at": "2025-06-18 11:04:13",
-            "reported_by": "qa_user_09"
-        },
-        {
-            "DefectID": "RT-10008",
-            "Severity": "High",
-            "Status": "Resolved",
-            "Test_Case_ID": "TC-F-GATE-READER-430-77",
-            "Title": "Wrong Fare Deducted",
-            "created_at": "2025-05-22 15:12:13",
-            "fixed_at": "2025-06-07 13:36:13",
-            "reported_by": "Robot_Unit_05"
-        },
-        {
-            "DefectID": "RT-10009",
-            "Severity": "High",
-            "Status": "In-Progress",
-            "Test_Case_ID": "TC-F-FVM-176-78",
-            "Title": "NFC Module Not Initializing",
-            "created_at": "2025-05-22 15:12:13",
-            "fixed_at": "2025-06-06 04:43:13",
-            "reported_by": "Robot_Unit_08"
-        },
-        {
-            "DefectID": "RT-10010",
-            "Severity": "Low",
-            "Status": "In-Progress",
-            "Test_Case_ID": "TC-F-GATE-READER-942-22",
-            "Title": "Incorrect Balance shown after reload",
-            "created_at": "2025-05-22 15:12:13",
-            "fixed_at": "2025-06-14 11:53:13",
-            "reported_by": "Robot_Unit_01"
-        }
-    ]))
-    return add_cors_headers(response)
+    if request.method == 'POST':
+        return upload_response('defects')
+    return collection_response('defects')
 
-@app.route('/mock_testrail/testtypesummary', methods=['GET', 'OPTIONS'])
+@app.route('/mock_testrail/testtypesummary', methods=['GET', 'POST', 'OPTIONS'])
 def get_test_type_summary():
     if request.method == 'OPTIONS':
         return add_cors_headers(make_response())
-    response = make_response(jsonify([
-        {
-            "Actual": "306ms",
-            "Expected": "<=249ms",
-            "Metrics": "Average Response Time",
-            "Status": "Pass",
-            "Test_Date": "2025-05-05",
-            "Test_Type": "Battery Drain Test - Robot"
-        },
-        {
-            "Actual": "66.74%",
-            "Expected": "<=86%",
-            "Metrics": "CPU Utilization",
-            "Status": "Pass",
-            "Test_Date": "2025-05-19",
-            "Test_Type": "Battery Drain Test - Robot"
-        },
-        {
-            "Actual": "0.31GB",
-            "Expected": "<=4.4GB",
-            "Metrics": "Memory Usage",
-            "Status": "Pass",
-            "Test_Date": "2025-05-04",
-            "Test_Type": "Battery Drain Test - Robot"
-        },
-        {
-            "Actual": "7.5s",
-            "Expected": "<234ms",
-            "Metrics": "Recovery Time From Crash",
-            "Status": "Pass",
-            "Test_Date": "2025-04-29",
-            "Test_Type": "Battery Drain Test - Robot"
-        },
-        {
-            "Actual": "99.98%",
-            "Expected": ">=62.62%",
-            "Metrics": "System Up time",
-            "Status": "Fail",
-            "Test_Date": "2025-05-01",
-            "Test_Type": "Battery Drain Test - Robot"
-        },
-        {
-            "Actual": "153ms",
-            "Expected": "<223ms",
-            "Metrics": "Average Response Time",
-            "Status": "Pass",
-            "Test_Date": "2025-05-03",
-            "Test_Type": "Latency Test - NFC Tap"
-        },
-        {
-            "Actual": "35.67%",
-            "Expected": "<=56%",
-            "Metrics": "Battery Usage per hour",
-            "Status": "Fail",
-            "Test_Date": "2025-05-01",
-            "Test_Type": "Latency Test - NFC Tap"
-        },
-        {
-            "Actual": "1486",
-            "Expected": ">=4114",
-            "Metrics": "Concurrent Sessions Handled",
-            "Status": "Pass",
-            "Test_Date": "2025-05-02",
-            "Test_Type": "Latency Test - NFC Tap"
-        },
-        {
-            "Actual": "1.89GB",
-            "Expected": "<=2.2GB",
-            "Metrics": "Memory Usage",
-            "Status": "Fail",
-            "Test_Date": "2025-04-28",
-            "Test_Type": "Latency Test - NFC Tap"
-        },
-        {
-            "Actual": "78ms",
-            "Expected": "<=452ms",
-            "Metrics": "Average Response Time",
-            "Status": "Pass",
-            "Test_Date": "2025-04-28",
-            "Test_Type": "Load Test - Gate Readers"
-        },
-        {
-            "Actual": "66.91%",
-            "Expected": "<=34%",
-            "Metrics": "CPU Utilization",
-            "Status": "Pass",
-            "Test_Date": "2025-05-09",
-            "Test_Type": "Load Test - Gate Readers"
-        },
-        {
-            "Actual": "2803",
-            "Expected": ">=4771",
-            "Metrics": "Concurrent Sessions Handled",
-            "Status": "Fail",
-            "Test_Date": "2025-04-27",
-            "Test_Type": "Load Test - Gate Readers"
-        },
-        {
-            "Actual": "5.5s",
-            "Expected": "<493ms",
-            "Metrics": "Recovery Time From Crash",
-            "Status": "Fail",
-            "Test_Date": "2025-05-13",
-            "Test_Type": "Load Test - Gate Readers"
-        },
-        {
-            "Actual": "99.03%",
-            "Expected": ">=22.22%",
-            "Metrics": "System Up time",
-            "Status": "Pass",
-            "Test_Date": "2025-05-05",
-            "Test_Type": "Load Test - Gate Readers"
-        },
-        {
-            "Actual": "73.04%",
-            "Expected": "<=63%",
-            "Metrics": "CPU Utilization",
-            "Status": "Pass",
-            "Test_Date": "2025-05-19",
-            "Test_Type": "Memory Usage Test - Controller"
-        },
-        {
-            "Actual": "213",
-            "Expected": ">=3532",
-            "Metrics": "Concurrent Sessions Handled",
-            "Status": "Pass",
-            "Test_Date": "2025-04-27",
-            "Test_Type": "Memory Usage Test - Controller"
-        },
-        {
-            "Actual": "2375",
-            "Expected": ">=1314",
-            "Metrics": "Max Transactions per hour",
-            "Status": "Fail",
-            "Test_Date": "2025-04-20",
-            "Test_Type": "Memory Usage Test - Controller"
-        },
-        {
-            "Actual": "21.46%",
-            "Expected": "<=49%",
-            "Metrics": "CPU Utilization",
-            "Status": "Fail",
-            "Test_Date": "2025-05-17",
-            "Test_Type": "Performance Test - FVM"
-        },
-        {
-            "Actual": "586",
-            "Expected": ">=4654",
-            "Metrics": "Max Transactions per hour",
-            "Status": "Fail",
-            "Test_Date": "2025-05-21",
-            "Test_Type": "Performance Test - FVM"
-        },
-        {
-            "Actual": "1.04GB",
-            "Expected": "<=3.3GB",
-            "Metrics": "Memory Usage",
-            "Status": "Pass",
-            "Test_Date": "2025-05-16",
-            "Test_Type": "Performance Test - FVM"
-        },
-        {
-            "Actual": "1.0s",
-            "Expected": "<154ms",
-            "Metrics": "Recovery Time From Crash",
-            "Status": "Pass",
-            "Test_Date": "2025-05-14",
-            "Test_Type": "Performance Test - FVM"
-        },
-        {
-            "Actual": "114ms",
-            "Expected": "<=257ms",
-            "Metrics": "Average Response Time",
-            "Status": "Fail",
-            "Test_Date": "2025-04-21",
-            "Test_Type": "Response Time Validation - All Devices"
-        },
-        {
-            "Actual": "225",
-            "Expected": ">=4192",
-            "Metrics": "Concurrent Sessions Handled",
-            "Status": "Fail",
-            "Test_Date": "2025-05-19",
-            "Test_Type": "Response Time Validation - All Devices"
-        },
-        {
-            "Actual": "4390",
-            "Expected": ">=2492",
-            "Metrics": "Max Transactions per hour",
-            "Status": "Fail",
-            "Test_Date": "2025-05-15",
-            "Test_Type": "Response Time Validation - All Devices"
-        },
-        {
-            "Actual": "99.62%",
-            "Expected": ">=46.46%",
-            "Metrics": "System Up time",
-            "Status": "Fail",
-            "Test_Date": "2025-05-07",
-            "Test_Type": "Response Time Validation - All Devices"
-        },
-        {
-            "Actual": "566ms",
-            "Expected": "<312ms",
-            "Metrics": "Transaction Completion Time",
-            "Status": "Fail",
-            "Test_Date": "2025-05-12",
-            "Test_Type": "Response Time Validation - All Devices"
-        },
-        {
-            "Actual": "266ms",
-            "Expected": "<293ms",
-            "Metrics": "Average Response Time",
-            "Status": "Fail",
-            "Test_Date": "2025-04-24",
-            "Test_Type": "Scalability Test-Backend"
-        },
-        {
-            "Actual": "55.05%",
-            "Expected": "<=36%",
-            "Metrics": "CPU Utilization",
-            "Status": "Fail",
-            "Test_Date": "2025-05-04",
-            "Test_Type": "Scalability Test-Backend"
-        },
-        {
-            "Actual": "4109",
-            "Expected": ">=2083",
-            "Metrics": "Max Transactions per hour",
-            "Status": "Pass",
-            "Test_Date": "2025-05-06",
-            "Test_Type": "Scalability Test-Backend"
-        },
-        {
-            "Actual": "6.9s",
-            "Expected": "<288ms",
-            "Metrics": "Recovery Time From Crash",
-            "Status": "Pass",
-            "Test_Date": "2025-05-11",
-            "Test_Type": "Scalability Test-Backend"
-        },
-        {
-            "Actual": "99.05%",
-            "Expected": ">=1.1%",
-            "Metrics": "System Up time",
-            "Status": "Pass",
-            "Test_Date": "2025-05-22",
-            "Test_Type": "Scalability Test-Backend"
-        },
-        {
-            "Actual": "3125",
-            "Expected": ">=2282",
-            "Metrics": "Concurrent Sessions Handled",
-            "Status": "Fail",
-            "Test_Date": "2025-05-01",
-            "Test_Type": "Stress Test-Bus Readers"
-        },
-        {
-            "Actual": "1.46GB",
-            "Expected": "<=2.2GB",
-            "Metrics": "Memory Usage",
-            "Status": "Pass",
-            "Test_Date": "2025-05-18",
-            "Test_Type": "Stress Test-Bus Readers"
-        },
-        {
-            "Actual": "3.3s",
-            "Expected": "<252ms",
-            "Metrics": "Recovery Time From Crash",
-            "Status": "Fail",
-            "Test_Date": "2025-04-29",
-            "Test_Type": "Stress Test-Bus Readers"
-        },
-        {
-            "Actual": "386ms",
-            "Expected": "<=420ms",
-            "Metrics": "Transaction Completion Time",
-            "Status": "Fail",
-            "Test_Date": "2025-04-26",
-            "Test_Type": "Stress Test-Bus Readers"
-        }
-    ]))
-    return add_cors_headers(response)
+    if request.method == 'POST':
+        return upload_response('testtypesummary')
+    return collection_response('testtypesummary')
 
-@app.route('/mock_testrail/transitmetricsdaily', methods=['GET', 'OPTIONS'])
+@app.route('/mock_testrail/transitmetricsdaily', methods=['GET', 'POST', 'OPTIONS'])
 def get_transit_metrics_daily():
     if request.method == 'OPTIONS':
         return add_cors_headers(make_response())
-    response = make_response(jsonify([
-        {
-            "Avg Response Time": 288,
-            "Bus Taps": 9145,
-            "Date": "2025-05-10",
-            "Defect Count": 7,
-            "FVM Transactions": 102,
-            "Gate Taps": 20741,
-            "Notes": "Data Incomplete Due to network Issue",
-            "Success Rate Bus": "91.61",
-            "Success Rate Gate": "92.64"
-        },
-        {
-            "Avg Response Time": 439,
-            "Bus Taps": 3387,
-            "Date": "2025-05-11",
-            "Defect Count": 6,
-            "FVM Transactions": 3183,
-            "Gate Taps": 10202,
-            "Notes": "Bus Taps Errors Observed",
-            "Success Rate Bus": "92.14",
-            "Success Rate Gate": "94.17"
-        },
-        {
-            "Avg Response Time": 221,
-            "Bus Taps": 3388,
-            "Date": "2025-05-12",
-            "Defect Count": 9,
-            "FVM Transactions": 195,
-            "Gate Taps": 2612,
-            "Notes": "Minor Delay in gate Readers",
-            "Success Rate Bus": "95.50",
-            "Success Rate Gate": "93.39"
-        },
-        {
-            "Avg Response Time": 164,
-            "Bus Taps": 1621,
-            "Date": "2025-05-13",
-            "Defect Count": 0,
-            "FVM Transactions": 9229,
-            "Gate Taps": 18961,
-            "Notes": "Minor Delay in gate Readers",
-            "Success Rate Bus": "93.63",
-            "Success Rate Gate": "94.69"
-        },
-        {
-            "Avg Response Time": 290,
-            "Bus Taps": 7296,
-            "Date": "2025-05-14",
-            "Defect Count": 2,
-            "FVM Transactions": 492,
-            "Gate Taps": 5395,
-            "Notes": "Data Incomplete Due to network Issue",
-            "Success Rate Bus": "99.84",
-            "Success Rate Gate": "99.76"
-        },
-        {
-            "Avg Response Time": 412,
-            "Bus Taps": 7579,
-            "Date": "2025-05-15",
-            "Defect Count": 1,
-            "FVM Transactions": 9323,
-            "Gate Taps": 22476,
-            "Notes": "Minor Delay in gate Readers",
-            "Success Rate Bus": "95.88",
-            "Success Rate Gate": "97.01"
-        },
-        {
-            "Avg Response Time": 87,
-            "Bus Taps": 5634,
-            "Date": "2025-05-16",
-            "Defect Count": 1,
-            "FVM Transactions": 9759,
-            "Gate Taps": 42895,
-            "Notes": "Minor Delay in gate Readers",
-            "Success Rate Bus": "95.70",
-            "Success Rate Gate": "95.81"
-        },
-        {
-            "Avg Response Time": 126,
-            "Bus Taps": 4791,
-            "Date": "2025-05-17",
-            "Defect Count": 3,
-            "FVM Transactions": 669,
-            "Gate Taps": 17784,
-            "Notes": "Bus Taps Errors Observed",
-            "Success Rate Bus": "90.94",
-            "Success Rate Gate": "95.49"
-        },
-        {
-            "Avg Response Time": 446,
-            "Bus Taps": 9971,
-            "Date": "2025-05-18",
-            "Defect Count": 8,
-            "FVM Transactions": 332,
-            "Gate Taps": 28939,
-            "Notes": "Data Incomplete Due to network Issue",
-            "Success Rate Bus": "90.98",
-            "Success Rate Gate": "92.19"
-        },
-        {
-            "Avg Response Time": 379,
-            "Bus Taps": 4851,
-            "Date": "2025-05-19",
-            "Defect Count": 7,
-            "FVM Transactions": 9376,
-            "Gate Taps": 16670,
-            "Notes": "Normal Operation",
-            "Success Rate Bus": "97.30",
-            "Success Rate Gate": "95.73"
-        },
-        {
-            "Avg Response Time": 154,
-            "Bus Taps": 5787,
-            "Date": "2025-05-20",
-            "Defect Count": 4,
-            "FVM Transactions": 807,
-            "Gate Taps": 1938,
-            "Notes": "Normal Operation",
-            "Success Rate Bus": "99.28",
-            "Success Rate Gate": "99.80"
-        },
-        {
-            "Avg Response Time": 333,
-            "Bus Taps": 5081,
-            "Date": "2025-05-21",
-            "Defect Count": 4,
-            "FVM Transactions": 420,
-            "Gate Taps": 30669,
-            "Notes": "Observed High Tap Volume at metro line 3",
-            "Success Rate Bus": "95.53",
-            "Success Rate Gate": "93.72"
-        },
-        {
-            "Avg Response Time": 215,
-            "Bus Taps": 2663,
-            "Date": "2025-05-22",
-            "Defect Count": 9,
-            "FVM Transactions": 9985,
-            "Gate Taps": 5400,
-            "Notes": "Few gate rejections due to hotlisted cards",
-            "Success Rate Bus": "91.39",
-            "Success Rate Gate": "92.06"
-        }
-    ]))
-    return add_cors_headers(response)
+    if request.method == 'POST':
+        return upload_response('transitmetricsdaily')
+    return collection_response('transitmetricsdaily')
 
-@app.route('/mock_testrail/requirements', methods=['GET', 'OPTIONS'])
+@app.route('/mock_testrail/requirements', methods=['GET', 'POST', 'OPTIONS'])
 def get_requirements():
     if request.method == 'OPTIONS':
         return add_cors_headers(make_response())
-    response = make_response(jsonify([
-        {
-            "component": "FVM",
-            "created_at": "Fri, 16 May 2025 10:28:19 GMT",
-            "description": "FVM should accept cash as payment method",
-            "jira_id": "JIRA-5802",
-            "priority": "Low",
-            "requirement_id": "BU-913",
-            "status": "Accepted",
-            "title": "FVM should accept Credit and Debit"
-        },
-        {
-            "component": "Gate Reader",
-            "created_at": "Wed, 21 May 2025 08:28:40 GMT",
-            "description": "FVM should allow refund option if transaction fails",
-            "jira_id": "JIRA-8519",
-            "priority": "Low",
-            "requirement_id": "BU-961",
-            "status": "Rejected",
-            "title": "Receipt should contain transaction ID, amount"
-        },
-        {
-            "component": "Bus Reader",
-            "created_at": "Fri, 16 May 2025 10:28:21 GMT",
-            "description": "FVM should show error messages for card read failures",
-            "jira_id": "JIRA-4953",
-            "priority": "High",
-            "requirement_id": "F-ALL-104",
-            "status": "In Review",
-            "title": "Gate Reader should be able to tap"
-        },
-        {
-            "component": "FVM",
-            "created_at": "Sun, 18 May 2025 15:25:07 GMT",
-            "description": "FVM should accept credit and debit cards as payment methods",
-            "jira_id": "JIRA-7775",
-            "priority": "Medium",
-            "requirement_id": "F-ALL-413",
-            "status": "Design Completed",
-            "title": "Gate reader should log every successful otp"
-        },
-        {
-            "component": "Bus Reader",
-            "created_at": "Fri, 16 May 2025 10:22:06 GMT",
-            "description": "Gate reader should retry backend sync every 30 seconds if offline",
-            "jira_id": "JIRA-9589",
-            "priority": "Low",
-            "requirement_id": "F-ALL-465",
-            "status": "Implementation Completed",
-            "title": "Bus reader should detect direction"
-        },
-        {
-            "component": "Bus Reader",
-            "created_at": "Fri, 16 May 2025 10:21:58 GMT",
-            "description": "Bus reader should detect direction of tap using GPS Zone",
-            "jira_id": "JIRA-9511",
-            "priority": "High",
-            "requirement_id": "F-ALL-744",
-            "title": "Gate reader should log every rejection"
-        },
-        {
-            "component": "ALL",
-            "created_at": "Fri, 16 May 2025 10:28:07 GMT",
-            "description": "Receipt should contain transaction ID, amount paid, card id, payment method, date and time",
-            "jira_id": "JIRA-6169",
-            "priority": "Low",
-            "requirement_id": "F-ALL-815",
-            "status": "Done",
-            "title": "Reject Invalid Card on Gate"
-        },
-        {
-            "component": "Gate Reader",
-            "created_at": "Sun, 18 May 2025 15:25:08 GMT",
-            "description": "FVM should lock screen when service mode is active",
-            "jira_id": "JIRA-9441",
-            "priority": "High",
-            "requirement_id": "F-ALL-837",
-            "status": "Testing Completed",
-            "title": "FVM should accept Credit and Debit"
-        },
-        {
-            "component": "ALL",
-            "created_at": "Fri, 16 May 2025 10:28:04 GMT",
-            "description": "Gate reader should be able to read DesFire,MiFare, credit card and barcode",
-            "jira_id": "JIRA-3109",
-            "priority": "Medium",
-            "requirement_id": "F-ALL-906",
-            "title": "FVM should retry card processing up"
-        },
-        {
-            "component": "Bus Reader",
-            "created_at": "Sun, 18 May 2025 15:25:07 GMT",
-            "description": "Receipt should contain transaction ID, amount paid, card id, payment method, date and time",
-            "jira_id": "JIRA-7860",
-            "priority": "High",
-            "requirement_id": "F-ALL-945",
-            "status": "Done",
-            "title": "Purchase TransitCard using FVM"
-        },
-        {
-            "component": "Gate Reader",
-            "created_at": "Fri, 16 May 2025 10:27:59 GMT",
-            "description": "Users should be able to check balance before purchase",
-            "jira_id": "JIRA-5829",
-            "priority": "Low",
-            "requirement_id": "F-BUS-102",
-            "status": "In Review",
-            "title": "FVM should accept Credit and Debit"
-        },
-        {
-            "component": "Bus Reader",
-            "created_at": "Fri, 16 May 2025 10:28:14 GMT",
-            "description": "User should be able to purchase a smartcard using FVM",
-            "jira_id": "JIRA-2604",
-            "priority": "Medium",
-            "requirement_id": "F-BUS-512",
-            "status": "In Review",
-            "title": "Fast transaction completion"
-        },
-        {
-            "component": "FVM",
-            "created_at": "Fri, 16 May 2025 10:22:08 GMT",
-            "description": "Bus reader should be able to determine entry vs exit taps",
-            "jira_id": "JIRA-4376",
-            "priority": "Medium",
-            "requirement_id": "F-BUS-645",
-            "status": "In Review",
-            "title": "FVM should retry card processing up"
-        },
-        {
-            "component": "Gate Reader",
-            "created_at": "Wed, 21 May 2025 08:28:52 GMT",
-            "description": "Bus reader should be able to determine entry vs exit taps",
-            "jira_id": "JIRA-6566",
-            "priority": "Medium",
-            "requirement_id": "F-BUS-784",
-            "status": "In Review",
-            "title": "Fast transaction completion"
+    if request.method == 'POST':
+        return upload_response('requirements')
+    return collection_response('requirements')
+
+@app.route('/mock_testrail/dashboard', methods=['GET', 'OPTIONS'])
+def get_dashboard():
+    if request.method == 'OPTIONS':
+        return add_cors_headers(make_response())
+    requested = request.args.get('collections')
+    names = requested.split(',') if requested else list(store.collections)
+    unknown = [name for name in names if name not in store]
+    if unknown:
+        return error_response('unknown collections: %s' % ', '.join(unknown))
+    try:
+        since = int(request.args.get('since', 0))
+    except ValueError:
+        return error_response('since must be a version number')
+    if not BOOT_VERSION <= since <= VERSION_CLOCK.issued:
+        # From another boot (or made up): send everything.
+        since = 0
+    names = [name for name in names if store[name].version > since]
+    encoding = negotiate_encoding()
+    etag = 'dashboard-%s-%s' % (BOOT_ID, '.'.join(str(store[name].version) for name in names) or '0')
+    if encoding != 'identity':
+        etag = '%s-%s' % (etag, encoding)
+    last_modified = max((store[name].modified_at for name in names), default=None)
+    return conditional_response(etag, last_modified, lambda: store.bundle(names, encoding), encoding)
+
+# Summary entry -> (collection, counter), mirroring the reductions that
+# DashboardApp.js runs over the full collections.
+SUMMARY_COUNTERS = {
+    'requirementStatusCounts': ('requirements', 'status'),
+    'defectStatusCounts': ('defects', 'status'),
+    'testRunResults': ('testruns', 'result'),
+    'testCaseStatusCounts': ('testcases', 'status'),
+    'testTypeStats': ('testtypesummary', 'status'),
+}
+
+@app.route('/mock_testrail/summary', methods=['GET', 'OPTIONS'])
+def get_summary():
+    if request.method == 'OPTIONS':
+        return add_cors_headers(make_response())
+    names = sorted({name for name, _ in SUMMARY_COUNTERS.values()})
+    etag = 'summary-%s-%s' % (BOOT_ID, '.'.join(str(store[name].version) for name in names))
+    last_modified = max(store[name].modified_at for name in names)
+
+    def build_body():
+        summary = {entry: dict(store[name].counters[counter].counts)
+                   for entry, (name, counter) in SUMMARY_COUNTERS.items()}
+        summary['totals'] = {name: len(store[name]) for name in names}
+        return app.json.dumps(summary, separators=(',', ':'))
+
+    return conditional_response(etag, last_modified, build_body)
+
+def run_columns(collection, categorical=(), integers=(), epochs=()):
+    """Copy live test run columns into NumPy arrays.
+
+    The copy is taken under the collection's write lock: a NumPy view
+    would pin the array buffers and make the next upload's extend fail.
+    Returns ``(columns, dictionaries)`` where categorical columns hold codes
+    into the matching dictionary values list.
+    """
+    rows = collection.rows
+    with collection.lock:
+        alive = np.frombuffer(rows.alive, dtype=np.uint8).astype(bool)
+        columns = {name: np.frombuffer(rows.categorical[name].data, dtype=np.uint32)[alive]
+                   for name in categorical}
+        columns.update({name: np.frombuffer(rows.integers[name], dtype=np.int64)[alive] for name in integers})
+        columns.update({name: np.frombuffer(rows.epochs[name], dtype=np.int64)[alive] for name in epochs})
+        dictionaries = {name: list(rows.categorical[name].values) for name in categorical}
+    return columns, dictionaries
+
+def latency_stats(values, groups, labels, edges):
+    """Per-group count/mean/percentiles/max and histogram in one sorted pass."""
+    low = int(values.min())
+    shift = max(int(values.max()) - low, 1).bit_length()
+    if shift + max(len(labels), 1).bit_length() <= 62:
+        # Pack (group, value) into one int64 so a single plain sort orders
+        # by group then value; an order of magnitude faster than lexsort.
+        packed = np.sort((groups << shift) | (values - low))
+        groups = packed >> shift
+        values = ((packed & ((1 << shift) - 1)) + low).astype(np.float64)
+    else:
+        order = np.lexsort((values, groups))
+        values = values[order].astype(np.float64)
+        groups = groups[order]
+    counts = np.bincount(groups, minlength=len(labels))
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    present = np.flatnonzero(counts)
+    sums = np.bincount(groups, weights=values, minlength=len(labels))
+    bins = np.clip(np.searchsorted(edges, values, side='right') - 1, 0, len(edges) - 2)
+    histograms = np.bincount(groups * (len(edges) - 1) + bins,
+                             minlength=len(labels) * (len(edges) - 1)).reshape(len(labels), -1)
+
+    def quantile(q):
+        position = starts[present] + q * (counts[present] - 1)
+        low = np.floor(position).astype(np.int64)
+        high = np.ceil(position).astype(np.int64)
+        return values[low] + (values[high] - values[low]) * (position - low)
+
+    p50, p90, p99 = quantile(0.5), quantile(0.9), quantile(0.99)
+    maxima = values[starts[present] + counts[present] - 1]
+    return {
+        labels[group]: {
+            'count': int(counts[group]),
+            'mean': round(float(sums[group] / counts[group]), 2),
+            'p50': round(float(p50[i]), 2),
+            'p90': round(float(p90[i]), 2),
+            'p99': round(float(p99[i]), 2),
+            'max': int(maxima[i]),
+            'histogram': histograms[group].tolist(),
+        }
+        for i, group in enumerate(present)
+    }
+
+LATENCY_GROUPS = ('Executed_By', 'Result', 'Component', 'none')
+
+@app.route('/mock_testrail/analytics/latency', methods=['GET', 'OPTIONS'])
+def get_latency_analytics():
+    if request.method == 'OPTIONS':
+        return add_cors_headers(make_response())
+    if np is None:
+        return error_response('latency analytics need numpy installed', 501)
+    group_by = request.args.get('group_by', 'Executed_By')
+    if group_by not in LATENCY_GROUPS:
+        return error_response('group_by must be one of %s' % ', '.join(LATENCY_GROUPS))
+    try:
+        bins = int(request.args.get('bins', 20))
+        start = parse_date_bound(request.args['date_from']) if request.args.get('date_from') else None
+        end = parse_date_bound(request.args['date_to'], True) if request.args.get('date_to') else None
+    except ValueError as exc:
+        return error_response(str(exc))
+    if not 1 <= bins <= 1000:
+        return error_response('bins must be between 1 and 1000')
+    collection = store['testruns']
+
+    def build_body():
+        categorical = {'Executed_By': ('Executed_By',), 'Result': ('Result',),
+                       'Component': ('test_case_id',), 'none': ()}[group_by]
+        columns, dictionaries = run_columns(collection, categorical, ('Observed_Time',), ('Execution_Date',))
+        values = columns['Observed_Time']
+        keep = values != MISSING_INT
+        if start is not None:
+            keep &= columns['Execution_Date'] >= start
+        if end is not None:
+            keep &= columns['Execution_Date'] <= end
+        values = values[keep]
+        if group_by == 'none':
+            labels = ['ALL']
+            groups = np.zeros(len(values), dtype=np.int64)
+        elif group_by == 'Component':
+            # Each test case ID code maps to a component code, kept next to
+            # the ID dictionary and only extended for IDs new since the last
+            # request; taken after the columns, so it covers every code in
+            # them. Each ID is converted just once, so skip component_of's
+            # LRU rather than flush it.
+            with collection.lock:
+                components = collection.rows.categorical['test_case_id'].derive(
+                    'component', component_of.__wrapped__)
+                labels = list(components.values)
+                lookup = np.frombuffer(components.data, dtype=np.uint32).astype(np.int64)
+            groups = lookup[columns['test_case_id'][keep]]
+        else:
+            labels = [str(value) for value in dictionaries[group_by]]
+            groups = columns[group_by][keep].astype(np.int64)
+        edges = np.histogram_bin_edges(values, bins=bins) if len(values) else np.linspace(0, 1, bins + 1)
+        result = {
+            'group_by': group_by,
+            'bin_edges': [round(float(edge), 2) for edge in edges],
+            'groups': latency_stats(values, groups, labels, edges) if len(values) else {},
+        }
+        return app.json.dumps(result, separators=(',', ':'))
+
+    return conditional_response(collection.etag(), collection.modified_at, build_body)
+
+@app.route('/mock_testrail/analytics/flaky', methods=['GET', 'OPTIONS'])
+def get_flaky_tests():
+    if request.method == 'OPTIONS':
+        return add_cors_headers(make_response())
+    try:
+        min_runs = int(request.args.get('min_runs', 3))
+        limit = int(request.args.get('limit', 50))
+    except ValueError:
+        return error_response('min_runs and limit must be integers')
+    if min_runs < 2 or not 0 < limit <= MAX_PAGE_SIZE:
+        return error_response('min_runs must be at least 2 and limit between 1 and %d' % MAX_PAGE_SIZE)
+    collection = store['testruns']
+
+    def build_body():
+        index = collection.derived['history']
+        candidates = [(group, runs, index.flips[group]) for group, runs in list(index.histories.items())
+                      if len(runs) >= min_runs and index.flips[group]]
+        ranked = heapq.nlargest(limit, candidates,
+                                key=lambda item: (item[2] / (len(item[1]) - 1), item[2], item[0]))
+        flaky = []
+        for group, runs, flips in ranked:
+            passes = sum(1 for entry in runs if entry[2])
+            flaky.append({
+                'test_case_id': group,
+                'runs': len(runs),
+                'passes': passes,
+                'fails': len(runs) - passes,
+                'flips': flips,
+                'flip_rate': round(flips / (len(runs) - 1), 4),
+                'last_result': 'Pass' if runs[-1][2] else 'Fail',
+                'last_run_id': runs[-1][1],
+            })
+        return app.json.dumps({'min_runs': min_runs, 'tests': flaky}, separators=(',', ':'))
+
+    return conditional_response(collection.etag(), collection.modified_at, build_body)
+
+AGING_BUCKETS = (('0-7d', 0, 7), ('8-30d', 7, 30), ('31-90d', 30, 90), ('90d+', 90, None))
+FIXED_STATUSES = {'resolved', 'closed'}
+
+def hours(seconds):
+    return round(seconds / 3600, 2)
+
+@app.route('/mock_testrail/analytics/defects', methods=['GET', 'OPTIONS'])
+def get_defect_analytics():
+    if request.method == 'OPTIONS':
+        return add_cors_headers(make_response())
+    try:
+        as_of = parse_date_bound(request.args['as_of']) if request.args.get('as_of') else None
+    except ValueError as exc:
+        return error_response(str(exc))
+    if as_of is None:
+        # Ages are measured from the top of the current hour, which keeps
+        # the body (and so the ETag) stable for that hour.
+        as_of = int(time.time()) // 3600 * 3600
+    collection = store['defects']
+
+    def build_body():
+        index = collection.derived['fix_times']
+        mttr = collections.defaultdict(dict)
+        for (dimension, value), (count, total) in list(index.totals.items()):
+            durations = index.durations[(dimension, value)]
+            p50, p90 = counted_percentiles(durations, (0.5, 0.9))
+            mttr[dimension][value] = {
+                'fixed': count,
+                'mttr_hours': hours(total / count),
+                'p50_hours': hours(p50),
+                'p90_hours': hours(p90),
+                'max_hours': hours(max(durations)),
+            }
+        aging = {}
+        for severity, created in list(index.open_since.items()):
+            buckets = dict.fromkeys((name for name, _, _ in AGING_BUCKETS), 0)
+            for epoch, count in list(created.items()):
+                # Defects opened after as_of are as new as they come; they
+                # still count as open, so they need a bucket too.
+                age = max(as_of - epoch, 0)
+                for name, newest_days, oldest_days in AGING_BUCKETS:
+                    if newest_days * 86400 <= age and (oldest_days is None or age < oldest_days * 86400):
+                        buckets[name] += count
+                        break
+            aging[severity] = {'open': sum(created.values()), 'buckets': buckets}
+        result = {
+            'as_of': datetime.fromtimestamp(as_of, timezone.utc).strftime(DEFECT_DATE),
+            'mttr': {
+                'overall': mttr['overall'].get('ALL'),
+                'by_severity': mttr['severity'],
+                'by_reporter': mttr['reporter'],
+            },
+            'aging': aging,
+        }
+        return app.json.dumps(result, separators=(',', ':'))
+
+    return conditional_response('%s-%d' % (collection.etag(), as_of), collection.modified_at, build_body)
+
+TRACE_COLLECTIONS = ('requirements', 'testcases', 'testruns', 'defects')
+
+def latest_run(runs, test_case_id):
+    # Index buckets are live sets an upload may resize mid-iteration, so
+    # they are only walked under the collection's lock.
+    with runs.lock:
+        keys = runs.filters['Test_Case_ID'].lookup(test_case_id)
+        key = max(keys, key=lambda key: (runs.timestamp('Execution_Date', key) or 0, key), default=None)
+        return runs.get(key) if key is not None else None
+
+def open_defects(test_case_id):
+    defects = store['defects']
+    with defects.lock:
+        found = [defects.get(key) for key in sorted(defects.filters['Test_Case_ID'].lookup(test_case_id))]
+    return [defect for defect in found
+            if defect is not None and str(defect.get('Status', '')).strip().lower() not in FIXED_STATUSES]
+
+@app.route('/mock_testrail/traceability', methods=['GET', 'OPTIONS'])
+def get_traceability():
+    if request.method == 'OPTIONS':
+        return add_cors_headers(make_response())
+    requirement_id = request.args.get('requirement_id')
+    component = request.args.get('component')
+    if bool(requirement_id) == bool(component):
+        return error_response('pass exactly one of requirement_id or component')
+    etag = 'traceability-%s-%s' % (BOOT_ID, '.'.join(str(store[name].version) for name in TRACE_COLLECTIONS))
+    last_modified = max(store[name].modified_at for name in TRACE_COLLECTIONS)
+
+    def build_body():
+        # Every hop is a foreign-key hash index lookup, so the cost is the
+        # number of related rows rather than the size of any collection.
+        requirements, test_cases = store['requirements'], store['testcases']
+        if requirement_id:
+            requirement_ids = [requirement_id] if requirement_id in requirements else []
+            case_ids = set()
+        else:
+            with requirements.lock:
+                requirement_ids = sorted(requirements.filters['Component'].lookup(component))
+            with test_cases.lock:
+                case_ids = set(test_cases.filters['Component'].lookup(component))
+        linked = []
+        for key in requirement_ids:
+            with test_cases.lock:
+                ids = sorted(test_cases.filters['Requirement_ID'].lookup(key))
+            requirement = requirements.get(key)
+            if requirement is not None:
+                case_ids.update(ids)
+                linked.append(dict(requirement, test_case_ids=ids))
+        cases = []
+        for key in sorted(case_ids):
+            test_case = test_cases.get(key)
+            if test_case is not None:
+                cases.append(dict(test_case, latest_run=latest_run(store['testruns'], key), open_defects=open_defects(key)))
+        return app.json.dumps({'requirements': linked, 'test_cases': cases}, separators=(',', ':'))
+
+    return conditional_response(etag, last_modified, build_body)
+
+@app.route('/mock_testrail/analytics/coverage', methods=['GET', 'OPTIONS'])
+def get_coverage():
+    if request.method == 'OPTIONS':
+        return add_cors_headers(make_response())
+    names = ('requirements', 'testcases', 'testruns')
+    etag = 'coverage-%s-%s' % (BOOT_ID, '.'.join(str(store[name].version) for name in names))
+    last_modified = max(store[name].modified_at for name in names)
+
+    def build_body():
+        matrix = store['requirements'].derived['coverage'].matrix
+        with matrix.lock:
+            cells = sorted((cell, tuple(counts)) for cell, counts in matrix.cells.items())
+        rollups = {'component': collections.defaultdict(lambda: [0, 0]),
+                   'priority': collections.defaultdict(lambda: [0, 0])}
+        rows = []
+        for (component, priority), (total, covered) in cells:
+            for dimension, value in (('component', component), ('priority', priority)):
+                rollups[dimension][value][0] += total
+                rollups[dimension][value][1] += covered
+            rows.append({'component': component, 'priority': priority, 'requirements': total,
+                         'covered': covered, 'coverage': round(covered / total, 4)})
+
+        def summarize(total, covered):
+            return {'requirements': total, 'covered': covered,
+                    'coverage': round(covered / total, 4) if total else None}
+
+        result = {
+            'cells': rows,
+            'by_component': {value: summarize(*counts) for value, counts in rollups['component'].items()},
+            'by_priority': {value: summarize(*counts) for value, counts in rollups['priority'].items()},
+            'overall': summarize(sum(total for _, (total, _) in cells), sum(covered for _, (_, covered) in cells)),
+        }
+        return app.json.dumps(result, separators=(',', ':'))
+
+    return conditional_response(etag, last_modified, build_body)
+
+def threshold_columns(collection):
+    """Copy the live ThresholdIndex columns into NumPy arrays under the write lock."""
+    index = collection.derived['thresholds']
+    with collection.lock:
+        alive = np.frombuffer(index.alive, dtype=np.uint8).astype(bool)
+        columns = {
+            'actual': np.frombuffer(index.actual, dtype=np.float64)[alive],
+            'expected': np.frombuffer(index.expected, dtype=np.float64)[alive],
+            'comparator': np.frombuffer(index.comparators, dtype=np.int8)[alive],
+            'reported': np.frombuffer(index.reported, dtype=np.int8)[alive],
+            'date': np.frombuffer(index.dates, dtype=np.int64)[alive],
+            'unit': np.frombuffer(index.units.data, dtype=np.uint32)[alive],
+            'test_type': np.frombuffer(index.test_types.data, dtype=np.uint32)[alive],
+        }
+        keys = [key for key in index.keys if key is not None]
+        dictionaries = {'unit': list(index.units.values), 'test_type': list(index.test_types.values)}
+    return keys, columns, dictionaries
+
+def evaluate_thresholds(actual, expected, comparator):
+    """Derived status per row: 1 pass, 0 fail, -1 when it cannot be judged."""
+    with np.errstate(invalid='ignore'):
+        passed = np.select([comparator == 0, comparator == 1, comparator == 2, comparator == 3, comparator == 4],
+                           [actual < expected, actual <= expected, actual > expected, actual >= expected,
+                            np.isclose(actual, expected)], False)
+    return np.where(comparator >= 0, passed.astype(np.int8), np.int8(-1))
+
+@app.route('/mock_testrail/analytics/thresholds', methods=['GET', 'OPTIONS'])
+def get_threshold_analytics():
+    if request.method == 'OPTIONS':
+        return add_cors_headers(make_response())
+    if np is None:
+        return error_response('threshold analytics need numpy installed', 501)
+    only = request.args.get('only', 'all')
+    if only not in ('all', 'violations', 'mismatched'):
+        return error_response('only must be all, violations or mismatched')
+    try:
+        start = parse_date_bound(request.args['date_from']) if request.args.get('date_from') else None
+        end = parse_date_bound(request.args['date_to'], True) if request.args.get('date_to') else None
+    except ValueError as exc:
+        return error_response(str(exc))
+    test_types = {normalize_term(value) for value in request.args.getlist('Test_Type')}
+    collection = store['testtypesummary']
+
+    def build_body():
+        keys, columns, dictionaries = threshold_columns(collection)
+        derived = evaluate_thresholds(columns['actual'], columns['expected'], columns['comparator'])
+        keep = np.ones(len(keys), dtype=bool)
+        if start is not None:
+            keep &= columns['date'] >= start
+        if end is not None:
+            keep &= columns['date'] <= end
+        if test_types:
+            wanted = np.array([normalize_term(value) in test_types for value in dictionaries['test_type']],
+                              dtype=bool)
+            keep &= wanted[columns['test_type']] if len(wanted) else False
+        violations = keep & (derived == 0)
+        mismatched = keep & (derived >= 0) & (columns['reported'] >= 0) & (derived != columns['reported'])
+        selected = {'all': keep, 'violations': violations, 'mismatched': mismatched}[only]
+        rows = []
+        for position in np.flatnonzero(selected).tolist():
+            record = collection.get(keys[position])
+            comparator = int(columns['comparator'][position])
+            status = int(derived[position])
+            rows.append(dict(
+                record,
+                Actual_Value=None if math.isnan(columns['actual'][position]) else float(columns['actual'][position]),
+                Expected_Value=(None if math.isnan(columns['expected'][position])
+                                else float(columns['expected'][position])),
+                Unit=dictionaries['unit'][columns['unit'][position]],
+                Comparator=COMPARATORS[comparator] if comparator >= 0 else None,
+                Derived_Status=('Fail', 'Pass')[status] if status >= 0 else None,
+            ))
+        result = {
+            'evaluated': int(keep.sum()),
+            'violations': int(violations.sum()),
+            'mismatched': int(mismatched.sum()),
+            'unjudged': int((keep & (derived < 0)).sum()),
+            'rows': rows,
         }
-    ]))
+        return app.json.dumps(result, separators=(',', ':'))
+
+    return conditional_response(collection.etag(), collection.modified_at, build_body)
+
+TRANSIT_VOLUMES = ('Bus Taps', 'Gate Taps', 'FVM Transactions', 'Defect Count')
+# Rate -> the volume it is weighted by when days are rolled up.
+TRANSIT_RATES = {
+    'Success Rate Bus': ('Bus Taps',),
+    'Success Rate Gate': ('Gate Taps',),
+    'Avg Response Time': ('Bus Taps', 'Gate Taps'),
+}
+TRANSIT_INTERVALS = ('day', 'week', 'month')
+
+def bucket_start(epoch, interval):
+    if interval == 'week':
+        # 1970-01-01 was a Thursday; weeks start on Monday.
+        return epoch - (epoch // 86400 + 3) % 7 * 86400
+    if interval == 'month':
+        day = datetime.fromtimestamp(epoch, timezone.utc)
+        return int(day.replace(day=1, hour=0, minute=0, second=0).timestamp())
+    return epoch - epoch % 86400
+
+def number(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+def transit_rollup(collection, entries, interval):
+    """Sum volumes and volume-weight rates per bucket over date-ordered entries."""
+    buckets = []
+    current = None
+    for epoch, key in entries:
+        start = bucket_start(epoch, interval)
+        if current is None or current['start'] != start:
+            current = {'start': start, 'days': 0, 'volumes': dict.fromkeys(TRANSIT_VOLUMES, 0),
+                       'rates': {rate: [0.0, 0.0] for rate in TRANSIT_RATES}}
+            buckets.append(current)
+        record = collection.rows[key]
+        current['days'] += 1
+        for name in TRANSIT_VOLUMES:
+            current['volumes'][name] += number(record.get(name)) or 0
+        for rate, weights in TRANSIT_RATES.items():
+            value = number(record.get(rate))
+            weight = sum(number(record.get(name)) or 0 for name in weights)
+            if value is not None and weight:
+                current['rates'][rate][0] += value * weight
+                current['rates'][rate][1] += weight
+    points = []
+    for bucket in buckets:
+        point = {'Date': datetime.fromtimestamp(bucket['start'], timezone.utc).strftime(ISO_DATE),
+                 'days': bucket['days']}
+        point.update((name, int(total)) for name, total in bucket['volumes'].items())
+        point.update((rate, round(total / weight, 2) if weight else None)
+                     for rate, (total, weight) in bucket['rates'].items())
+        points.append(point)
+    return points
+
+def moving_average(values, window):
+    """Trailing mean over up to ``window`` values, skipping gaps (None)."""
+    averages = []
+    total = count = 0
+    for position, value in enumerate(values):
+        if value is not None:
+            total += value
+            count += 1
+        if position >= window and values[position - window] is not None:
+            total -= values[position - window]
+            count -= 1
+        averages.append(round(total / count, 2) if count else None)
+    return averages
+
+def lttb(xs, ys, threshold):
+    """Largest-Triangle-Three-Buckets: indices of ``threshold`` (>= 3) points keeping the series' shape."""
+    size = len(xs)
+    if threshold >= size:
+        return list(range(size))
+    every = (size - 2) / (threshold - 2)
+    selected = [0]
+    previous = 0
+    for bucket in range(threshold - 2):
+        start = int(bucket * every) + 1
+        end = int((bucket + 1) * every) + 1
+        following_end = min(int((bucket + 2) * every) + 1, size)
+        # Average of the next bucket is the third corner of the triangle.
+        span = range(end, following_end) if end < following_end else range(size - 1, size)
+        average_x = sum(xs[i] for i in span) / len(span)
+        average_y = sum(ys[i] for i in span) / len(span)
+        x0, y0 = xs[previous], ys[previous]
+        previous = max(range(start, end), key=lambda i: abs(
+            (x0 - average_x) * (ys[i] - y0) - (x0 - xs[i]) * (average_y - y0)))
+        selected.append(previous)
+    selected.append(size - 1)
+    return selected
+
+@app.route('/mock_testrail/analytics/transit', methods=['GET', 'OPTIONS'])
+def get_transit_analytics():
+    if request.method == 'OPTIONS':
+        return add_cors_headers(make_response())
+    interval = request.args.get('interval', 'day')
+    if interval not in TRANSIT_INTERVALS:
+        return error_response('interval must be one of %s' % ', '.join(TRANSIT_INTERVALS))
+    metric = request.args.get('metric', 'Bus Taps')
+    if metric not in TRANSIT_VOLUMES and metric not in TRANSIT_RATES:
+        return error_response('metric must be one of %s' % ', '.join(TRANSIT_VOLUMES + tuple(TRANSIT_RATES)))
+    try:
+        window = int(request.args.get('window', 0))
+        points = int(request.args['points']) if request.args.get('points') else None
+        start = parse_date_bound(request.args['date_from']) if request.args.get('date_from') else None
+        end = parse_date_bound(request.args['date_to'], True) if request.args.get('date_to') else None
+    except ValueError as exc:
+        return error_response(str(exc))
+    if window < 0 or (points is not None and points < 3):
+        return error_response('window must not be negative and points must be at least 3')
+    collection = store['transitmetricsdaily']
+
+    def build_body():
+        series = transit_rollup(collection, collection.ordering.between(start, end), interval)
+        if window > 1:
+            for name in TRANSIT_VOLUMES + tuple(TRANSIT_RATES):
+                for point, average in zip(series, moving_average([point[name] for point in series], window)):
+                    point.setdefault('moving_average', {})[name] = average
+        total = len(series)
+        if points is not None and total > points:
+            # Downsample on the chosen metric; gaps count as zero so they
+            # still register as dips.
+            xs = [parse_timestamp(point['Date'], ISO_DATE) for point in series]
+            ys = [point[metric] or 0 for point in series]
+            series = [series[i] for i in lttb(xs, ys, points)]
+        result = {'interval': interval, 'window': window, 'metric': metric, 'total_points': total, 'data': series}
+        return app.json.dumps(result, separators=(',', ':'))
+
+    return conditional_response(collection.etag(), collection.modified_at, build_body)
+
+def fleet_summary(runs, busy, judged, fails, remarks, top):
+    return {
+        'runs': runs,
+        'busy_time': busy,
+        'fail_rate': round(fails / judged, 4) if judged else None,
+        'top_failure_remarks': [{'remark': remark, 'count': count} for remark, count in remarks.most_common(top)],
+    }
+
+@app.route('/mock_testrail/analytics/fleet', methods=['GET', 'OPTIONS'])
+def get_fleet():
+    if request.method == 'OPTIONS':
+        return add_cors_headers(make_response())
+    interval = request.args.get('interval', 'day')
+    if interval not in TRANSIT_INTERVALS:
+        return error_response('interval must be one of %s' % ', '.join(TRANSIT_INTERVALS))
+    try:
+        top = int(request.args.get('top', 3))
+        start = parse_date_bound(request.args['date_from']) if request.args.get('date_from') else None
+        end = parse_date_bound(request.args['date_to'], True) if request.args.get('date_to') else None
+    except ValueError as exc:
+        return error_response(str(exc))
+    if top < 0:
+        return error_response('top must not be negative')
+    robots = set(request.args.getlist('Executed_By'))
+    collection = store['testruns']
+
+    def build_body():
+        with collection.lock:
+            cells = [(robot, day, cell[:4], collections.Counter(cell[4]))
+                     for (robot, day), cell in collection.derived['fleet'].cells.items()
+                     if (not robots or robot in robots)
+                     and (start is None or day >= start) and (end is None or day <= end)]
+        totals = collections.defaultdict(lambda: [0, 0, 0, 0, collections.Counter()])
+        buckets = collections.defaultdict(lambda: [0, 0, 0, 0, collections.Counter()])
+        for robot, day, counts, remarks in cells:
+            for aggregate in (totals[robot], buckets[(robot, bucket_start(day, interval))]):
+                for position, count in enumerate(counts):
+                    aggregate[position] += count
+                aggregate[4].update(remarks)
+        fleet = {}
+        for robot in sorted(totals, key=str):
+            runs, busy, judged, fails, remarks = totals[robot]
+            fleet[robot] = dict(fleet_summary(runs, busy, judged, fails, remarks, top), buckets=[])
+        for (robot, bucket), (runs, busy, judged, fails, remarks) in sorted(buckets.items(),
+                                                                           key=lambda item: (str(item[0][0]), item[0][1])):
+            fleet[robot]['buckets'].append(dict(
+                fleet_summary(runs, busy, judged, fails, remarks, top),
+                Date=datetime.fromtimestamp(bucket, timezone.utc).strftime(ISO_DATE)))
+        return app.json.dumps({'interval': interval, 'robots': fleet}, separators=(',', ':'))
+
+    return conditional_response(collection.etag(), collection.modified_at, build_body)
+
+# Structured field -> test case fields it may come from, first populated wins.
+STRUCTURED_FIELDS = {
+    'Test_Case_ID': ('Test_Case_ID', 'id'),
+    'Title': ('Title', 'title'),
+    'Type': ('Type', 'type'),
+    'Status': ('Status', 'status'),
+    'Component': ('Component', 'component'),
+    'PreCondition': ('PreCondition', 'precondition'),
+    'Test_Steps': ('Test_Steps', 'test_steps'),
+    'Expected_Result': ('Expected_Result', 'expected_result'),
+    'Requirement_ID': ('Requirement_ID', 'requirement_id'),
+    'Created_By': ('Created_By', 'created_by'),
+    'Created_At': ('Created_At', 'created_at'),
+}
+
+def structured_body(test_case):
+    structured = {name: next((test_case[source] for source in sources if test_case.get(source) not in (None, '')),
+                             None)
+                  for name, sources in STRUCTURED_FIELDS.items()}
+    return app.json.dumps(structured, separators=(',', ':')).encode('utf-8')
+
+def find_test_case(collection, test_case_id):
+    key = str(test_case_id).strip()
+    if key in collection:
+        return key
+    # Fall back to the normalised ID index, so case and spacing differences
+    # between defects and test cases still resolve.
+    with collection.lock:
+        return min(collection.filters['Test_Case_ID'].lookup(key), default=None)
+
+@app.route('/mock_testrail/structuredtestcases/<test_case_id>', methods=['GET', 'OPTIONS'])
+def get_structured_test_case(test_case_id):
+    if request.method == 'OPTIONS':
+        return add_cors_headers(make_response())
+    collection = store['testcases']
+    # Take the ETag before reading the record: a write in between then only
+    # costs the client a refetch, instead of pinning an old body to a new tag.
+    etag, last_modified = collection.etag(), collection.modified_at
+    key = find_test_case(collection, test_case_id)
+    body = collection.derived['structured'].get(key, collection.get) if key is not None else None
+    if body is None:
+        return error_response('test case %s not found' % test_case_id, 404)
+    return conditional_response(etag, last_modified, lambda: body)
+
+@app.route('/mock_testrail/structuredtestcases', methods=['GET', 'OPTIONS'])
+def get_structured_test_cases():
+    if request.method == 'OPTIONS':
+        return add_cors_headers(make_response())
+    ids = [value.strip() for values in request.args.getlist('ids') for value in values.split(',') if value.strip()]
+    if not ids:
+        return error_response('ids must list one or more test case IDs')
+    if len(ids) > MAX_PAGE_SIZE:
+        return error_response('at most %d ids per request' % MAX_PAGE_SIZE)
+    collection = store['testcases']
+
+    def build_body():
+        # Splice the cached per-record bodies instead of re-serialising them.
+        cache = collection.derived['structured']
+        parts = []
+        missing = []
+        for test_case_id in dict.fromkeys(ids):
+            key = find_test_case(collection, test_case_id)
+            body = cache.get(key, collection.get) if key is not None else None
+            if body is None:
+                missing.append(test_case_id)
+            else:
+                parts.append(b'%s:%s' % (json.dumps(test_case_id).encode('utf-8'), body))
+        return b'{"data":{%s},"missing":%s}\n' % (b','.join(parts), json.dumps(missing).encode('utf-8'))
+
+    return conditional_response(collection.etag(), collection.modified_at, build_body)
+
+@app.route('/mock_testrail/search', methods=['GET', 'OPTIONS'])
+def get_search():
+    if request.method == 'OPTIONS':
+        return add_cors_headers(make_response())
+    tokens = list(dict.fromkeys(tokenize(request.args.get('q', ''))))
+    if not tokens:
+        return error_response('q must contain at least one word')
+    names = [name for name in store.collections if 'text' in store[name].derived]
+    requested = request.args.get('collections')
+    if requested:
+        unknown = [name for name in requested.split(',') if name not in names]
+        if unknown:
+            return error_response('not searchable: %s' % ', '.join(unknown))
+        names = requested.split(',')
+    try:
+        limit = int(request.args.get('limit', 20))
+    except ValueError:
+        return error_response('limit must be an integer')
+    if not 0 < limit <= MAX_PAGE_SIZE:
+        return error_response('limit must be between 1 and %d' % MAX_PAGE_SIZE)
+    etag = 'search-%s-%s' % (BOOT_ID, '.'.join(str(store[name].version) for name in names))
+    last_modified = max(store[name].modified_at for name in names)
+
+    def build_body():
+        hits = []
+        counts = {}
+        truncated = set()
+        for name in names:
+            collection = store[name]
+            with collection.lock:
+                scores, capped = collection.derived['text'].search(tokens, len(collection))
+            counts[name] = len(scores)
+            truncated.update(capped)
+            hits.extend((score, name, key) for key, score in scores.items())
+        ranked = heapq.nlargest(limit, hits, key=lambda hit: (hit[0], hit[1], hit[2]))
+        results = [{'collection': name, 'key': key, 'score': round(score, 4), 'record': store[name].get(key)}
+                   for score, name, key in ranked]
+        # Totals only count the completions searched for truncated tokens.
+        return app.json.dumps({'q': request.args['q'], 'total': counts, 'truncated': sorted(truncated),
+                               'results': results}, separators=(',', ':'))
+
+    return conditional_response(etag, last_modified, build_body)
+
+@app.route('/mock_testrail/globalsearch', methods=['GET', 'OPTIONS'])
+def get_global_search():
+    if request.method == 'OPTIONS':
+        return add_cors_headers(make_response())
+    search_field = request.args.get('field', '')
+    term = request.args.get('term', '').strip()
+    match = request.args.get('match', 'prefix')
+    if search_field not in GLOBAL_SEARCH_FIELDS:
+        return error_response('field must be one of %s' % ', '.join(GLOBAL_SEARCH_FIELDS))
+    if not term:
+        return error_response('term is required')
+    if match not in ('prefix', 'exact'):
+        return error_response('match must be prefix or exact')
+    try:
+        limit = int(request.args.get('limit', 50))
+    except ValueError:
+        return error_response('limit must be an integer')
+    if not 0 < limit <= MAX_PAGE_SIZE:
+        return error_response('limit must be between 1 and %d' % MAX_PAGE_SIZE)
+    names = list(GLOBAL_SEARCH_FIELDS[search_field])
+    etag = 'globalsearch-%s-%s' % (BOOT_ID, '.'.join(str(store[name].version) for name in names))
+    last_modified = max(store[name].modified_at for name in names)
+
+    def build_body():
+        results = {}
+        for name in names:
+            collection = store[name]
+            source = GLOBAL_SEARCH_FIELDS[search_field][name]
+            if source is PRIMARY_KEY:
+                index = collection.derived['ids']
+            elif isinstance(source, str):
+                index = collection.filters[source]
+            else:
+                index = collection.derived['ids:' + search_field]
+            with collection.lock:
+                total, keys = index.search(term, match == 'prefix', limit)
+                results[name] = {'total': total, 'data': [collection.get(key) for key in keys]}
+        return app.json.dumps({'field': search_field, 'term': term, 'match': match, 'results': results},
+                              separators=(',', ':'))
+
+    return conditional_response(etag, last_modified, build_body)
+
+@app.route('/mock_testrail/changes', methods=['GET', 'OPTIONS'])
+def get_changes():
+    if request.method == 'OPTIONS':
+        return add_cors_headers(make_response())
+    requested = request.args.get('collections')
+    names = set(requested.split(',')) if requested else None
+    if names and not names <= set(store.collections):
+        return error_response('unknown collections: %s' % ', '.join(sorted(names - set(store.collections))))
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    if last_event_id:
+        boot, _, sequence = last_event_id.rpartition('-')
+        try:
+            sequence = int(sequence)
+        except ValueError:
+            return error_response('Last-Event-ID must be an event id from this feed')
+        if boot != BOOT_ID:
+            sequence = -1
+    else:
+        sequence = store.feed.sequence
+    feed = store.feed
+    if not feed.subscribe():
+        # Each stream holds a worker thread for as long as it is open; past
+        # the cap, new ones would starve every other request.
+        response = error_response('too many change feed subscribers, retry later', 503)
+        # Same back-off as the stream's own ``retry: 3000``.
+        response.headers['Retry-After'] = '3'
+        return response
+    response = app.response_class(feed.stream(sequence, names), mimetype='text/event-stream')
+    response.call_on_close(feed.unsubscribe)
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
     return add_cors_headers(response)
 
+TEST_CASES = [
+    {
+        "id": 101,
+        "title": "Login with valid credentials",
+        "type": "Feature",
+        "component": "Authentication",
+        "requirement_id": 1,
+        "status": "Active",
+        "created_by": "qa_user"
+    },
+    {
+        "id": 102,
+        "title": "Login fails with wrong password",
+        "type": "Regression",
+        "component": "Authentication",
+        "requirement_id": 1,
+        "status": "Active",
+        "created_by": "qa_user"
+    }
+]
+
+TEST_RUNS = [
+    {
+        "Executed_By": "Robot_Unit_04",
+        "Execution_Date": "18-05-2025 20:55",
+        "Observed_Time": 3975,
+        "Remarks": "Screen not responsive",
+        "Result": "Fail",
+        "run_id": "rid-104",
+        "test_case_id": "TC-F-FVM-215-86"
+    },
+    {
+        "Executed_By": "Robot_Unit_08",
+        "Execution_Date": "18-05-2025 20:55",
+        "Observed_Time": 525,
+        "Remarks": "Minor Delay Observed",
+        "Result": "Pass",
+        "run_id": "rid-107",
+        "test_case_id": "TC-F-FVM-215-86"
+    },
+    {
+        "Executed_By": "Robot_Unit_08",
+        "Execution_Date": "22-05-2025 15:12",
+        "Observed_Time": 8371,
+        "Remarks": "Screen not responsive",
+        "Result": "Fail",
+        "run_id": "rid-108",
+        "test_case_id": "TC-F-ALL-908-92"
+    },
+    {
+        "Executed_By": "Robot_Unit_05",
+        "Execution_Date": "21-05-2025 13:59",
+        "Observed_Time": 1182,
+        "Remarks": "Card Not Detected",
+        "Result": "Pass",
+        "run_id": "rid-109",
+        "test_case_id": "TC-F-FVM-278-73"
+    },
+    {
+        "Executed_By": "Robot_Unit_05",
+        "Execution_Date": "16-05-2025 15:58",
+        "Observed_Time": 6212,
+        "Remarks": "Card Not Detected",
+        "Result": "Fail",
+        "run_id": "rid-110",
+        "test_case_id": "TC-F-ALL-022-56"
+    },
+    {
+        "Executed_By": "Robot_Unit_04",
+        "Execution_Date": "16-05-2025 15:58",
+        "Observed_Time": 9353,
+        "Remarks": "Mechanical Arm Misaligned",
+        "Result": "Fail",
+        "run_id": "rid-120",
+        "test_case_id": "TC-F-FVM-658-00"
+    },
+    {
+        "Executed_By": "Robot_Unit_04",
+        "Execution_Date": "21-05-2025 13:59",
+        "Observed_Time": 8464,
+        "Remarks": "Minor Delay Observed",
+        "Result": "Fail",
+        "run_id": "rid-126",
+        "test_case_id": "TC-F-GATE-READER-797-68"
+    },
+    {
+        "Executed_By": "Robot_Unit_04",
+        "Execution_Date": "18-05-2025 20:55",
+        "Observed_Time": 7307,
+        "Remarks": "Test Passed Smoothly",
+        "Result": "Pass",
+        "run_id": "rid-138",
+        "test_case_id": "TC-F-FVM-361-74"
+    },
+    {
+        "Executed_By": "Robot_Unit_03",
+        "Execution_Date": "22-05-2025 15:12",
+        "Observed_Time": 8088,
+        "Remarks": "Incorrect result shown",
+        "Result": "Fail",
+        "run_id": "rid-143",
+        "test_case_id": "TC-NF-GATE-278-16"
+    },
+    {
+        "Executed_By": "Robot_Unit_00",
+        "Execution_Date": "16-05-2025 15:58",
+        "Observed_Time": 5463,
+        "Remarks": "Mechanical Arm Misaligned",
+        "Result": "Fail",
+        "run_id": "rid-146",
+        "test_case_id": "TC-F-BUS-READER-291-00"
+    },
+    {
+        "Executed_By": "Robot_Unit_07",
+        "Execution_Date": "16-05-2025 15:58",
+        "Observed_Time": 6438,
+        "Remarks": "Card Not Detected",
+        "Result": "Fail",
+        "run_id": "rid-151",
+        "test_case_id": "TC-F-ALL-022-56"
+    },
+    {
+        "Executed_By": "Robot_Unit_07",
+        "Execution_Date": "21-05-2025 13:59",
+        "Observed_Time": 255,
+        "Remarks": "Card Not Detected",
+        "Result": "Fail",
+        "run_id": "rid-157",
+        "test_case_id": "TC-F-FVM-502-23"
+    },
+    {
+        "Executed_By": "Robot_Unit_07",
+        "Execution_Date": "22-05-2025 15:12",
+        "Observed_Time": 182,
+        "Remarks": "Screen not responsive",
+        "Result": "Fail",
+        "run_id": "rid-172",
+        "test_case_id": "TC-F-GATE-READER-638-28"
+    },
+    {
+        "Executed_By": "Robot_Unit_00",
+        "Execution_Date": "18-05-2025 20:55",
+        "Observed_Time": 951,
+        "Remarks": "Mechanical Arm Misaligned",
+        "Result": "Fail",
+        "run_id": "rid-179",
+        "test_case_id": "TC-F-GATE-READER-498-53"
+    },
+    {
+        "Executed_By": "Robot_Unit_01",
+        "Execution_Date": "16-05-2025 15:58",
+        "Observed_Time": 7332,
+        "Remarks": "Minor Delay Observed",
+        "Result": "Pass",
+        "run_id": "rid-191",
+        "test_case_id": "TC-NF-GATE-633-97"
+    },
+    {
+        "Executed_By": "Robot_Unit_07",
+        "Execution_Date": "22-05-2025 15:12",
+        "Observed_Time": 6087,
+        "Remarks": "Mechanical Arm Misaligned",
+        "Result": "Fail",
+        "run_id": "rid-198",
+        "test_case_id": "TC-F-ALL-908-92"
+    },
+    {
+        "Executed_By": "Robot_Unit_04",
+        "Execution_Date": "16-05-2025 15:58",
+        "Observed_Time": 1440,
+        "Remarks": "Mechanical Arm Misaligned",
+        "Result": "Pass",
+        "run_id": "rid-203",
+        "test_case_id": "TC-F-FVM-815-57"
+    },
+    {
+        "Executed_By": "Robot_Unit_04",
+        "Execution_Date": "16-05-2025 15:58",
+        "Observed_Time": 1801,
+        "Remarks": "Screen not responsive",
+        "Result": "Pass",
+        "run_id": "rid-210",
+        "test_case_id": "TC-F-FVM-658-00"
+    },
+    {
+        "Executed_By": "Robot_Unit_08",
+        "Execution_Date": "16-05-2025 15:52",
+        "Observed_Time": 9322,
+        "Remarks": "All Steps Passed",
+        "Result": "Fail",
+        "run_id": "rid-217",
+        "test_case_id": "TC-NF-GATE-306-41"
+    },
+    {
+        "Executed_By": "Robot_Unit_02",
+        "Execution_Date": "16-05-2025 15:58",
+        "Observed_Time": 3557,
+        "Remarks": "Card Not Detected",
+        "Result": "Pass",
+        "run_id": "rid-219",
+        "test_case_id": "TC-F-BUS-READER-162-77"
+    },
+    {
+        "Executed_By": "Robot_Unit_00",
+        "Execution_Date": "22-05-2025 13:55",
+        "Observed_Time": 1120,
+        "Remarks": "Screen not responsive",
+        "Result": "Fail",
+        "run_id": "rid-228",
+        "test_case_id": "TC-F-FVM-984-31"
+    },
+    {
+        "Executed_By": "Robot_Unit_06",
+        "Execution_Date": "16-05-2025 15:58",
+        "Observed_Time": 5667,
+        "Remarks": "Minor Delay Observed",
+        "Result": "Fail",
+        "run_id": "rid-231",
+        "test_case_id": "TC-F-FVM-403-54"
+    },
+    {
+        "Executed_By": "Robot_Unit_03",
+        "Execution_Date": "16-05-2025 15:58",
+        "Observed_Time": 8583,
+        "Remarks": "Card Not Detected",
+        "Result": "Pass",
+        "run_id": "rid-245",
+        "test_case_id": "TC-F-BUS-READER-984-06"
+    },
+    {
+        "Executed_By": "Robot_Unit_03",
+        "Execution_Date": "18-05-2025 20:55",
+        "Observed_Time": 4047,
+        "Remarks": "Screen not responsive",
+        "Result": "Pass",
+        "run_id": "rid-250",
+        "test_case_id": "TC-F-GATE-READER-983-34"
+    },
+    {
+        "Executed_By": "Robot_Unit_03",
+        "Execution_Date": "22-05-2025 13:55",
+        "Observed_Time": 7059,
+        "Remarks": "Incorrect result shown",
+        "Result": "Pass",
+        "run_id": "rid-252",
+        "test_case_id": "TC-F-FVM-984-31"
+    },
+    {
+        "Executed_By": "Robot_Unit_09",
+        "Execution_Date": "18-05-2025 20:55",
+        "Observed_Time": 1371,
+        "Remarks": "Test Passed Smoothly",
+        "Result": "Pass",
+        "run_id": "rid-255",
+        "test_case_id": "TC-F-ALL-484-26"
+    },
+    {
+        "Executed_By": "Robot_Unit_01",
+        "Execution_Date": "22-05-2025 15:12",
+        "Observed_Time": 3863,
+        "Remarks": "Test Passed Smoothly",
+        "Result": "Fail",
+        "run_id": "rid-260",
+        "test_case_id": "TC-F-ALL-908-92"
+    },
+    {
+        "Executed_By": "Robot_Unit_05",
+        "Execution_Date": "22-05-2025 13:55",
+        "Observed_Time": 2673,
+        "Remarks": "Card Not Detected",
+        "Result": "Pass",
+        "run_id": "rid-285",
+        "test_case_id": "TC-F-ALL-359-32"
+    },
+    {
+        "Executed_By": "Robot_Unit_05",
+        "Execution_Date": "22-05-2025 13:55",
+        "Observed_Time": 5640,
+        "Remarks": "Card Not Detected",
+        "Result": "Fail",
+        "run_id": "rid-298",
+        "test_case_id": "TC-F-FVM-041-26"
+    },
+    {
+        "Executed_By": "Robot_Unit_09",
+        "Execution_Date": "21-05-2025 13:59",
+        "Observed_Time": 3226,
+        "Remarks": "All Steps Passed",
+        "Result": "Pass",
+        "run_id": "rid-305",
+        "test_case_id": "TC-F-GATE-READER-503-05"
+    },
+    {
+        "Executed_By": "Robot_Unit_01",
+        "Execution_Date": "21-05-2025 13:59",
+        "Observed_Time": 7558,
+        "Remarks": "Minor Delay Observed",
+        "Result": "Pass",
+        "run_id": "rid-310",
+        "test_case_id": "TC-F-FVM-143-72"
+    },
+    {
+        "Executed_By": "Robot_Unit_04",
+        "Execution_Date": "16-05-2025 15:52",
+        "Observed_Time": 2524,
+        "Remarks": "Card Not Detected",
+        "Result": "Pass",
+        "run_id": "rid-311",
+        "test_case_id": "TC-F-GATE-READER-945-70"
+    },
+    {
+        "Executed_By": "Robot_Unit_01",
+        "Execution_Date": "16-05-2025 15:52",
+        "Observed_Time": 6964,
+        "Remarks": "Mechanical Arm Misaligned",
+        "Result": "Pass",
+        "run_id": "rid-312",
+        "test_case_id": "TC-F-GATE-READER-945-70"
+    },
+    {
+        "Executed_By": "Robot_Unit_08",
+        "Execution_Date": "18-05-2025 20:55",
+        "Observed_Time": 9677,
+        "Remarks": "Mechanical Arm Misaligned",
+        "Result": "Pass",
+        "run_id": "rid-320",
+        "test_case_id": "TC-F-BUS-READER-429-13"
+    },
+    {
+        "Executed_By": "Robot_Unit_05",
+        "Execution_Date": "22-05-2025 15:12",
+        "Observed_Time": 1423,
+        "Remarks": "Incorrect result shown",
+        "Result": "Pass",
+        "run_id": "rid-323",
+        "test_case_id": "TC-F-GATE-READER-943-41"
+    },
+    {
+        "Executed_By": "Robot_Unit_02",
+        "Execution_Date": "18-05-2025 20:55",
+        "Observed_Time": 8198,
+        "Remarks": "Mechanical Arm Misaligned",
+        "Result": "Fail",
+        "run_id": "rid-324",
+        "test_case_id": "TC-F-GATE-READER-042-19"
+    },
+    {
+        "Executed_By": "Robot_Unit_01",
+        "Execution_Date": "16-05-2025 15:52",
+        "Observed_Time": 6141,
+        "Remarks": "Mechanical Arm Misaligned",
+        "Result": "Fail",
+        "run_id": "rid-327",
+        "test_case_id": "TC-F-BUS-READER-474-04"
+    },
+    {
+        "Executed_By": "Robot_Unit_05",
+        "Execution_Date": "22-05-2025 13:55",
+        "Observed_Time": 9928,
+        "Remarks": "All Steps Passed",
+        "Result": "Fail",
+        "run_id": "rid-331",
+        "test_case_id": "TC-NF-GATE-415-95"
+    },
+    {
+        "Executed_By": "Robot_Unit_06",
+        "Execution_Date": "18-05-2025 20:55",
+        "Observed_Time": 8000,
+        "Remarks": "Incorrect result shown",
+        "Result": "Fail",
+        "run_id": "rid-344",
+        "test_case_id": "TC-F-FVM-276-27"
+    },
+    {
+        "Executed_By": "Robot_Unit_09",
+        "Execution_Date": "21-05-2025 13:59",
+        "Observed_Time": 3780,
+        "Remarks": "Screen not responsive",
+        "Result": "Pass",
+        "run_id": "rid-354",
+        "test_case_id": "TC-F-BUS-READER-828-21"
+    },
+    {
+        "Executed_By": "Robot_Unit_09",
+        "Execution_Date": "22-05-2025 13:55",
+        "Observed_Time": 2802,
+        "Remarks": "Card Not Detected",
+        "Result": "Fail",
+        "run_id": "rid-361",
+        "test_case_id": "TC-F-BUS-READER-405-48"
+    },
+    {
+        "Executed_By": "Robot_Unit_04",
+        "Execution_Date": "21-05-2025 13:59",
+        "Observed_Time": 8622,
+        "Remarks": "Mechanical Arm Misaligned",
+        "Result": "Pass",
+        "run_id": "rid-370",
+        "test_case_id": "TC-F-GATE-READER-949-33"
+    },
+    {
+        "Executed_By": "Robot_Unit_09",
+        "Execution_Date": "22-05-2025 13:55",
+        "Observed_Time": 9779,
+        "Remarks": "Mechanical Arm Misaligned",
+        "Result": "Fail",
+        "run_id": "rid-371",
+        "test_case_id": "TC-F-BUS-READER-546-93"
+    },
+    {
+        "Executed_By": "Robot_Unit_02",
+        "Execution_Date": "22-05-2025 15:12",
+        "Observed_Time": 3897,
+        "Remarks": "Incorrect result shown",
+        "Result": "Fail",
+        "run_id": "rid-373",
+        "test_case_id": "TC-F-ALL-045-41"
+    },
+    {
+        "Executed_By": "Robot_Unit_01",
+        "Execution_Date": "22-05-2025 15:12",
+        "Observed_Time": 799,
+        "Remarks": "Minor Delay Observed",
+        "Result": "Fail",
+        "run_id": "rid-384",
+        "test_case_id": "TC-F-BUS-READER-510-77"
+    },
+    {
+        "Executed_By": "Robot_Unit_04",
+        "Execution_Date": "16-05-2025 15:52",
+        "Observed_Time": 2980,
+        "Remarks": "Card Not Detected",
+        "Result": "Pass",
+        "run_id": "rid-407",
+        "test_case_id": "TC-F-ALL-249-22"
+    },
+    {
+        "Executed_By": "Robot_Unit_08",
+        "Execution_Date": "22-05-2025 13:55",
+        "Observed_Time": 1571,
+        "Remarks": "All Steps Passed",
+        "Result": "Fail",
+        "run_id": "rid-438",
+        "test_case_id": "TC-F-FVM-521-52"
+    },
+    {
+        "Executed_By": "Robot_Unit_05",
+        "Execution_Date": "22-05-2025 13:55",
+        "Observed_Time": 9792,
+        "Remarks": "Screen not responsive",
+        "Result": "Pass",
+        "run_id": "rid-468",
+        "test_case_id": "TC-F-FVM-740-91"
+    },
+    {
+        "Executed_By": "Robot_Unit_01",
+        "Execution_Date": "16-05-2025 15:58",
+        "Observed_Time": 2040,
+        "Remarks": "Incorrect result shown",
+        "Result": "Fail",
+        "run_id": "rid-476",
+        "test_case_id": "TC-F-FVM-192-31"
+    },
+    {
+        "Executed_By": "Robot_Unit_00",
+        "Execution_Date": "16-05-2025 15:58",
+        "Observed_Time": 8789,
+        "Remarks": "Test Passed Smoothly",
+        "Result": "Fail",
+        "run_id": "rid-494",
+        "test_case_id": "TC-F-FVM-658-00"
+    },
+    {
+        "Executed_By": "Robot_Unit_08",
+        "Execution_Date": "21-05-2025 13:59",
+        "Observed_Time": 1470,
+        "Remarks": "Mechanical Arm Misaligned",
+        "Result": "Pass",
+        "run_id": "rid-497",
+        "test_case_id": "TC-F-FVM-278-73"
+    },
+    {
+        "Executed_By": "Robot_Unit_08",
+        "Execution_Date": "21-05-2025 13:59",
+        "Observed_Time": 5656,
+        "Remarks": "Incorrect result shown",
+        "Result": "Pass",
+        "run_id": "rid-525",
+        "test_case_id": "TC-F-GATE-READER-949-33"
+    },
+    {
+        "Executed_By": "Robot_Unit_03",
+        "Execution_Date": "18-05-2025 20:55",
+        "Observed_Time": 8413,
+        "Remarks": "Screen not responsive",
+        "Result": "Fail",
+        "run_id": "rid-527",
+        "test_case_id": "TC-F-GATE-READER-042-19"
+    },
+    {
+        "Executed_By": "Robot_Unit_06",
+        "Execution_Date": "16-05-2025 15:52",
+        "Observed_Time": 7326,
+        "Remarks": "Card Not Detected",
+        "Result": "Fail",
+        "run_id": "rid-529",
+        "test_case_id": "TC-NF-GATE-490-62"
+    },
+    {
+        "Executed_By": "Robot_Unit_01",
+        "Execution_Date": "18-05-2025 20:55",
+        "Observed_Time": 722,
+        "Remarks": "Minor Delay Observed",
+        "Result": "Fail",
+        "run_id": "rid-542",
+        "test_case_id": "TC-F-GATE-READER-814-42"
+    },
+    {
+        "Executed_By": "Robot_Unit_00",
+        "Execution_Date": "22-05-2025 15:12",
+        "Observed_Time": 8997,
+        "Remarks": "All Steps Passed",
+        "Result": "Pass",
+        "run_id": "rid-544",
+        "test_case_id": "TC-F-BUS-READER-510-77"
+    },
+    {
+        "Executed_By": "Robot_Unit_03",
+        "Execution_Date": "22-05-2025 15:12",
+        "Observed_Time": 5621,
+        "Remarks": "Minor Delay Observed",
+        "Result": "Pass",
+        "run_id": "rid-547",
+        "test_case_id": "TC-NF-GATE-278-16"
+    },
+    {
+        "Executed_By": "Robot_Unit_06",
+        "Execution_Date": "21-05-2025 13:59",
+        "Observed_Time": 9725,
+        "Remarks": "Screen not responsive",
+        "Result": "Pass",
+        "run_id": "rid-561",
+        "test_case_id": "TC-F-ALL-018-34"
+    },
+    {
+        "Executed_By": "Robot_Unit_05",
+        "Execution_Date": "22-05-2025 15:12",
+        "Observed_Time": 948,
+        "Remarks": "All Steps Passed",
+        "Result": "Pass",
+        "run_id": "rid-570",
+        "test_case_id": "TC-F-FVM-154-39"
+    },
+    {
+        "Executed_By": "Robot_Unit_01",
+        "Execution_Date": "16-05-2025 15:52",
+        "Observed_Time": 3709,
+        "Remarks": "Test Passed Smoothly",
+        "Result": "Fail",
+        "run_id": "rid-575",
+        "test_case_id": "TC-F-GATE-READER-094-26"
+    },
+    {
+        "Executed_By": "Robot_Unit_03",
+        "Execution_Date": "18-05-2025 20:55",
+        "Observed_Time": 935,
+        "Remarks": "All Steps Passed",
+        "Result": "Pass",
+        "run_id": "rid-580",
+        "test_case_id": "TC-F-FVM-361-74"
+    },
+    {
+        "Executed_By": "Robot_Unit_00",
+        "Execution_Date": "16-05-2025 15:52",
+        "Observed_Time": 9469,
+        "Remarks": "Test Passed Smoothly",
+        "Result": "Pass",
+        "run_id": "rid-584",
+        "test_case_id": "TC-NF-GATE-490-62"
+    },
+    {
+        "Executed_By": "Robot_Unit_00",
+        "Execution_Date": "18-05-2025 20:55",
+        "Observed_Time": 8004,
+        "Remarks": "Incorrect result shown",
+        "Result": "Fail",
+        "run_id": "rid-586",
+        "test_case_id": "TC-F-GATE-READER-498-53"
+    },
+    {
+        "Executed_By": "Robot_Unit_09",
+        "Execution_Date": "16-05-2025 15:58",
+        "Observed_Time": 914,
+        "Remarks": "Card Not Detected",
+        "Result": "Pass",
+        "run_id": "rid-590",
+        "test_case_id": "TC-F-FVM-192-31"
+    },
+    {
+        "Executed_By": "Robot_Unit_06",
+        "Execution_Date": "22-05-2025 13:55",
+        "Observed_Time": 4959,
+        "Remarks": "Screen not responsive",
+        "Result": "Fail",
+        "run_id": "rid-591",
+        "test_case_id": "TC-F-GATE-READER-144-94"
+    },
+    {
+        "Executed_By": "Robot_Unit_08",
+        "Execution_Date": "22-05-2025 13:55",
+        "Observed_Time": 4122,
+        "Remarks": "Incorrect result shown",
+        "Result": "Pass",
+        "run_id": "rid-595",
+        "test_case_id": "TC-F-GATE-READER-411-72"
+    },
+    {
+        "Executed_By": "Robot_Unit_00",
+        "Execution_Date": "22-05-2025 13:55",
+        "Observed_Time": 4244,
+        "Remarks": "Mechanical Arm Misaligned",
+        "Result": "Fail",
+        "run_id": "rid-605",
+        "test_case_id": "TC-F-GATE-READER-576-55"
+    },
+    {
+        "Executed_By": "Robot_Unit_00",
+        "Execution_Date": "21-05-2025 13:59",
+        "Observed_Time": 4638,
+        "Remarks": "Screen not responsive",
+        "Result": "Fail",
+        "run_id": "rid-606",
+        "test_case_id": "TC-F-GATE-READER-949-33"
+    },
+    {
+        "Executed_By": "Robot_Unit_05",
+        "Execution_Date": "21-05-2025 13:59",
+        "Observed_Time": 5042,
+        "Remarks": "Incorrect result shown",
+        "Result": "Fail",
+        "run_id": "rid-609",
+        "test_case_id": "TC-F-GATE-READER-949-33"
+    },
+    {
+        "Executed_By": "Robot_Unit_03",
+        "Execution_Date": "21-05-2025 13:59",
+        "Observed_Time": 3852,
+        "Remarks": "Minor Delay Observed",
+        "Result": "Fail",
+        "run_id": "rid-614",
+        "test_case_id": "TC-F-FVM-502-23"
+    },
+    {
+        "Executed_By": "Robot_Unit_00",
+        "Execution_Date": "22-05-2025 15:12",
+        "Observed_Time": 9335,
+        "Remarks": "Mechanical Arm Misaligned",
+        "Result": "Fail",
+        "run_id": "rid-617",
+        "test_case_id": "TC-F-FVM-699-62"
+    },
+    {
+        "Executed_By": "Robot_Unit_01",
+        "Execution_Date": "16-05-2025 15:52",
+        "Observed_Time": 4625,
+        "Remarks": "Card Not Detected",
+        "Result": "Pass",
+        "run_id": "rid-619",
+        "test_case_id": "TC-F-GATE-READER-972-23"
+    },
+    {
+        "Executed_By": "Robot_Unit_06",
+        "Execution_Date": "22-05-2025 15:12",
+        "Observed_Time": 4876,
+        "Remarks": "Card Not Detected",
+        "Result": "Fail",
+        "run_id": "rid-620",
+        "test_case_id": "TC-F-GATE-READER-430-77"
+    },
+    {
+        "Executed_By": "Robot_Unit_05",
+        "Execution_Date": "16-05-2025 15:52",
+        "Observed_Time": 6760,
+        "Remarks": "Screen not responsive",
+        "Result": "Fail",
+        "run_id": "rid-621",
+        "test_case_id": "TC-F-BUS-READER-530-28"
+    },
+    {
+        "Executed_By": "Robot_Unit_04",
+        "Execution_Date": "22-05-2025 15:12",
+        "Observed_Time": 6114,
+        "Remarks": "Card Not Detected",
+        "Result": "Pass",
+        "run_id": "rid-622",
+        "test_case_id": "TC-F-GATE-READER-942-22"
+    },
+    {
+        "Executed_By": "Robot_Unit_06",
+        "Execution_Date": "21-05-2025 13:59",
+        "Observed_Time": 3442,
+        "Remarks": "All Steps Passed",
+        "Result": "Fail",
+        "run_id": "rid-631",
+        "test_case_id": "TC-NF-GATE-465-11"
+    },
+    {
+        "Executed_By": "Robot_Unit_06",
+        "Execution_Date": "16-05-2025 15:52",
+        "Observed_Time": 1224,
+        "Remarks": "Minor Delay Observed",
+        "Result": "Fail",
+        "run_id": "rid-634",
+        "test_case_id": "TC-F-BUS-READER-474-04"
+    },
+    {
+        "Executed_By": "Robot_Unit_05",
+        "Execution_Date": "22-05-2025 13:55",
+        "Observed_Time": 1305,
+        "Remarks": "All Steps Passed",
+        "Result": "Fail",
+        "run_id": "rid-639",
+        "test_case_id": "TC-F-ALL-359-32"
+    },
+    {
+        "Executed_By": "Robot_Unit_01",
+        "Execution_Date": "18-05-2025 20:55",
+        "Observed_Time": 9506,
+        "Remarks": "Test Passed Smoothly",
+        "Result": "Fail",
+        "run_id": "rid-663",
+        "test_case_id": "TC-F-FVM-215-86"
+    },
+    {
+        "Executed_By": "Robot_Unit_00",
+        "Execution_Date": "16-05-2025 15:58",
+        "Observed_Time": 6481,
+        "Remarks": "All Steps Passed",
+        "Result": "Pass",
+        "run_id": "rid-670",
+        "test_case_id": "TC-F-GATE-READER-930-50"
+    },
+    {
+        "Executed_By": "Robot_Unit_01",
+        "Execution_Date": "21-05-2025 13:59",
+        "Observed_Time": 9763,
+        "Remarks": "Screen not responsive",
+        "Result": "Pass",
+        "run_id": "rid-673",
+        "test_case_id": "TC-F-GATE-READER-797-68"
+    },
+    {
+        "Executed_By": "Robot_Unit_08",
+        "Execution_Date": "21-05-2025 13:59",
+        "Observed_Time": 2592,
+        "Remarks": "Card Not Detected",
+        "Result": "Fail",
+        "run_id": "rid-677",
+        "test_case_id": "TC-F-ALL-018-34"
+    },
+    {
+        "Executed_By": "Robot_Unit_07",
+        "Execution_Date": "22-05-2025 13:55",
+        "Observed_Time": 8428,
+        "Remarks": "Test Passed Smoothly",
+        "Result": "Fail",
+        "run_id": "rid-680",
+        "test_case_id": "TC-F-BUS-READER-546-93"
+    },
+    {
+        "Executed_By": "Robot_Unit_07",
+        "Execution_Date": "22-05-2025 13:55",
+        "Observed_Time": 5082,
+        "Remarks": "Test Passed Smoothly",
+        "Result": "Pass",
+        "run_id": "rid-689",
+        "test_case_id": "TC-F-GATE-READER-133-22"
+    },
+    {
+        "Executed_By": "Robot_Unit_03",
+        "Execution_Date": "21-05-2025 13:59",
+        "Observed_Time": 226,
+        "Remarks": "All Steps Passed",
+        "Result": "Pass",
+        "run_id": "rid-690",
+        "test_case_id": "TC-F-ALL-018-34"
+    },
+    {
+        "Executed_By": "Robot_Unit_07",
+        "Execution_Date": "18-05-2025 20:55",
+        "Observed_Time": 1794,
+        "Remarks": "Incorrect result shown",
+        "Result": "Pass",
+        "run_id": "rid-691",
+        "test_case_id": "TC-F-BUS-READER-915-08"
+    },
+    {
+        "Executed_By": "Robot_Unit_09",
+        "Execution_Date": "22-05-2025 15:12",
+        "Observed_Time": 4612,
+        "Remarks": "Test Passed Smoothly",
+        "Result": "Fail",
+        "run_id": "rid-695",
+        "test_case_id": "TC-F-FVM-863-55"
+    },
+    {
+        "Executed_By": "Robot_Unit_04",
+        "Execution_Date": "16-05-2025 15:52",
+        "Observed_Time": 7305,
+        "Remarks": "Screen not responsive",
+        "Result": "Fail",
+        "run_id": "rid-706",
+        "test_case_id": "TC-F-FVM-453-97"
+    },
+    {
+        "Executed_By": "Robot_Unit_05",
+        "Execution_Date": "22-05-2025 15:12",
+        "Observed_Time": 9153,
+        "Remarks": "Mechanical Arm Misaligned",
+        "Result": "Pass",
+        "run_id": "rid-709",
+        "test_case_id": "TC-F-ALL-045-41"
+    },
+    {
+        "Executed_By": "Robot_Unit_00",
+        "Execution_Date": "16-05-2025 15:52",
+        "Observed_Time": 5265,
+        "Remarks": "Test Passed Smoothly",
+        "Result": "Pass",
+        "run_id": "rid-720",
+        "test_case_id": "TC-F-GATE-READER-972-23"
+    },
+    {
+        "Executed_By": "Robot_Unit_05",
+        "Execution_Date": "16-05-2025 15:58",
+        "Observed_Time": 2680,
+        "Remarks": "Test Passed Smoothly",
+        "Result": "Fail",
+        "run_id": "rid-725",
+        "test_case_id": "TC-F-GATE-READER-930-50"
+    },
+    {
+        "Executed_By": "Robot_Unit_04",
+        "Execution_Date": "16-05-2025 15:58",
+        "Observed_Time": 2218,
+        "Remarks": "Incorrect result shown",
+        "Result": "Pass",
+        "run_id": "rid-755",
+        "test_case_id": "TC-NF-GATE-863-86"
+    },
+    {
+        "Executed_By": "Robot_Unit_03",
+        "Execution_Date": "22-05-2025 15:12",
+        "Observed_Time": 4792,
+        "Remarks": "All Steps Passed",
+        "Result": "Fail",
+        "run_id": "rid-764",
+        "test_case_id": "TC-F-BUS-READER-510-77"
+    },
+    {
+        "Executed_By": "Robot_Unit_09",
+        "Execution_Date": "22-05-2025 15:12",
+        "Observed_Time": 8706,
+        "Remarks": "Minor Delay Observed",
+        "Result": "Pass",
+        "run_id": "rid-778",
+        "test_case_id": "TC-F-BUS-READER-257-07"
+    },
+    {
+        "Executed_By": "Robot_Unit_03",
+        "Execution_Date": "16-05-2025 15:52",
+        "Observed_Time": 3936,
+        "Remarks": "All Steps Passed",
+        "Result": "Pass",
+        "run_id": "rid-786",
+        "test_case_id": "TC-F-BUS-READER-530-28"
+    },
+    {
+        "Executed_By": "Robot_Unit_01",
+        "Execution_Date": "18-05-2025 20:55",
+        "Observed_Time": 2557,
+        "Remarks": "Incorrect result shown",
+        "Result": "Fail",
+        "run_id": "rid-793",
+        "test_case_id": "TC-F-BUS-READER-915-08"
+    },
+    {
+        "Executed_By": "Robot_Unit_04",
+        "Execution_Date": "16-05-2025 15:58",
+        "Observed_Time": 6235,
+        "Remarks": "Test Passed Smoothly",
+        "Result": "Pass",
+        "run_id": "rid-798",
+        "test_case_id": "TC-F-GATE-READER-305-46"
+    },
+    {
+        "Executed_By": "Robot_Unit_09",
+        "Execution_Date": "22-05-2025 13:55",
+        "Observed_Time": 8787,
+        "Remarks": "All Steps Passed",
+        "Result": "Pass",
+        "run_id": "rid-813",
+        "test_case_id": "TC-F-GATE-READER-133-22"
+    },
+    {
+        "Executed_By": "Robot_Unit_08",
+        "Execution_Date": "21-05-2025 13:59",
+        "Observed_Time": 4881,
+        "Remarks": "Incorrect result shown",
+        "Result": "Pass",
+        "run_id": "rid-820",
+        "test_case_id": "TC-NF-GATE-175-15"
+    },
+    {
+        "Executed_By": "Robot_Unit_04",
+        "Execution_Date": "22-05-2025 15:12",
+        "Observed_Time": 5944,
+        "Remarks": "All Steps Passed",
+        "Result": "Fail",
+        "run_id": "rid-821",
+        "test_case_id": "TC-F-FVM-176-78"
+    },
+    {
+        "Executed_By": "Robot_Unit_04",
+        "Execution_Date": "22-05-2025 13:55",
+        "Observed_Time": 5005,
+        "Remarks": "Mechanical Arm Misaligned",
+        "Result": "Fail",
+        "run_id": "rid-828",
+        "test_case_id": "TC-F-GATE-READER-059-92"
+    },
+    {
+        "Executed_By": "Robot_Unit_06",
+        "Execution_Date": "16-05-2025 15:58",
+        "Observed_Time": 9055,
+        "Remarks": "Incorrect result shown",
+        "Result": "Fail",
+        "run_id": "rid-832",
+        "test_case_id": "TC-F-FVM-815-57"
+    },
+    {
+        "Executed_By": "Robot_Unit_07",
+        "Execution_Date": "18-05-2025 20:55",
+        "Observed_Time": 3360,
+        "Remarks": "Minor Delay Observed",
+        "Result": "Pass",
+        "run_id": "rid-834",
+        "test_case_id": "TC-F-GATE-READER-254-27"
+    },
+    {
+        "Executed_By": "Robot_Unit_06",
+        "Execution_Date": "16-05-2025 15:52",
+        "Observed_Time": 9961,
+        "Remarks": "Incorrect result shown",
+        "Result": "Pass",
+        "run_id": "rid-838",
+        "test_case_id": "TC-F-FVM-453-97"
+    },
+    {
+        "Executed_By": "Robot_Unit_09",
+        "Execution_Date": "16-05-2025 15:52",
+        "Observed_Time": 2174,
+        "Remarks": "All Steps Passed",
+        "Result": "Fail",
+        "run_id": "rid-839",
+        "test_case_id": "TC-F-GATE-READER-754-53"
+    },
+    {
+        "Executed_By": "Robot_Unit_01",
+        "Execution_Date": "22-05-2025 13:55",
+        "Observed_Time": 3674,
+        "Remarks": "All Steps Passed",
+        "Result": "Pass",
+        "run_id": "rid-844",
+        "test_case_id": "TC-F-FVM-372-76"
+    },
+    {
+        "Executed_By": "Robot_Unit_01",
+        "Execution_Date": "22-05-2025 13:55",
+        "Observed_Time": 8299,
+        "Remarks": "All Steps Passed",
+        "Result": "Pass",
+        "run_id": "rid-849",
+        "test_case_id": "TC-F-FVM-041-26"
+    },
+    {
+        "Executed_By": "Robot_Unit_05",
+        "Execution_Date": "16-05-2025 15:52",
+        "Observed_Time": 1179,
+        "Remarks": "Card Not Detected",
+        "Result": "Fail",
+        "run_id": "rid-872",
+        "test_case_id": "TC-F-BUS-READER-530-28"
+    },
+    {
+        "Executed_By": "Robot_Unit_01",
+        "Execution_Date": "18-05-2025 20:55",
+        "Observed_Time": 1534,
+        "Remarks": "Mechanical Arm Misaligned",
+        "Result": "Fail",
+        "run_id": "rid-888",
+        "test_case_id": "TC-F-BUS-READER-207-51"
+    },
+    {
+        "Executed_By": "Robot_Unit_09",
+        "Execution_Date": "22-05-2025 15:12",
+        "Observed_Time": 7227,
+        "Remarks": "Test Passed Smoothly",
+        "Result": "Fail",
+        "run_id": "rid-894",
+        "test_case_id": "TC-F-BUS-READER-053-68"
+    },
+    {
+        "Executed_By": "Robot_Unit_06",
+        "Execution_Date": "16-05-2025 15:52",
+        "Observed_Time": 7443,
+        "Remarks": "Test Passed Smoothly",
+        "Result": "Pass",
+        "run_id": "rid-899",
+        "test_case_id": "TC-F-GATE-READER-334-81"
+    },
+    {
+        "Executed_By": "Robot_Unit_03",
+        "Execution_Date": "16-05-2025 15:58",
+        "Observed_Time": 2185,
+        "Remarks": "Card Not Detected",
+        "Result": "Fail",
+        "run_id": "rid-925",
+        "test_case_id": "TC-F-FVM-815-57"
+    },
+    {
+        "Executed_By": "Robot_Unit_02",
+        "Execution_Date": "22-05-2025 13:55",
+        "Observed_Time": 3683,
+        "Remarks": "Screen not responsive",
+        "Result": "Fail",
+        "run_id": "rid-931",
+        "test_case_id": "TC-F-FVM-521-52"
+    },
+    {
+        "Executed_By": "Robot_Unit_07",
+        "Execution_Date": "18-05-2025 20:55",
+        "Observed_Time": 9842,
+        "Remarks": "Mechanical Arm Misaligned",
+        "Result": "Pass",
+        "run_id": "rid-938",
+        "test_case_id": "TC-F-BUS-READER-915-08"
+    },
+    {
+        "Executed_By": "Robot_Unit_08",
+        "Execution_Date": "21-05-2025 13:59",
+        "Observed_Time": 9762,
+        "Remarks": "Card Not Detected",
+        "Result": "Pass",
+        "run_id": "rid-959",
+        "test_case_id": "TC-F-GATE-READER-949-33"
+    },
+    {
+        "Executed_By": "Robot_Unit_08",
+        "Execution_Date": "18-05-2025 20:55",
+        "Observed_Time": 661,
+        "Remarks": "All Steps Passed",
+        "Result": "Fail",
+        "run_id": "rid-970",
+        "test_case_id": "TC-F-BUS-READER-915-08"
+    }
+]
+
+DEFECTS = [
+    {
+        "DefectID": "RT-10001",
+        "Severity": "Medium",
+        "Status": "In-Progress",
+        "Test_Case_ID": "TC-NF-GATE-728-87",
+        "Title": "Screen Freeze During Payment",
+        "created_at": "2025-05-22 15:12:13",
+        "fixed_at": "2025-06-20 07:56:13",
+        "reported_by": "qa_user_02"
+    },
+    {
+        "DefectID": "RT-10002",
+        "Severity": "Medium",
+        "Status": "In-Progress",
+        "Test_Case_ID": "TC-F-FVM-154-39",
+        "Title": "NFC Module Not Initializing",
+        "created_at": "2025-05-22 15:12:13",
+        "fixed_at": "2025-06-03 10:47:13",
+        "reported_by": "qa_user_02"
+    },
+    {
+        "DefectID": "RT-10003",
+        "Severity": "Low",
+        "Status": "Resolved",
+        "Test_Case_ID": "TC-F-FVM-699-62",
+        "Title": "Wrong Fare Deducted",
+        "created_at": "2025-05-22 15:12:13",
+        "fixed_at": "2025-05-31 16:36:13",
+        "reported_by": "Robot_Unit_04"
+    },
+    {
+        "DefectID": "RT-10004",
+        "Severity": "High",
+        "Status": "Closed",
+        "Test_Case_ID": "TC-F-ALL-908-92",
+        "Title": "Gate shows GO on insufficient balance",
+        "created_at": "2025-05-22 15:12:13",
+        "fixed_at": "2025-06-17 18:36:13",
+        "reported_by": "qa_user_08"
+    },
+    {
+        "DefectID": "RT-10005",
+        "Severity": "High",
+        "Status": "In-Progress",
+        "Test_Case_ID": "TC-F-BUS-READER-053-68",
+        "Title": "Crash on selecting monthly pass",
+        "created_at": "2025-05-22 15:12:13",
+        "fixed_at": "2025-06-13 09:05:13",
+        "reported_by": "qa_user_02"
+    },
+    {
+        "DefectID": "RT-10006",
+        "Severity": "Medium",
+        "Status": "Open",
+        "Test_Case_ID": "TC-F-FVM-176-78",
+        "Title": "Screen Freeze During Payment",
+        "created_at": "2025-05-22 15:12:13",
+        "fixed_at": "2025-06-21 09:30:13",
+        "reported_by": "qa_user_02"
+    },
+    {
+        "DefectID": "RT-10007",
+        "Severity": "High",
+        "Status": "Closed",
+        "Test_Case_ID": "TC-F-GATE-READER-430-77",
+        "Title": "Gate shows GO on insufficient balance",
+        "created_at": "2025-05-22 15:12:13",
+        "fixed_at": "2025-06-18 11:04:13",
+        "reported_by": "qa_user_09"
+    },
+    {
+        "DefectID": "RT-10008",
+        "Severity": "High",
+        "Status": "Resolved",
+        "Test_Case_ID": "TC-F-GATE-READER-430-77",
+        "Title": "Wrong Fare Deducted",
+        "created_at": "2025-05-22 15:12:13",
+        "fixed_at": "2025-06-07 13:36:13",
+        "reported_by": "Robot_Unit_05"
+    },
+    {
+        "DefectID": "RT-10009",
+        "Severity": "High",
+        "Status": "In-Progress",
+        "Test_Case_ID": "TC-F-FVM-176-78",
+        "Title": "NFC Module Not Initializing",
+        "created_at": "2025-05-22 15:12:13",
+        "fixed_at": "2025-06-06 04:43:13",
+        "reported_by": "Robot_Unit_08"
+    },
+    {
+        "DefectID": "RT-10010",
+        "Severity": "Low",
+        "Status": "In-Progress",
+        "Test_Case_ID": "TC-F-GATE-READER-942-22",
+        "Title": "Incorrect Balance shown after reload",
+        "created_at": "2025-05-22 15:12:13",
+        "fixed_at": "2025-06-14 11:53:13",
+        "reported_by": "Robot_Unit_01"
+    }
+]
+
+TEST_TYPE_SUMMARY = [
+    {
+        "Actual": "306ms",
+        "Expected": "<=249ms",
+        "Metrics": "Average Response Time",
+        "Status": "Pass",
+        "Test_Date": "2025-05-05",
+        "Test_Type": "Battery Drain Test - Robot"
+    },
+    {
+        "Actual": "66.74%",
+        "Expected": "<=86%",
+        "Metrics": "CPU Utilization",
+        "Status": "Pass",
+        "Test_Date": "2025-05-19",
+        "Test_Type": "Battery Drain Test - Robot"
+    },
+    {
+        "Actual": "0.31GB",
+        "Expected": "<=4.4GB",
+        "Metrics": "Memory Usage",
+        "Status": "Pass",
+        "Test_Date": "2025-05-04",
+        "Test_Type": "Battery Drain Test - Robot"
+    },
+    {
+        "Actual": "7.5s",
+        "Expected": "<234ms",
+        "Metrics": "Recovery Time From Crash",
+        "Status": "Pass",
+        "Test_Date": "2025-04-29",
+        "Test_Type": "Battery Drain Test - Robot"
+    },
+    {
+        "Actual": "99.98%",
+        "Expected": ">=62.62%",
+        "Metrics": "System Up time",
+        "Status": "Fail",
+        "Test_Date": "2025-05-01",
+        "Test_Type": "Battery Drain Test - Robot"
+    },
+    {
+        "Actual": "153ms",
+        "Expected": "<223ms",
+        "Metrics": "Average Response Time",
+        "Status": "Pass",
+        "Test_Date": "2025-05-03",
+        "Test_Type": "Latency Test - NFC Tap"
+    },
+    {
+        "Actual": "35.67%",
+        "Expected": "<=56%",
+        "Metrics": "Battery Usage per hour",
+        "Status": "Fail",
+        "Test_Date": "2025-05-01",
+        "Test_Type": "Latency Test - NFC Tap"
+    },
+    {
+        "Actual": "1486",
+        "Expected": ">=4114",
+        "Metrics": "Concurrent Sessions Handled",
+        "Status": "Pass",
+        "Test_Date": "2025-05-02",
+        "Test_Type": "Latency Test - NFC Tap"
+    },
+    {
+        "Actual": "1.89GB",
+        "Expected": "<=2.2GB",
+        "Metrics": "Memory Usage",
+        "Status": "Fail",
+        "Test_Date": "2025-04-28",
+        "Test_Type": "Latency Test - NFC Tap"
+    },
+    {
+        "Actual": "78ms",
+        "Expected": "<=452ms",
+        "Metrics": "Average Response Time",
+        "Status": "Pass",
+        "Test_Date": "2025-04-28",
+        "Test_Type": "Load Test - Gate Readers"
+    },
+    {
+        "Actual": "66.91%",
+        "Expected": "<=34%",
+        "Metrics": "CPU Utilization",
+        "Status": "Pass",
+        "Test_Date": "2025-05-09",
+        "Test_Type": "Load Test - Gate Readers"
+    },
+    {
+        "Actual": "2803",
+        "Expected": ">=4771",
+        "Metrics": "Concurrent Sessions Handled",
+        "Status": "Fail",
+        "Test_Date": "2025-04-27",
+        "Test_Type": "Load Test - Gate Readers"
+    },
+    {
+        "Actual": "5.5s",
+        "Expected": "<493ms",
+        "Metrics": "Recovery Time From Crash",
+        "Status": "Fail",
+        "Test_Date": "2025-05-13",
+        "Test_Type": "Load Test - Gate Readers"
+    },
+    {
+        "Actual": "99.03%",
+        "Expected": ">=22.22%",
+        "Metrics": "System Up time",
+        "Status": "Pass",
+        "Test_Date": "2025-05-05",
+        "Test_Type": "Load Test - Gate Readers"
+    },
+    {
+        "Actual": "73.04%",
+        "Expected": "<=63%",
+        "Metrics": "CPU Utilization",
+        "Status": "Pass",
+        "Test_Date": "2025-05-19",
+        "Test_Type": "Memory Usage Test - Controller"
+    },
+    {
+        "Actual": "213",
+        "Expected": ">=3532",
+        "Metrics": "Concurrent Sessions Handled",
+        "Status": "Pass",
+        "Test_Date": "2025-04-27",
+        "Test_Type": "Memory Usage Test - Controller"
+    },
+    {
+        "Actual": "2375",
+        "Expected": ">=1314",
+        "Metrics": "Max Transactions per hour",
+        "Status": "Fail",
+        "Test_Date": "2025-04-20",
+        "Test_Type": "Memory Usage Test - Controller"
+    },
+    {
+        "Actual": "21.46%",
+        "Expected": "<=49%",
+        "Metrics": "CPU Utilization",
+        "Status": "Fail",
+        "Test_Date": "2025-05-17",
+        "Test_Type": "Performance Test - FVM"
+    },
+    {
+        "Actual": "586",
+        "Expected": ">=4654",
+        "Metrics": "Max Transactions per hour",
+        "Status": "Fail",
+        "Test_Date": "2025-05-21",
+        "Test_Type": "Performance Test - FVM"
+    },
+    {
+        "Actual": "1.04GB",
+        "Expected": "<=3.3GB",
+        "Metrics": "Memory Usage",
+        "Status": "Pass",
+        "Test_Date": "2025-05-16",
+        "Test_Type": "Performance Test - FVM"
+    },
+    {
+        "Actual": "1.0s",
+        "Expected": "<154ms",
+        "Metrics": "Recovery Time From Crash",
+        "Status": "Pass",
+        "Test_Date": "2025-05-14",
+        "Test_Type": "Performance Test - FVM"
+    },
+    {
+        "Actual": "114ms",
+        "Expected": "<=257ms",
+        "Metrics": "Average Response Time",
+        "Status": "Fail",
+        "Test_Date": "2025-04-21",
+        "Test_Type": "Response Time Validation - All Devices"
+    },
+    {
+        "Actual": "225",
+        "Expected": ">=4192",
+        "Metrics": "Concurrent Sessions Handled",
+        "Status": "Fail",
+        "Test_Date": "2025-05-19",
+        "Test_Type": "Response Time Validation - All Devices"
+    },
+    {
+        "Actual": "4390",
+        "Expected": ">=2492",
+        "Metrics": "Max Transactions per hour",
+        "Status": "Fail",
+        "Test_Date": "2025-05-15",
+        "Test_Type": "Response Time Validation - All Devices"
+    },
+    {
+        "Actual": "99.62%",
+        "Expected": ">=46.46%",
+        "Metrics": "System Up time",
+        "Status": "Fail",
+        "Test_Date": "2025-05-07",
+        "Test_Type": "Response Time Validation - All Devices"
+    },
+    {
+        "Actual": "566ms",
+        "Expected": "<312ms",
+        "Metrics": "Transaction Completion Time",
+        "Status": "Fail",
+        "Test_Date": "2025-05-12",
+        "Test_Type": "Response Time Validation - All Devices"
+    },
+    {
+        "Actual": "266ms",
+        "Expected": "<293ms",
+        "Metrics": "Average Response Time",
+        "Status": "Fail",
+        "Test_Date": "2025-04-24",
+        "Test_Type": "Scalability Test-Backend"
+    },
+    {
+        "Actual": "55.05%",
+        "Expected": "<=36%",
+        "Metrics": "CPU Utilization",
+        "Status": "Fail",
+        "Test_Date": "2025-05-04",
+        "Test_Type": "Scalability Test-Backend"
+    },
+    {
+        "Actual": "4109",
+        "Expected": ">=2083",
+        "Metrics": "Max Transactions per hour",
+        "Status": "Pass",
+        "Test_Date": "2025-05-06",
+        "Test_Type": "Scalability Test-Backend"
+    },
+    {
+        "Actual": "6.9s",
+        "Expected": "<288ms",
+        "Metrics": "Recovery Time From Crash",
+        "Status": "Pass",
+        "Test_Date": "2025-05-11",
+        "Test_Type": "Scalability Test-Backend"
+    },
+    {
+        "Actual": "99.05%",
+        "Expected": ">=1.1%",
+        "Metrics": "System Up time",
+        "Status": "Pass",
+        "Test_Date": "2025-05-22",
+        "Test_Type": "Scalability Test-Backend"
+    },
+    {
+        "Actual": "3125",
+        "Expected": ">=2282",
+        "Metrics": "Concurrent Sessions Handled",
+        "Status": "Fail",
+        "Test_Date": "2025-05-01",
+        "Test_Type": "Stress Test-Bus Readers"
+    },
+    {
+        "Actual": "1.46GB",
+        "Expected": "<=2.2GB",
+        "Metrics": "Memory Usage",
+        "Status": "Pass",
+        "Test_Date": "2025-05-18",
+        "Test_Type": "Stress Test-Bus Readers"
+    },
+    {
+        "Actual": "3.3s",
+        "Expected": "<252ms",
+        "Metrics": "Recovery Time From Crash",
+        "Status": "Fail",
+        "Test_Date": "2025-04-29",
+        "Test_Type": "Stress Test-Bus Readers"
+    },
+    {
+        "Actual": "386ms",
+        "Expected": "<=420ms",
+        "Metrics": "Transaction Completion Time",
+        "Status": "Fail",
+        "Test_Date": "2025-04-26",
+        "Test_Type": "Stress Test-Bus Readers"
+    }
+]
+
+TRANSIT_METRICS_DAILY = [
+    {
+        "Avg Response Time": 288,
+        "Bus Taps": 9145,
+        "Date": "2025-05-10",
+        "Defect Count": 7,
+        "FVM Transactions": 102,
+        "Gate Taps": 20741,
+        "Notes": "Data Incomplete Due to network Issue",
+        "Success Rate Bus": "91.61",
+        "Success Rate Gate": "92.64"
+    },
+    {
+        "Avg Response Time": 439,
+        "Bus Taps": 3387,
+        "Date": "2025-05-11",
+        "Defect Count": 6,
+        "FVM Transactions": 3183,
+        "Gate Taps": 10202,
+        "Notes": "Bus Taps Errors Observed",
+        "Success Rate Bus": "92.14",
+        "Success Rate Gate": "94.17"
+    },
+    {
+        "Avg Response Time": 221,
+        "Bus Taps": 3388,
+        "Date": "2025-05-12",
+        "Defect Count": 9,
+        "FVM Transactions": 195,
+        "Gate Taps": 2612,
+        "Notes": "Minor Delay in gate Readers",
+        "Success Rate Bus": "95.50",
+        "Success Rate Gate": "93.39"
+    },
+    {
+        "Avg Response Time": 164,
+        "Bus Taps": 1621,
+        "Date": "2025-05-13",
+        "Defect Count": 0,
+        "FVM Transactions": 9229,
+        "Gate Taps": 18961,
+        "Notes": "Minor Delay in gate Readers",
+        "Success Rate Bus": "93.63",
+        "Success Rate Gate": "94.69"
+    },
+    {
+        "Avg Response Time": 290,
+        "Bus Taps": 7296,
+        "Date": "2025-05-14",
+        "Defect Count": 2,
+        "FVM Transactions": 492,
+        "Gate Taps": 5395,
+        "Notes": "Data Incomplete Due to network Issue",
+        "Success Rate Bus": "99.84",
+        "Success Rate Gate": "99.76"
+    },
+    {
+        "Avg Response Time": 412,
+        "Bus Taps": 7579,
+        "Date": "2025-05-15",
+        "Defect Count": 1,
+        "FVM Transactions": 9323,
+        "Gate Taps": 22476,
+        "Notes": "Minor Delay in gate Readers",
+        "Success Rate Bus": "95.88",
+        "Success Rate Gate": "97.01"
+    },
+    {
+        "Avg Response Time": 87,
+        "Bus Taps": 5634,
+        "Date": "2025-05-16",
+        "Defect Count": 1,
+        "FVM Transactions": 9759,
+        "Gate Taps": 42895,
+        "Notes": "Minor Delay in gate Readers",
+        "Success Rate Bus": "95.70",
+        "Success Rate Gate": "95.81"
+    },
+    {
+        "Avg Response Time": 126,
+        "Bus Taps": 4791,
+        "Date": "2025-05-17",
+        "Defect Count": 3,
+        "FVM Transactions": 669,
+        "Gate Taps": 17784,
+        "Notes": "Bus Taps Errors Observed",
+        "Success Rate Bus": "90.94",
+        "Success Rate Gate": "95.49"
+    },
+    {
+        "Avg Response Time": 446,
+        "Bus Taps": 9971,
+        "Date": "2025-05-18",
+        "Defect Count": 8,
+        "FVM Transactions": 332,
+        "Gate Taps": 28939,
+        "Notes": "Data Incomplete Due to network Issue",
+        "Success Rate Bus": "90.98",
+        "Success Rate Gate": "92.19"
+    },
+    {
+        "Avg Response Time": 379,
+        "Bus Taps": 4851,
+        "Date": "2025-05-19",
+        "Defect Count": 7,
+        "FVM Transactions": 9376,
+        "Gate Taps": 16670,
+        "Notes": "Normal Operation",
+        "Success Rate Bus": "97.30",
+        "Success Rate Gate": "95.73"
+    },
+    {
+        "Avg Response Time": 154,
+        "Bus Taps": 5787,
+        "Date": "2025-05-20",
+        "Defect Count": 4,
+        "FVM Transactions": 807,
+        "Gate Taps": 1938,
+        "Notes": "Normal Operation",
+        "Success Rate Bus": "99.28",
+        "Success Rate Gate": "99.80"
+    },
+    {
+        "Avg Response Time": 333,
+        "Bus Taps": 5081,
+        "Date": "2025-05-21",
+        "Defect Count": 4,
+        "FVM Transactions": 420,
+        "Gate Taps": 30669,
+        "Notes": "Observed High Tap Volume at metro line 3",
+        "Success Rate Bus": "95.53",
+        "Success Rate Gate": "93.72"
+    },
+    {
+        "Avg Response Time": 215,
+        "Bus Taps": 2663,
+        "Date": "2025-05-22",
+        "Defect Count": 9,
+        "FVM Transactions": 9985,
+        "Gate Taps": 5400,
+        "Notes": "Few gate rejections due to hotlisted cards",
+        "Success Rate Bus": "91.39",
+        "Success Rate Gate": "92.06"
+    }
+]
+
+REQUIREMENTS = [
+    {
+        "component": "FVM",
+        "created_at": "Fri, 16 May 2025 10:28:19 GMT",
+        "description": "FVM should accept cash as payment method",
+        "jira_id": "JIRA-5802",
+        "priority": "Low",
+        "requirement_id": "BU-913",
+        "status": "Accepted",
+        "title": "FVM should accept Credit and Debit"
+    },
+    {
+        "component": "Gate Reader",
+        "created_at": "Wed, 21 May 2025 08:28:40 GMT",
+        "description": "FVM should allow refund option if transaction fails",
+        "jira_id": "JIRA-8519",
+        "priority": "Low",
+        "requirement_id": "BU-961",
+        "status": "Rejected",
+        "title": "Receipt should contain transaction ID, amount"
+    },
+    {
+        "component": "Bus Reader",
+        "created_at": "Fri, 16 May 2025 10:28:21 GMT",
+        "description": "FVM should show error messages for card read failures",
+        "jira_id": "JIRA-4953",
+        "priority": "High",
+        "requirement_id": "F-ALL-104",
+        "status": "In Review",
+        "title": "Gate Reader should be able to tap"
+    },
+    {
+        "component": "FVM",
+        "created_at": "Sun, 18 May 2025 15:25:07 GMT",
+        "description": "FVM should accept credit and debit cards as payment methods",
+        "jira_id": "JIRA-7775",
+        "priority": "Medium",
+        "requirement_id": "F-ALL-413",
+        "status": "Design Completed",
+        "title": "Gate reader should log every successful otp"
+    },
+    {
+        "component": "Bus Reader",
+        "created_at": "Fri, 16 May 2025 10:22:06 GMT",
+        "description": "Gate reader should retry backend sync every 30 seconds if offline",
+        "jira_id": "JIRA-9589",
+        "priority": "Low",
+        "requirement_id": "F-ALL-465",
+        "status": "Implementation Completed",
+        "title": "Bus reader should detect direction"
+    },
+    {
+        "component": "Bus Reader",
+        "created_at": "Fri, 16 May 2025 10:21:58 GMT",
+        "description": "Bus reader should detect direction of tap using GPS Zone",
+        "jira_id": "JIRA-9511",
+        "priority": "High",
+        "requirement_id": "F-ALL-744",
+        "title": "Gate reader should log every rejection"
+    },
+    {
+        "component": "ALL",
+        "created_at": "Fri, 16 May 2025 10:28:07 GMT",
+        "description": "Receipt should contain transaction ID, amount paid, card id, payment method, date and time",
+        "jira_id": "JIRA-6169",
+        "priority": "Low",
+        "requirement_id": "F-ALL-815",
+        "status": "Done",
+        "title": "Reject Invalid Card on Gate"
+    },
+    {
+        "component": "Gate Reader",
+        "created_at": "Sun, 18 May 2025 15:25:08 GMT",
+        "description": "FVM should lock screen when service mode is active",
+        "jira_id": "JIRA-9441",
+        "priority": "High",
+        "requirement_id": "F-ALL-837",
+        "status": "Testing Completed",
+        "title": "FVM should accept Credit and Debit"
+    },
+    {
+        "component": "ALL",
+        "created_at": "Fri, 16 May 2025 10:28:04 GMT",
+        "description": "Gate reader should be able to read DesFire,MiFare, credit card and barcode",
+        "jira_id": "JIRA-3109",
+        "priority": "Medium",
+        "requirement_id": "F-ALL-906",
+        "title": "FVM should retry card processing up"
+    },
+    {
+        "component": "Bus Reader",
+        "created_at": "Sun, 18 May 2025 15:25:07 GMT",
+        "description": "Receipt should contain transaction ID, amount paid, card id, payment method, date and time",
+        "jira_id": "JIRA-7860",
+        "priority": "High",
+        "requirement_id": "F-ALL-945",
+        "status": "Done",
+        "title": "Purchase TransitCard using FVM"
+    },
+    {
+        "component": "Gate Reader",
+        "created_at": "Fri, 16 May 2025 10:27:59 GMT",
+        "description": "Users should be able to check balance before purchase",
+        "jira_id": "JIRA-5829",
+        "priority": "Low",
+        "requirement_id": "F-BUS-102",
+        "status": "In Review",
+        "title": "FVM should accept Credit and Debit"
+    },
+    {
+        "component": "Bus Reader",
+        "created_at": "Fri, 16 May 2025 10:28:14 GMT",
+        "description": "User should be able to purchase a smartcard using FVM",
+        "jira_id": "JIRA-2604",
+        "priority": "Medium",
+        "requirement_id": "F-BUS-512",
+        "status": "In Review",
+        "title": "Fast transaction completion"
+    },
+    {
+        "component": "FVM",
+        "created_at": "Fri, 16 May 2025 10:22:08 GMT",
+        "description": "Bus reader should be able to determine entry vs exit taps",
+        "jira_id": "JIRA-4376",
+        "priority": "Medium",
+        "requirement_id": "F-BUS-645",
+        "status": "In Review",
+        "title": "FVM should retry card processing up"
+    },
+    {
+        "component": "Gate Reader",
+        "created_at": "Wed, 21 May 2025 08:28:52 GMT",
+        "description": "Bus reader should be able to determine entry vs exit taps",
+        "jira_id": "JIRA-6566",
+        "priority": "Medium",
+        "requirement_id": "F-BUS-784",
+        "status": "In Review",
+        "title": "Fast transaction completion"
+    }
+]
+
+RUN_DATE = '%d-%m-%Y %H:%M'
+DEFECT_DATE = '%Y-%m-%d %H:%M:%S'
+ISO_DATE = '%Y-%m-%d'
+HTTP_DATE = '%a, %d %b %Y %H:%M:%S GMT'
+
+# Loads and uploads repeat the same few timestamps over and over (a whole
+# batch of runs shares an Execution_Date), and strptime is the dearest step
+# of taking in a row, so each distinct string is only parsed once.
+@functools.lru_cache(maxsize=65536)
+def parse_timestamp(value, fmt):
+    return int(datetime.strptime(value, fmt).replace(tzinfo=timezone.utc).timestamp())
+
+TOKEN = re.compile(r'[a-z0-9]+')
+COMPARATORS = ('<', '<=', '>', '>=', '=')
+MEASURE = re.compile(r'^\s*(<=|>=|<|>|=)?\s*([-+]?(?:\d+\.?\d*|\.\d+))\s*([a-z%]*)\s*$', re.IGNORECASE)
+# Unit -> (base unit, factor): durations compare in ms, sizes in MB.
+UNITS = {
+    '': ('', 1), '%': ('%', 1),
+    'ms': ('ms', 1), 's': ('ms', 1000), 'sec': ('ms', 1000), 'min': ('ms', 60000),
+    'kb': ('MB', 1 / 1024), 'mb': ('MB', 1), 'gb': ('MB', 1024), 'tb': ('MB', 1024 * 1024),
+}
+
+@functools.lru_cache(maxsize=65536)
+def parse_measure(value):
+    """``'<=4.4GB'`` -> ``('<=', 4505.6, 'MB')``; ``(None, None, None)`` if unparseable."""
+    match = MEASURE.match(str(value if value is not None else ''))
+    if match is None or match.group(3).lower() not in UNITS:
+        return None, None, None
+    unit, factor = UNITS[match.group(3).lower()]
+    return match.group(1), float(match.group(2)) * factor, unit
+
+def text(value):
+    value = (value if value.__class__ is str else str(value)).strip()
+    if not value:
+        raise ValueError('empty')
+    return value
+
+def identifier(value):
+    # Seed test cases use numeric ids; keep numbers as numbers.
+    return value if isinstance(value, int) else text(value)
+
+def integer(value):
+    if isinstance(value, str):
+        value = value.strip()
+    if isinstance(value, float) and not value.is_integer():
+        raise ValueError('not a whole number')
+    return int(value)
+
+def decimal_text(value):
+    float(value)
+    return str(value).strip()
+
+def timestamp_text(fmt):
+    def convert(value):
+        value = text(value)
+        parse_timestamp(value, fmt)
+        return value
+    return convert
+
+def optional(convert):
+    def convert_optional(value):
+        return convert(value)
+    convert_optional.optional = True
+    return convert_optional
+
+@functools.lru_cache(maxsize=65536)
+def component_of(test_case_id):
+    # TC-F-GATE-READER-797-68 -> GATE-READER
+    parts = str(test_case_id).split('-')
+    return '-'.join(parts[2:-2]) if len(parts) > 4 else ''
+
+def field(name):
+    return lambda record: record.get(name)
+
+OUTCOMES = {'pass': True, 'fail': False}
+
+@functools.lru_cache(maxsize=256)
+def result_outcome(result):
+    return OUTCOMES.get(str(result).strip().lower())
+
+def outcome(run):
+    return result_outcome(run.get('Result', ''))
+
+def label(*names):
+    # Same fallback as the dashboard: first populated field, else 'Unknown'.
+    if len(names) == 1:
+        # The common case, and called per row on every write: skip the
+        # generator.
+        name, = names
+        return lambda record: record.get(name) or 'Unknown'
+    return lambda record: next((record[name] for name in names if record.get(name)), 'Unknown')
+
+# Free-text fields per collection and their search weights.
+SEARCH_FIELDS = {
+    'testcases': {'title': 2},
+    'testruns': {'Remarks': 1},
+    'defects': {'Title': 2},
+    'requirements': {'title': 2, 'description': 1},
+}
+
+# GlobalSearchBar field -> collection -> where to look it up: PRIMARY_KEY
+# for the collection's own ID, a filter name to reuse that filter's hash
+# buckets, or how to read the value from a record to give it a PrefixIndex
+# of its own. Only free text needs the last; the others cost no memory
+# beyond what the collection already keeps.
+PRIMARY_KEY = None
+GLOBAL_SEARCH_FIELDS = {
+    'Test_Case_ID': {
+        'testcases': 'Test_Case_ID',
+        'testruns': 'Test_Case_ID',
+        'defects': 'Test_Case_ID',
+    },
+    'DefectID': {'defects': PRIMARY_KEY},
+    'run_id': {'testruns': PRIMARY_KEY},
+    'Requirement_ID': {
+        'requirements': PRIMARY_KEY,
+        'testcases': 'Requirement_ID',
+    },
+    'Component': {
+        'testcases': 'Component',
+        'testruns': 'Component',
+        'defects': 'Component',
+        'requirements': 'Component',
+    },
+    'Status': {
+        'testcases': 'Status',
+        'defects': 'Status',
+        'requirements': 'Status',
+    },
+    'Title': {
+        'testcases': field('title'),
+        'defects': field('Title'),
+        'requirements': field('title'),
+    },
+}
+
+def load_store():
+    store = RecordStore()
+    store.add_collection('testcases', 'id', TEST_CASES, filters={
+        'Test_Case_ID': field('id'),
+        'Status': field('status'),
+        'Component': field('component'),
+        'Requirement_ID': field('requirement_id'),
+    }, counters={'status': label('Status', 'status')}, schema={
+        'id': identifier,
+        'title': text,
+        'type': optional(text),
+        'component': optional(text),
+        'requirement_id': optional(identifier),
+        'status': optional(text),
+        'created_by': optional(text),
+    })
+    store.add_collection('testruns', 'run_id', TEST_RUNS,
+                         dates={'Execution_Date': RUN_DATE},
+                         ordering='Execution_Date',
+                         rows=ColumnarRows('run_id',
+                                           categorical=('test_case_id', 'Executed_By', 'Execution_Date',
+                                                        'Result', 'Remarks'),
+                                           integers=('Observed_Time',),
+                                           timestamps=('Execution_Date',)),
+                         filters={
+                             'Test_Case_ID': field('test_case_id'),
+                             'Component': lambda run: component_of(run['test_case_id']),
+                             'Result': field('Result'),
+                             'Executed_By': field('Executed_By'),
+                         },
+                         counters={'result': label('result', 'Result')},
+                         schema={
+                             'run_id': text,
+                             'test_case_id': text,
+                             'Executed_By': text,
+                             'Execution_Date': timestamp_text(RUN_DATE),
+                             'Observed_Time': integer,
+                             'Result': text,
+                             'Remarks': optional(text),
+                         })
+    store.add_collection('defects', 'DefectID', DEFECTS,
+                         dates={'created_at': DEFECT_DATE, 'fixed_at': DEFECT_DATE},
+                         ordering='created_at',
+                         filters={
+                             'Test_Case_ID': field('Test_Case_ID'),
+                             'Component': lambda defect: component_of(defect['Test_Case_ID']),
+                             'Status': field('Status'),
+                             'Severity': field('Severity'),
+                         },
+                         counters={'status': label('Status')},
+                         schema={
+                             'DefectID': text,
+                             'Test_Case_ID': text,
+                             'Title': text,
+                             'Severity': text,
+                             'Status': text,
+                             'created_at': timestamp_text(DEFECT_DATE),
+                             'fixed_at': optional(timestamp_text(DEFECT_DATE)),
+                             'reported_by': optional(text),
+                         })
+    store.add_collection('testtypesummary', ('Test_Type', 'Metrics', 'Test_Date'), TEST_TYPE_SUMMARY,
+                         dates={'Test_Date': ISO_DATE},
+                         ordering='Test_Date',
+                         filters={
+                             'Status': field('Status'),
+                             'Test_Type': field('Test_Type'),
+                         },
+                         counters={'status': label('Status')},
+                         schema={
+                             'Test_Type': text,
+                             'Metrics': text,
+                             'Test_Date': timestamp_text(ISO_DATE),
+                             'Actual': text,
+                             'Expected': text,
+                             'Status': text,
+                         })
+    store.add_collection('transitmetricsdaily', 'Date', TRANSIT_METRICS_DAILY,
+                         dates={'Date': ISO_DATE},
+                         ordering='Date',
+                         schema={
+                             'Date': timestamp_text(ISO_DATE),
+                             'Bus Taps': integer,
+                             'Gate Taps': integer,
+                             'FVM Transactions': integer,
+                             'Avg Response Time': integer,
+                             'Defect Count': integer,
+                             'Success Rate Bus': decimal_text,
+                             'Success Rate Gate': decimal_text,
+                             'Notes': optional(text),
+                         })
+    store.add_collection('requirements', 'requirement_id', REQUIREMENTS,
+                         dates={'created_at': HTTP_DATE},
+                         ordering='created_at',
+                         filters={
+                             'Status': field('status'),
+                             'Component': field('component'),
+                         },
+                         counters={'status': label('status')},
+                         schema={
+                             'requirement_id': text,
+                             'title': text,
+                             'description': optional(text),
+                             'component': text,
+                             'priority': optional(text),
+                             'status': optional(text),
+                             'jira_id': optional(text),
+                             'created_at': timestamp_text(HTTP_DATE),
+                         })
+    for search_field, sources in GLOBAL_SEARCH_FIELDS.items():
+        for name, source in sources.items():
+            collection = store[name]
+            if source is PRIMARY_KEY:
+                if 'ids' not in collection.derived:
+                    collection.add_index('ids', KeyIndex())
+            elif not isinstance(source, str):
+                collection.add_index('ids:' + search_field, PrefixIndex(source))
+    for name, fields in SEARCH_FIELDS.items():
+        store[name].add_index('text', TextIndex(fields))
+    store['testcases'].add_index('structured', BodyCache(structured_body, MAX_CACHED_DETAILS))
+    defects = store['defects']
+    defects.add_index('fix_times', FixTimeIndex(
+        defects.timestamps['created_at'].get, defects.timestamps['fixed_at'].get,
+        lambda defect: str(defect.get('Status', '')).strip().lower() in FIXED_STATUSES,
+        {'severity': field('Severity'), 'reporter': field('reported_by')}))
+    summary = store['testtypesummary']
+    summary.add_index('thresholds', ThresholdIndex(summary.timestamps['Test_Date'].__getitem__))
+    runs = store['testruns']
+    history = runs.add_index('history', RunHistoryIndex(field('test_case_id'),
+                                                        runs.timestamps['Execution_Date'].__getitem__, outcome))
+    runs.add_index('fleet', FleetIndex(label('Executed_By'), runs.timestamps['Execution_Date'].get,
+                                       field('Observed_Time'), outcome, label('Remarks')))
+    component, priority = label('component'), label('priority')
+    coverage = CoverageMatrix(lambda requirement: (component(requirement), priority(requirement)),
+                              field('requirement_id'), history.latest, lambda entry: entry[2])
+    for name in ('requirements', 'testcases', 'testruns'):
+        store[name].add_index('coverage', coverage.feed(name))
+    return store
+
+store = load_store()
+
+if BaseApplication is not None:
+    class ProductionServer(BaseApplication):
+        """Gunicorn around the already-loaded app.
+
+        ``preload_app`` means the store above is built once in the master
+        and forked into each worker, so workers share its pages
+        copy-on-write instead of each parsing the dataset again.
+        """
+
+        def __init__(self, options):
+            self.options = options
+            super().__init__()
+
+        def load_config(self):
+            for name, value in self.options.items():
+                self.cfg.set(name, value)
+
+        def load(self):
+            return app
+
+def serve(host, port, workers, threads, subscribers, debug=False):
+    global UPLOADS_ENABLED, MAX_SUBSCRIBERS
+    if BaseApplication is None:
+        print('gunicorn is not installed; serving from one threaded process instead', file=sys.stderr)
+        app.run(host=host, port=port, debug=debug, threaded=True, use_reloader=False)
+        return
+    app.debug = debug
+    if workers > 1:
+        # Each worker has its own copy of the store and its own version
+        # clock, so writes taken by one would be invisible to the others
+        # and versions would collide. Serve read-only instead: every worker
+        # then holds the same preloaded store under the master's BOOT_ID, so
+        # an ETag from one is a valid conditional GET against any other.
+        UPLOADS_ENABLED = False
+    # Move everything loaded so far out of the collector's reach; otherwise
+    # GC passes (and refcount updates on tracked containers) in each
+    # worker touch the pages holding the store and undo copy-on-write.
+    MAX_SUBSCRIBERS = subscribers
+    gc.freeze()
+    ProductionServer({
+        'bind': '%s:%d' % (host, port),
+        'workers': workers,
+        'threads': threads,
+        'worker_class': 'gthread',
+        'preload_app': True,
+        'loglevel': 'debug' if debug else 'info',
+        'keepalive': 5,
+        # SSE subscribers never finish their request, so don't wait long
+        # for them on shutdown; they reconnect with Last-Event-ID.
+        'graceful_timeout': 5,
+    }).run()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Mock TestRail API server.')
+    commands = parser.add_subparsers(dest='command')
+    commands.add_parser('run', help='Flask development server with the debugger (the default)')
+    production = commands.add_parser('serve', help='multi-worker, multi-threaded production server')
+    production.add_argument('--host', default=os.environ.get('MOCK_TESTRAIL_HOST', '127.0.0.1'))
+    production.add_argument('--port', type=int, default=int(os.environ.get('MOCK_TESTRAIL_PORT', 5001)))
+    production.add_argument('--workers', type=int, default=int(os.environ.get('MOCK_TESTRAIL_WORKERS', 1)),
+                            help='worker processes (default 1); with more than one the server is '
+                                 'read-only and POST uploads are rejected')
+    production.add_argument('--threads', type=int, default=int(os.environ.get('MOCK_TESTRAIL_THREADS', 8)),
+                            help='threads per worker (default 8)')
+    production.add_argument('--subscribers', type=int, default=os.environ.get('MOCK_TESTRAIL_SUBSCRIBERS'),
+                            help='open /mock_testrail/changes streams per worker, each holding a thread '
+                                 'while connected (default half the threads); more get a 503')
+    production.add_argument('--debug', action='store_true')
+    args = parser.parse_args(argv)
+    if args.command == 'serve':
+        subscribers = args.threads // 2 if args.subscribers is None else args.subscribers
+        if not 0 <= subscribers < args.threads:
+            parser.error('--subscribers must leave at least one of the %d threads for other requests'
+                         % args.threads)
+        serve(args.host, args.port, args.workers, args.threads, subscribers, args.debug)
+    else:
+        app.run(port=5001, debug=True)
+
 if __name__ == '__main__':
-    app.run(port=5001, debug=True) 
+    main() 
@@ -0,0 +1,680 @@
+"""Tests for mock_testrail.
+
+Index tests drive a freshly loaded store through random upserts,
+replacements and deletes, and after every step compare what the indexes
+hold with what a plain pass over the current rows says they should hold.
+Route tests go through Flask's test client against a fresh store too.
+"""
+import base64
+import collections
+import io
+import json
+import random
+import threading
+
+import pytest
+
+import mock_testrail
+from mock_testrail import FIXED_STATUSES, label, load_store, normalize_term, outcome
+
+SEEDS = range(8)
+STEPS = 60
+
+CASES = ['TC-F-FVM-%d-1' % number for number in range(12)]
+REQUIREMENTS = ['REQ-%d' % number for number in range(6)]
+ROBOTS = ['Robot_Unit_%02d' % number for number in range(4)]
+RESULTS = ['Pass', 'Fail', 'Blocked', 'pass ']
+REMARKS = [None, '', 'Timeout', 'Screen not responsive']
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """A test client over a freshly loaded store, so route tests can write."""
+    monkeypatch.setattr(mock_testrail, 'store', load_store())
+    return mock_testrail.app.test_client()
+
+
+def run_date(rng):
+    # Few distinct days and minutes, so runs tie and arrive out of order.
+    return '%02d-05-2025 %02d:%02d' % (rng.randint(1, 4), rng.randint(0, 23), rng.choice((0, 30)))
+
+
+def random_run(rng):
+    return {
+        'run_id': 'rid-%d' % rng.randrange(40),
+        'test_case_id': rng.choice(CASES),
+        'Executed_By': rng.choice(ROBOTS),
+        'Execution_Date': run_date(rng),
+        'Observed_Time': rng.randrange(5000),
+        'Result': rng.choice(RESULTS),
+        'Remarks': rng.choice(REMARKS),
+    }
+
+
+def random_case(rng):
+    return {
+        'id': rng.choice(CASES),
+        'title': 'case',
+        'requirement_id': rng.choice(REQUIREMENTS + [None, '']),
+        'status': 'Active',
+    }
+
+
+def random_requirement(rng):
+    return {
+        'requirement_id': rng.choice(REQUIREMENTS),
+        'title': 'requirement',
+        'component': rng.choice(['FVM', 'Gate Reader', '']),
+        'priority': rng.choice(['Low', 'High', None]),
+        'created_at': 'Fri, 16 May 2025 10:28:19 GMT',
+    }
+
+
+def random_defect(rng):
+    created = rng.randint(1, 20)
+    return {
+        'DefectID': 'RT-%d' % rng.randrange(25),
+        'Test_Case_ID': rng.choice(CASES),
+        'Title': 'defect',
+        'Severity': rng.choice(['Low', 'High', '']),
+        'Status': rng.choice(['Open', 'Resolved', 'closed', 'In-Progress']),
+        'created_at': '2025-05-%02d 10:00:00' % created,
+        'fixed_at': rng.choice([None, '2025-05-%02d 09:00:00' % rng.randint(created, 28)]),
+        'reported_by': rng.choice(['qa_user', None]),
+    }
+
+
+GENERATORS = {
+    'testruns': random_run,
+    'testcases': random_case,
+    'requirements': random_requirement,
+    'defects': random_defect,
+}
+
+
+def mutate(store, rng, names):
+    """Apply one random batch upsert or delete to one of ``names``."""
+    name = rng.choice(names)
+    collection = store[name]
+    if len(collection) and rng.random() < 0.3:
+        collection.delete(rng.choice([key for key, _ in collection.rows.items()]))
+    else:
+        collection.insert_many([GENERATORS[name](rng) for _ in range(rng.randint(1, 8))])
+
+
+def expected_histories(runs):
+    histories = collections.defaultdict(list)
+    for key, run in runs.rows.items():
+        passed = outcome(run)
+        if passed is not None:
+            histories[run['test_case_id']].append((runs.timestamp('Execution_Date', key), key, passed))
+    flips = {}
+    for group, history in histories.items():
+        history.sort()
+        flips[group] = sum(a[2] != b[2] for a, b in zip(history, history[1:]))
+    return dict(histories), flips
+
+
+def expected_cells(store):
+    runs = store['testruns']
+    latest = {}
+    for key, run in runs.rows.items():
+        passed = outcome(run)
+        if passed is None:
+            continue
+        case = normalize_term(run['test_case_id'])
+        rank = (runs.timestamp('Execution_Date', key), key)
+        if case not in latest or rank > latest[case][0]:
+            latest[case] = (rank, passed)
+    covered = set()
+    for key, case in store['testcases'].rows.items():
+        found = latest.get(normalize_term(key))
+        if case.get('requirement_id') not in (None, '') and found is not None and found[1]:
+            covered.add(normalize_term(case['requirement_id']))
+    cells = collections.defaultdict(lambda: [0, 0])
+    for key, requirement in store['requirements'].rows.items():
+        counts = cells[(label('component')(requirement), label('priority')(requirement))]
+        counts[0] += 1
+        counts[1] += normalize_term(key) in covered
+    return dict(cells)
+
+
+def expected_fleet(runs):
+    cells = {}
+    for key, run in runs.rows.items():
+        epoch = runs.timestamp('Execution_Date', key)
+        cell = cells.setdefault((label('Executed_By')(run), epoch - epoch % 86400),
+                                [0, 0, 0, 0, collections.Counter()])
+        passed = outcome(run)
+        cell[0] += 1
+        cell[1] += run['Observed_Time']
+        cell[2] += passed is not None
+        if passed is False:
+            cell[3] += 1
+            cell[4][label('Remarks')(run)] += 1
+    return cells
+
+
+def expected_fix_times(defects):
+    totals = collections.defaultdict(lambda: [0, 0])
+    durations = collections.defaultdict(collections.Counter)
+    open_since = collections.defaultdict(collections.Counter)
+    for key, defect in defects.rows.items():
+        created = defects.timestamp('created_at', key)
+        if str(defect.get('Status', '')).strip().lower() in FIXED_STATUSES:
+            fixed = defects.timestamp('fixed_at', key)
+            if fixed is None or fixed < created:
+                continue
+            for group in (('overall', 'ALL'), ('severity', defect.get('Severity') or 'Unknown'),
+                          ('reporter', defect.get('reported_by') or 'Unknown')):
+                totals[group][0] += 1
+                totals[group][1] += fixed - created
+                durations[group][fixed - created] += 1
+        else:
+            for severity in ('ALL', defect.get('Severity') or 'Unknown'):
+                open_since[severity][created] += 1
+    return dict(totals), dict(durations), dict(open_since)
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_filters_counters_and_postings(seed):
+    store, rng = load_store(), random.Random(seed)
+    for _ in range(STEPS):
+        mutate(store, rng, ['testruns', 'defects'])
+        for name in ('testruns', 'defects'):
+            collection = store[name]
+            rows = list(collection.rows.items())
+            for index in collection.filters.values():
+                buckets = collections.defaultdict(set)
+                for key, record in rows:
+                    buckets[normalize_term(index.value_of(record))].add(key)
+                assert index.buckets == buckets
+            for index in collection.counters.values():
+                assert index.counts == collections.Counter(index.value_of(record) for _, record in rows)
+            text = collection.derived['text']
+            postings = collections.defaultdict(dict)
+            for key, record in rows:
+                values = tuple(record.get(field) for field in text.fields)
+                for term, weight in mock_testrail.term_weights(tuple(text.fields.items()), values).items():
+                    postings[term][key] = weight
+            assert text.postings == postings
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_run_history_flips(seed):
+    store, rng = load_store(), random.Random(seed)
+    history = store['testruns'].derived['history']
+    for _ in range(STEPS):
+        mutate(store, rng, ['testruns'])
+        histories, flips = expected_histories(store['testruns'])
+        assert history.histories == histories
+        assert {group: count for group, count in history.flips.items() if count} == \
+            {group: count for group, count in flips.items() if count}
+        assert set(history.flips) <= set(history.histories)
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_coverage_matrix(seed):
+    store, rng = load_store(), random.Random(seed)
+    matrix = store['requirements'].derived['coverage'].matrix
+    for _ in range(STEPS):
+        mutate(store, rng, ['testruns', 'testcases', 'requirements'])
+        assert {cell: list(counts) for cell, counts in matrix.cells.items()} == expected_cells(store)
+
+
+def test_coverage_route_follows_the_latest_verdict(client):
+    def audit_cell():
+        body = client.get('/mock_testrail/analytics/coverage').get_json()
+        return body['by_component']['Audit']
+
+    assert client.post('/mock_testrail/requirements', json={
+        'requirement_id': 'REQ-AUDIT-1', 'title': 'Audit trail', 'component': 'Audit', 'priority': 'High',
+        'created_at': 'Fri, 16 May 2025 10:28:19 GMT'}).status_code == 201
+    assert client.post('/mock_testrail/testcases', json={
+        'id': 'TC-AUDIT-1', 'title': 'Audit', 'requirement_id': 'REQ-AUDIT-1', 'status': 'Active'}).status_code == 201
+    assert audit_cell()['covered'] == 0
+    run = {'run_id': 'audit-1', 'test_case_id': 'tc-audit-1 ', 'Executed_By': 'Robot_Unit_01',
+           'Execution_Date': '01-05-2025 10:00', 'Observed_Time': 10, 'Result': 'Pass'}
+    assert client.post('/mock_testrail/testruns', json=run).status_code == 201
+    assert audit_cell()['covered'] == 1
+    # A later run without a verdict leaves the last Pass/Fail standing.
+    assert client.post('/mock_testrail/testruns', json=dict(
+        run, run_id='audit-2', Execution_Date='02-05-2025 10:00', Result='Blocked')).status_code == 201
+    assert audit_cell()['covered'] == 1
+    assert client.post('/mock_testrail/testruns', json=dict(
+        run, run_id='audit-3', Execution_Date='03-05-2025 10:00', Result='Fail')).status_code == 201
+    assert audit_cell() == {'requirements': 1, 'covered': 0, 'coverage': 0.0}
+
+
+def test_traceability_reads_survive_concurrent_uploads(client):
+    assert client.post('/mock_testrail/requirements', json={
+        'requirement_id': 'REQ-TRACE-1', 'title': 'Trace', 'component': 'Trace', 'priority': 'Low',
+        'created_at': 'Fri, 16 May 2025 10:28:19 GMT'}).status_code == 201
+    assert client.post('/mock_testrail/testcases', json={
+        'id': 'TC-TRACE-1', 'title': 'Trace', 'requirement_id': 'REQ-TRACE-1', 'status': 'Active'}).status_code == 201
+    runs, done = mock_testrail.store['testruns'], threading.Event()
+
+    def upload():
+        for batch in range(40):
+            runs.insert_many([{'run_id': 'trace-%d-%d' % (batch, number), 'test_case_id': 'TC-TRACE-1',
+                               'Executed_By': 'Robot_Unit_01', 'Execution_Date': '01-05-2025 %02d:00' % (batch % 24),
+                               'Observed_Time': 1, 'Result': 'Pass'} for number in range(200)])
+        done.set()
+
+    writer = threading.Thread(target=upload)
+    writer.start()
+    statuses = []
+    while not done.is_set():
+        statuses.append(client.get('/mock_testrail/traceability?requirement_id=REQ-TRACE-1').status_code)
+    writer.join()
+    assert set(statuses) <= {200}
+    body = client.get('/mock_testrail/traceability?requirement_id=REQ-TRACE-1').get_json()
+    # Ties on Execution_Date go to the greatest run key.
+    assert body['test_cases'][0]['latest_run']['run_id'] == 'trace-23-99'
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_fleet_cells(seed):
+    store, rng = load_store(), random.Random(seed)
+    fleet = store['testruns'].derived['fleet']
+    for _ in range(STEPS):
+        mutate(store, rng, ['testruns'])
+        assert fleet.cells == expected_fleet(store['testruns'])
+
+
+def test_search_keeps_the_commonest_completions(client, monkeypatch):
+    monkeypatch.setattr(mock_testrail, 'MAX_PREFIX_TERMS', 8)
+    # zeta00..zeta19 once each, and the alphabetically last, zeta19, in
+    # five more records: it must survive the cap.
+    cases = [{'id': 9000 + number, 'title': 'zeta%02d' % number} for number in range(20)]
+    cases += [{'id': 9100 + number, 'title': 'zeta19 again'} for number in range(5)]
+    assert client.post('/mock_testrail/testcases', json=cases).status_code == 201
+    body = client.get('/mock_testrail/search?q=zeta&collections=testcases&limit=100').get_json()
+    assert body['truncated'] == ['zeta']
+    assert body['total']['testcases'] == 8 + 5
+    assert {9019, 9100, 9101, 9102, 9103, 9104} <= {hit['record']['id'] for hit in body['results']}
+    body = client.get('/mock_testrail/search?q=zeta19&collections=testcases').get_json()
+    assert body['truncated'] == [] and body['total']['testcases'] == 6
+
+
+@pytest.mark.parametrize('seed', SEEDS[:3])
+def test_global_search_matches_a_scan(client, seed):
+    store, rng = mock_testrail.store, random.Random(seed)
+    values = {
+        'run_id': lambda name, key, record: key,
+        'DefectID': lambda name, key, record: key,
+        'Test_Case_ID': lambda name, key, record: record['id' if name == 'testcases' else
+                                                          'test_case_id' if name == 'testruns' else 'Test_Case_ID'],
+        'Component': lambda name, key, record: record['component'] if name in ('testcases', 'requirements') else
+            mock_testrail.component_of(record['test_case_id' if name == 'testruns' else 'Test_Case_ID']),
+    }
+    queries = [('run_id', 'rid-1', 'prefix'), ('run_id', 'RID-12', 'exact'), ('DefectID', 'rt-', 'prefix'),
+               ('Test_Case_ID', 'tc-f-fvm-1', 'prefix'), ('Component', 'FVM', 'exact'), ('Component', 'g', 'prefix')]
+    for _ in range(20):
+        mutate(store, rng, ['testruns', 'defects'])
+        for search_field, term, match in queries:
+            body = client.get('/mock_testrail/globalsearch?field=%s&term=%s&match=%s&limit=5'
+                              % (search_field, term, match)).get_json()
+            for name, found in body['results'].items():
+                collection = store[name]
+                hits = sorted((normalize_term(values[search_field](name, key, record)), key)
+                              for key, record in collection.rows.items())
+                hits = [key for value, key in hits
+                        if (value.startswith(normalize_term(term)) if match == 'prefix' else value == normalize_term(term))]
+                assert found['total'] == len(hits)
+                assert [collection.key_of(record) for record in found['data']] == hits[:5]
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_fix_time_aggregates(seed):
+    store, rng = load_store(), random.Random(seed)
+    fix_times = store['defects'].derived['fix_times']
+    for _ in range(STEPS):
+        mutate(store, rng, ['defects'])
+        totals, durations, open_since = expected_fix_times(store['defects'])
+        assert {group: list(counts) for group, counts in fix_times.totals.items()} == totals
+        assert dict(fix_times.durations) == durations
+        assert dict(fix_times.open_since) == open_since
+
+
+def expected_changes(log, version):
+    latest = {key: deleted for logged, key, deleted in log if logged > version}
+    return (sorted(key for key, deleted in latest.items() if not deleted),
+            sorted(key for key, deleted in latest.items() if deleted))
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_changelog_trim(seed, monkeypatch):
+    monkeypatch.setattr(mock_testrail, 'MAX_CHANGELOG', 10)
+    store, rng = load_store(), random.Random(seed)
+    runs = store['testruns']
+    # Every write since the load, never trimmed.
+    log = list(runs.changelog)
+    for _ in range(STEPS):
+        if rng.random() < 0.3:
+            key = rng.choice([key for key, _ in runs.rows.items()])
+            runs.delete(key)
+            log.append((runs.version, key, True))
+        elif rng.random() < 0.2:
+            # Versions issued to another collection are valid runs versions too.
+            store['defects'].insert_many([random_defect(rng)])
+        else:
+            batch = [random_run(rng) for _ in range(rng.randint(1, 8))]
+            runs.insert_many(batch)
+            log.extend((runs.version, run['run_id'], False) for run in batch)
+        assert len(runs.changelog) <= 2 * mock_testrail.MAX_CHANGELOG
+        floor, issued = runs.changelog_floor, mock_testrail.VERSION_CLOCK.issued
+        versions = {entry[0] for entry in log} | {floor, store['defects'].version, issued,
+                                                   mock_testrail.BOOT_VERSION - 1, issued + 1}
+        for version in versions:
+            changes = runs.changes_since(version)
+            if floor <= version <= issued:
+                assert changes is not None
+                assert (sorted(changes[0]), sorted(changes[1])) == expected_changes(log, version)
+            else:
+                assert changes is None
+    assert runs.changelog_floor > mock_testrail.BOOT_VERSION
+
+
+DEFECT = {
+    'DefectID': 'RT-99001',
+    'Test_Case_ID': 'TC-F-FVM-1-1',
+    'Title': 'Receipt printer jams',
+    'Severity': 'High',
+    'Status': 'Open',
+    'created_at': '2025-05-01 10:00:00',
+}
+
+
+def test_conditional_gets(client):
+    first = client.get('/mock_testrail/defects')
+    etag, last_modified = first.headers['ETag'], first.headers['Last-Modified']
+    assert client.get('/mock_testrail/defects', headers={'If-None-Match': etag}).status_code == 304
+    assert client.get('/mock_testrail/defects', headers={'If-Modified-Since': last_modified}).status_code == 304
+    gzipped = client.get('/mock_testrail/defects', headers={'Accept-Encoding': 'gzip'})
+    assert gzipped.headers['Content-Encoding'] == 'gzip' and gzipped.headers['ETag'] != etag
+    assert client.get('/mock_testrail/defects', headers={'Accept-Encoding': 'gzip',
+                                                          'If-None-Match': gzipped.headers['ETag']}).status_code == 304
+    paged = client.get('/mock_testrail/defects?limit=2')
+    assert client.get('/mock_testrail/defects?limit=2',
+                      headers={'If-None-Match': paged.headers['ETag']}).status_code == 304
+    client.post('/mock_testrail/defects', json=[DEFECT])
+    second = client.get('/mock_testrail/defects', headers={'If-None-Match': etag})
+    assert second.status_code == 200 and second.headers['ETag'] != etag
+    assert DEFECT['DefectID'] in {defect['DefectID'] for defect in second.get_json()}
+
+
+def test_structured_body_built_across_a_write_is_not_cached(client, monkeypatch):
+    collection = mock_testrail.store['testcases']
+    cache, build = collection.derived['structured'], collection.derived['structured'].build
+
+    def build_while_renamed(record):
+        # The record is rewritten between the cache miss and the store.
+        monkeypatch.setattr(cache, 'build', build)
+        collection.insert_many([dict(record, title='Renamed mid-build')])
+        return build(record)
+
+    monkeypatch.setattr(cache, 'build', build_while_renamed)
+    first = client.get('/mock_testrail/structuredtestcases/101')
+    assert first.get_json()['Title'] == 'Login with valid credentials'
+    second = client.get('/mock_testrail/structuredtestcases/101', headers={'If-None-Match': first.headers['ETag']})
+    assert second.status_code == 200 and second.get_json()['Title'] == 'Renamed mid-build'
+    assert client.get('/mock_testrail/structuredtestcases?ids=101').get_json()['data']['101']['Title'] == \
+        'Renamed mid-build'
+
+
+def walk_pages(client, url):
+    keys, cursor = [], None
+    while True:
+        response = client.get(url + ('&cursor=%s' % cursor if cursor else ''))
+        assert response.status_code == 200
+        page = response.get_json()
+        keys.extend(run['run_id'] for run in page['data'])
+        cursor = page['next_cursor']
+        if cursor is None:
+            return keys
+
+
+@pytest.mark.parametrize('order', ['asc', 'desc'])
+def test_cursor_pages_cover_the_ordering_once(client, order):
+    expected = [key for _, key in mock_testrail.store['testruns'].ordering.entries]
+    if order == 'desc':
+        expected.reverse()
+    assert walk_pages(client, '/mock_testrail/testruns?limit=37&order=%s' % order) == expected
+
+
+@pytest.mark.parametrize('query', [
+    'limit=5&cursor=not-a-cursor',
+    'limit=5&cursor=%s' % base64.urlsafe_b64encode(b'["x",1]').decode('ascii'),
+    'limit=5&order=sideways',
+    'limit=0',
+    'limit=%d' % (mock_testrail.MAX_PAGE_SIZE + 1),
+])
+def test_bad_paging_parameters_are_rejected(client, query):
+    assert client.get('/mock_testrail/testruns?' + query).status_code == 400
+
+
+@pytest.mark.parametrize('query', [
+    'Result=Pass',
+    'Result=Pass&Result=Fail&Executed_By=Robot_Unit_04',
+    'Result=Fail&date_from=2025-05-10',
+    'Test_Case_ID=TC-F-FVM-215-86',
+])
+@pytest.mark.parametrize('order', ['asc', 'desc'])
+def test_filtered_pages_match_the_filtered_list(client, query, order):
+    expected = [run['run_id'] for run in client.get('/mock_testrail/testruns?' + query).get_json()]
+    assert expected
+    if order == 'desc':
+        expected.reverse()
+    assert walk_pages(client, '/mock_testrail/testruns?%s&limit=7&order=%s' % (query, order)) == expected
+
+
+def test_unsupported_filters_are_rejected(client):
+    response = client.get('/mock_testrail/testruns?Severity=High')
+    assert response.status_code == 400 and 'Severity' in response.get_json()['error']
+    assert client.get('/mock_testrail/testruns?Result=Pass&_=123').status_code == 200
+
+
+def test_dashboard_since(client):
+    everything = client.get('/mock_testrail/dashboard').get_json()
+    version = everything['version']
+    assert set(everything['collections']) == set(mock_testrail.store.collections)
+    assert client.get('/mock_testrail/dashboard?since=%d' % version).get_json()['collections'] == {}
+    client.post('/mock_testrail/defects', json=[DEFECT])
+    changed = client.get('/mock_testrail/dashboard?since=%d' % version).get_json()
+    assert list(changed['collections']) == ['defects'] and changed['version'] > version
+    # A version from an earlier boot, or one never issued, resyncs everything.
+    for since in (5, mock_testrail.BOOT_VERSION - 1, changed['version'] + 10 ** 9):
+        resynced = client.get('/mock_testrail/dashboard?since=%d' % since).get_json()
+        assert set(resynced['collections']) == set(mock_testrail.store.collections)
+    assert client.get('/mock_testrail/dashboard?since=yesterday').status_code == 400
+
+
+def test_collection_since_follows_the_store_wide_clock(client):
+    version = client.get('/mock_testrail/dashboard').get_json()['version']
+    for name in ('defects', 'testruns', 'requirements'):
+        delta = client.get('/mock_testrail/%s?since=%d' % (name, version)).get_json()
+        assert delta == {'since': version, 'version': mock_testrail.store[name].version, 'snapshot': False,
+                         'upserted': [], 'deleted': []}
+    client.post('/mock_testrail/defects', json=[DEFECT])
+    delta = client.get('/mock_testrail/defects?since=%d' % version).get_json()
+    assert [defect['DefectID'] for defect in delta['upserted']] == [DEFECT['DefectID']]
+    assert not client.get('/mock_testrail/testruns?since=%d' % version).get_json()['snapshot']
+    unissued = client.get('/mock_testrail/defects?since=%d' % (mock_testrail.VERSION_CLOCK.issued + 1)).get_json()
+    assert unissued['snapshot'] and len(unissued['upserted']) == len(mock_testrail.store['defects'])
+
+
+@pytest.mark.parametrize('query', ['Status=Open', 'limit=5', 'cursor=x', 'order=desc', 'format=ndjson',
+                                   'date_from=2025-05-01'])
+def test_since_rejects_narrowing_parameters(client, query):
+    response = client.get('/mock_testrail/defects?since=%d&%s&_=1' % (mock_testrail.BOOT_VERSION, query))
+    assert response.status_code == 400
+    assert response.get_json()['error'] == 'since cannot be combined with %s' % query.split('=')[0]
+
+
+def test_nested_values_are_rejected_before_any_index_sees_them(client):
+    etag = client.get('/mock_testrail/testcases').headers['ETag']
+    response = client.post('/mock_testrail/testcases', json=[
+        {'id': 900, 'title': 't', 'Status': ['x']},
+        {'id': 901, 'title': 't', 'status': 'Active', 'tags': {'a': 1}},
+    ])
+    assert response.status_code == 400
+    body = response.get_json()
+    assert body['upserted'] == 0 and body['rejected'] == 2
+    assert [error['row'] for error in body['errors']] == [1, 2]
+    assert 900 not in {case['id'] for case in client.get('/mock_testrail/testcases').get_json()}
+    assert client.get('/mock_testrail/testcases', headers={'If-None-Match': etag}).status_code == 304
+    assert client.get('/mock_testrail/summary').status_code == 200
+
+
+def sse_frames(client, url, count, **headers):
+    response = client.get(url, headers=headers, buffered=False)
+    assert response.status_code == 200 and response.mimetype == 'text/event-stream'
+    frames = iter(response.response)
+    try:
+        return [next(frames).decode('utf-8') for _ in range(count)]
+    finally:
+        response.close()
+
+
+def test_change_feed_resumes_after_the_last_event_id(client, monkeypatch):
+    monkeypatch.setattr(mock_testrail, 'FEED_HEARTBEAT', 0.01)
+    start = mock_testrail.store.feed.sequence
+    client.post('/mock_testrail/defects', json=DEFECT)
+    client.post('/mock_testrail/testcases', json={'id': 'TC-FEED-1', 'title': 'Feed'})
+    last_event_id = '%s-%d' % (mock_testrail.BOOT_ID, start)
+    frames = sse_frames(client, '/mock_testrail/changes', 4, **{'Last-Event-ID': last_event_id})
+    assert frames[0] == 'retry: 3000\n\n'
+    ids, events = zip(*(frame.split('\n')[:2] for frame in frames[1:3]))
+    assert ids == ('id: %s-%d' % (mock_testrail.BOOT_ID, start + 1), 'id: %s-%d' % (mock_testrail.BOOT_ID, start + 2))
+    changes = [json.loads(frame.split('data: ', 1)[1]) for frame in frames[1:3]]
+    assert [(change['collection'], change['op'], change['keys']) for change in changes] == \
+        [('defects', 'insert', [DEFECT['DefectID']]), ('testcases', 'insert', ['TC-FEED-1'])]
+    assert changes[1]['version'] == mock_testrail.store['testcases'].version
+    assert frames[3] == ': heartbeat\n\n'
+    # Filtering by collection skips the other events but not their positions.
+    frames = sse_frames(client, '/mock_testrail/changes?collections=testcases', 2,
+                        **{'Last-Event-ID': last_event_id})
+    assert frames[1].startswith('id: %s-%d\nevent: change\n' % (mock_testrail.BOOT_ID, start + 2))
+
+
+def test_change_feed_resets_stale_and_foreign_event_ids(client, monkeypatch):
+    monkeypatch.setattr(mock_testrail, 'FEED_HEARTBEAT', 0.01)
+    client.post('/mock_testrail/defects', json=DEFECT)
+    sequence = mock_testrail.store.feed.sequence
+    reset = 'id: %s-%d\nevent: reset\ndata: {"sequence":%d}\n\n' % (mock_testrail.BOOT_ID, sequence, sequence)
+    assert sse_frames(client, '/mock_testrail/changes', 2, **{'Last-Event-ID': 'deadbeef-1'})[1] == reset
+    assert sse_frames(client, '/mock_testrail/changes', 2,
+                      **{'Last-Event-ID': '%s-%d' % (mock_testrail.BOOT_ID, sequence + 5)})[1] == reset
+    assert client.get('/mock_testrail/changes', headers={'Last-Event-ID': 'nonsense'}).status_code == 400
+    assert client.get('/mock_testrail/changes?collections=nope').status_code == 400
+
+
+def test_change_feed_turns_away_subscribers_past_the_cap(client, monkeypatch):
+    monkeypatch.setattr(mock_testrail, 'FEED_HEARTBEAT', 0.01)
+    monkeypatch.setattr(mock_testrail, 'MAX_SUBSCRIBERS', 1)
+    first = client.get('/mock_testrail/changes', buffered=False)
+    assert first.status_code == 200 and next(iter(first.response)) == b'retry: 3000\n\n'
+    second = client.get('/mock_testrail/changes', buffered=False)
+    assert second.status_code == 503 and second.headers['Retry-After'] == '3'
+    assert client.get('/mock_testrail/summary').status_code == 200
+    first.close()
+    assert sse_frames(client, '/mock_testrail/changes', 1) == ['retry: 3000\n\n']
+    assert mock_testrail.store.feed.subscribers == 0
+
+
+RUN_CSV = ('run_id,test_case_id,Executed_By,Execution_Date,Observed_Time,Result,Remarks\n'
+           'up-1,TC-F-FVM-1-1,Robot_Unit_01,01-05-2025 10:00,120,Pass,\n'
+           'up-2,TC-F-FVM-1-1,Robot_Unit_01,01-05-2025 11:00,not-a-number,Fail,Timeout\n'
+           '"up-3","TC-F-FVM-2-1","Robot_Unit_02","02-05-2025 09:30",95,"Fail","Jam, then reset"\n')
+RUNS = [
+    {'run_id': 'up-1', 'test_case_id': 'TC-F-FVM-1-1', 'Executed_By': 'Robot_Unit_01',
+     'Execution_Date': '01-05-2025 10:00', 'Observed_Time': 120, 'Result': 'Pass'},
+    {'run_id': 'up-3', 'test_case_id': 'TC-F-FVM-2-1', 'Executed_By': 'Robot_Unit_02',
+     'Execution_Date': '02-05-2025 09:30', 'Observed_Time': 95, 'Result': 'Fail', 'Remarks': 'Jam, then reset'},
+]
+
+
+def uploaded_runs(client):
+    return {run['run_id']: run for run in client.get('/mock_testrail/testruns').get_json()
+            if run['run_id'].startswith('up-')}
+
+
+def test_csv_upload_converts_fields_and_reports_bad_rows(client):
+    response = client.post('/mock_testrail/testruns', data=RUN_CSV, content_type='text/csv')
+    assert response.status_code == 201
+    body = response.get_json()
+    assert body['upserted'] == 2 and body['rejected'] == 1
+    assert body['errors'] == [{'row': 2, 'error': "Observed_Time has an invalid value 'not-a-number'"}]
+    runs = uploaded_runs(client)
+    assert runs['up-1']['Observed_Time'] == 120 and runs['up-3']['Remarks'] == 'Jam, then reset'
+
+
+@pytest.mark.parametrize('content_type, body', [
+    ('application/json', json.dumps(RUNS, indent=2)),
+    ('application/x-ndjson', '\n'.join(json.dumps(run) for run in RUNS) + '\n'),
+])
+def test_json_uploads_survive_records_split_across_reads(client, monkeypatch, content_type, body):
+    monkeypatch.setattr(mock_testrail, 'UPLOAD_READ_CHUNK', 7)
+    response = client.post('/mock_testrail/testruns', data=body, content_type=content_type)
+    assert response.status_code == 201 and response.get_json()['upserted'] == 2
+    assert uploaded_runs(client) == {run['run_id']: run for run in RUNS}
+
+
+def test_single_object_and_multipart_uploads(client):
+    assert client.post('/mock_testrail/defects', json=DEFECT).get_json()['upserted'] == 1
+    response = client.post('/mock_testrail/testruns', content_type='multipart/form-data',
+                           data={'file': (io.BytesIO(RUN_CSV.encode('utf-8')), 'runs.csv')})
+    assert response.status_code == 201 and response.get_json()['upserted'] == 2
+
+
+@pytest.mark.parametrize('content_type, body, status', [
+    ('text/plain', 'hello', 415),
+    ('application/json', '', 400),
+    ('application/json', '{"run_id": ', 400),
+    ('application/json', '[{"run_id": "up-9"}]', 400),
+    ('application/json', '[1, 2]', 400),
+    ('application/json', '[] []', 400),
+])
+def test_upload_error_statuses(client, content_type, body, status):
+    etag = client.get('/mock_testrail/testruns').headers['ETag']
+    assert client.post('/mock_testrail/testruns', data=body, content_type=content_type).status_code == status
+    assert client.get('/mock_testrail/testruns').headers['ETag'] == etag
+
+
+def test_upload_cut_short_keeps_the_batches_already_taken(client, monkeypatch):
+    monkeypatch.setattr(mock_testrail, 'UPLOAD_BATCH', 1)
+    body = json.dumps(RUNS)[:-1] + ', {"run_id": '
+    response = client.post('/mock_testrail/testruns', data=body, content_type='application/json')
+    assert response.status_code == 207
+    assert response.get_json()['upserted'] == 2 and 'stopped early' in response.get_json()['error']
+    assert set(uploaded_runs(client)) == {'up-1', 'up-3'}
+
+
+def test_latency_by_component_follows_new_test_case_ids(client):
+    pytest.importorskip('numpy')
+
+    def expected():
+        counts = collections.Counter(mock_testrail.component_of(run['test_case_id'])
+                                     for run in client.get('/mock_testrail/testruns').get_json()
+                                     if isinstance(run.get('Observed_Time'), int))
+        return dict(counts)
+
+    def served():
+        groups = client.get('/mock_testrail/analytics/latency?group_by=Component').get_json()['groups']
+        return {component: group['count'] for component, group in groups.items()}
+
+    assert served() == expected()
+    client.post('/mock_testrail/testruns', json=[dict(RUNS[0], run_id='up-%d' % number,
+                                                      test_case_id='TC-F-NEW-PART-%d-1' % number)
+                                                 for number in range(3)])
+    assert served() == expected() and served()['NEW-PART'] == 3
+
+
+@pytest.mark.parametrize('as_of', ['2020-01-01', '2025-05-20', '2030-01-01'])
+def test_aging_buckets_add_up_to_open(client, as_of):
+    client.post('/mock_testrail/defects', json=[DEFECT])
+    aging = client.get('/mock_testrail/analytics/defects?as_of=%s' % as_of).get_json()['aging']
+    assert aging['ALL']['open'] > 0
+    for counts in aging.values():
+        assert sum(counts['buckets'].values()) == counts['open']